@@ -22,6 +22,8 @@ from flask import Flask
 
 from colin_api import config, errorhandlers
 from colin_api.resources import API, API_BLUEPRINT, OPS_BLUEPRINT
+from colin_api.models.filing import Filing  # noqa: I001; the models must be imported after the resources (cyclic)
+from colin_api.resources.db import DB
 from colin_api.services import flags
 from colin_api.utils.auth import jwt
 from colin_api.utils.logging import setup_logging
@@ -37,10 +39,13 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):
     app.config.from_object(config.CONFIGURATION[run_mode])
 
     flags.init_app(app)
+    DB.init_app(app)
     errorhandlers.init_app(API)
     app.register_blueprint(API_BLUEPRINT)
     app.register_blueprint(OPS_BLUEPRINT)
     setup_jwt_manager(app, jwt)
+    # read the filing schemas once at startup rather than on every get filing request
+    Filing.load_component_plans()
 
     @app.after_request
     def add_version(response):  # pylint: disable=unused-variable
@@ -71,6 +71,20 @@ class _Config:  # pylint: disable=too-few-public-methods
     ORACLE_HOST = os.getenv('ORACLE_HOST', '')
     ORACLE_PORT = int(os.getenv('ORACLE_PORT', '1521'))
     ORACLE_BNI_DB_LINK = os.getenv('ORACLE_BNI_DB_LINK', '')
+    ORACLE_POOL_MIN = int(os.getenv('ORACLE_POOL_MIN', '1'))
+    ORACLE_POOL_MAX = int(os.getenv('ORACLE_POOL_MAX', '10'))
+    # milliseconds an acquire waits for a session when every pooled session is in use
+    ORACLE_POOL_WAIT_TIMEOUT = int(os.getenv('ORACLE_POOL_WAIT_TIMEOUT', '5000'))
+
+    # number of business snapshots kept per process, 0 disables the cache
+    SNAPSHOT_CACHE_SIZE = int(os.getenv('SNAPSHOT_CACHE_SIZE', '500'))
+
+    # pooled sessions a get filing request may read its components on concurrently, 1 reads them sequentially;
+    # the sessions are only taken while the pool has them free, so they never wait on ORACLE_POOL_WAIT_TIMEOUT
+    FILING_COMPONENT_WORKERS = int(os.getenv('FILING_COMPONENT_WORKERS', '4'))
+
+    # upper bound on the identifiers of one internal tax_ids request
+    TAX_IDS_MAX_IDENTIFIERS = int(os.getenv('TAX_IDS_MAX_IDENTIFIERS', '10000'))
 
     # JWT_OIDC Settings
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv('JWT_OIDC_WELL_KNOWN_CONFIG')
@@ -124,6 +138,9 @@ class TestConfig(_Config):  # pylint: disable=too-few-public-methods
     ORACLE_HOST = os.getenv('TEST_ORACLE_HOST', '')
     ORACLE_PORT = int(os.getenv('TEST_ORACLE_PORT', '1521'))
 
+    # tests patch the lookups per test, so snapshots must not leak between them
+    SNAPSHOT_CACHE_SIZE = 0
+
 
 class ProdConfig(_Config):  # pylint: disable=too-few-public-methods
     """Production environment configuration."""
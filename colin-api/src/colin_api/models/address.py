@@ -17,14 +17,14 @@ Currently this only provides API versioning information
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional
 
 import pycountry
 from flask import current_app
 
 from colin_api.exceptions import AddressNotFoundException
 from colin_api.resources.db import DB
-from colin_api.utils import stringify_list
+from colin_api.utils import chunk_list, stringify_list
 
 
 class Address:  # pylint: disable=too-many-instance-attributes; need all these fields
@@ -103,6 +103,15 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
 
         return address_obj
 
+    ADDRESS_QUERY = """
+        SELECT province, city, postal_cd, addr_line_1, addr_line_2, addr_line_3,
+          unit_type, unit_no, civic_no, civic_no_suffix, street_name, street_type,
+          street_direction, address_format_type, route_service_type, lock_box_no,
+          route_service_no, installation_type, installation_name, addr_id, ct.full_desc, delivery_instructions
+        FROM ADDRESS a
+          LEFT JOIN COUNTRY_TYPE ct on a.country_typ_cd = ct.country_typ_cd
+        """
+
     @classmethod
     def get_by_address_id(cls, cursor, address_id: str = None) -> Optional[Address]:
         """Return single address associated with given addr_id."""
@@ -112,15 +121,7 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
         try:
             if not cursor:
                 cursor = DB.connection.cursor()
-            cursor.execute("""
-                SELECT province, city, postal_cd, addr_line_1, addr_line_2, addr_line_3,
-                  unit_type, unit_no, civic_no, civic_no_suffix, street_name, street_type,
-                  street_direction, address_format_type, route_service_type, lock_box_no,
-                  route_service_no, installation_type, installation_name, addr_id, ct.full_desc, delivery_instructions
-                FROM ADDRESS a
-                  LEFT JOIN COUNTRY_TYPE ct on a.country_typ_cd = ct.country_typ_cd
-                WHERE addr_id=:address_id
-                """, address_id=address_id)
+            cursor.execute(cls.ADDRESS_QUERY + 'WHERE addr_id=:address_id', address_id=address_id)
 
             address = cursor.fetchone()
             address = dict(zip([x[0].lower() for x in cursor.description], address))
@@ -130,6 +131,34 @@ class Address:  # pylint: disable=too-many-instance-attributes; need all these f
             current_app.logger.error(err.with_traceback(None))
             raise AddressNotFoundException(address_id=address_id)  # pylint: disable=raise-missing-from
 
+    @classmethod
+    def get_by_address_ids(cls, cursor, address_ids: list) -> Dict[int, Address]:
+        """Return the addresses associated with the given addr_ids, keyed by addr_id.
+
+        Empty ids are ignored; the rest are read with one query per 1000 ids instead of one query per address.
+        """
+        address_ids = list(dict.fromkeys(address_id for address_id in address_ids if address_id))
+        addresses = {}
+        if not address_ids:
+            return addresses
+
+        if not cursor:
+            cursor = DB.connection.cursor()
+        for chunk in chunk_list(address_ids):
+            try:
+                cursor.execute(cls.ADDRESS_QUERY + f'WHERE addr_id in ({stringify_list(chunk)})')
+                description = cursor.description
+                for row in cursor.fetchall():
+                    address = dict(zip([x[0].lower() for x in description], row))
+                    addresses[address['addr_id']] = cls._build_address_obj(address)
+            except Exception as err:
+                current_app.logger.error(err.with_traceback(None))
+                raise AddressNotFoundException(address_id=chunk[0])  # pylint: disable=raise-missing-from
+
+        if missing := [address_id for address_id in address_ids if address_id not in addresses]:
+            raise AddressNotFoundException(address_id=missing[0])
+        return addresses
+
     @classmethod
     def create_new_address(cls, cursor, address_info: dict = None, corp_num: str = None):
         """Get new address id and insert address into address table."""
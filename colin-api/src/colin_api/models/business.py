@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from datedelta import datedelta
 from flask import current_app
@@ -27,7 +27,13 @@ from flask import current_app
 from colin_api.exceptions import BusinessNotFoundException
 from colin_api.models.corp_name import CorpName
 from colin_api.resources.db import DB
-from colin_api.utils import convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time, stringify_list
+from colin_api.utils import (
+    chunk_list,
+    convert_to_json_date,
+    convert_to_json_datetime,
+    convert_to_pacific_time,
+    stringify_list,
+)
 
 
 class Business:  # pylint: disable=too-many-instance-attributes, too-many-public-methods
@@ -211,30 +217,43 @@ class Business:  # pylint: disable=too-many-instance-attributes, too-many-public
     def _get_bn_15s(cls, cursor, identifiers: List) -> Dict:
         """Return a dict of idenifiers mapping to their bn_15 numbers."""
         bn_15s = {}
-        if not identifiers:
-            return bn_15s
+        for chunk in cls.iter_bn_15s(cursor, identifiers):
+            bn_15s.update(chunk)
+        return bn_15s
 
-        try:
-            cursor.execute(
-                f"""
-                SELECT corp_num, bn_15
-                FROM corporation
-                WHERE corp_num in ({stringify_list(identifiers)})
-                """
-            )
+    @classmethod
+    def iter_bn_15s(cls, cursor, identifiers: List) -> Iterator[Dict]:
+        """Yield the identifier to bn_15 mapping of the identifiers, one dict per 1000 identifiers.
 
-            for row in cursor.fetchall():
-                row = dict(zip([x[0].lower() for x in cursor.description], row))
-                if row['bn_15']:
-                    if row['corp_num'].isdecimal():  # valid only for BC
-                        bn_15s[f'BC{row["corp_num"]}'] = row['bn_15']
-                    else:
-                        bn_15s[row['corp_num']] = row['bn_15']
-            return bn_15s
+        Each chunk is one query with a bind variable per identifier, so it stays under Oracle's IN list limit and
+        reuses the same statement for every full chunk.
+        """
+        for chunk in chunk_list(list(dict.fromkeys(identifiers))):
+            bn_15s = {}
+            binds = {f'id{index}': identifier for index, identifier in enumerate(chunk)}
+            try:
+                cursor.execute(
+                    f"""
+                    SELECT corp_num, bn_15
+                    FROM corporation
+                    WHERE corp_num in ({', '.join(f':{name}' for name in binds)})
+                    """,
+                    **binds
+                )
 
-        except Exception as err:
-            current_app.logger.error(f'Error in Business: Failed to collect bn_9s for {identifiers}')
-            raise err
+                for row in cursor.fetchall():
+                    row = dict(zip([x[0].lower() for x in cursor.description], row))
+                    if row['bn_15']:
+                        if row['corp_num'].isdecimal():  # valid only for BC
+                            bn_15s[f'BC{row["corp_num"]}'] = row['bn_15']
+                        else:
+                            bn_15s[row['corp_num']] = row['bn_15']
+
+            except Exception as err:
+                current_app.logger.error(f'Error in Business: Failed to collect bn_15s for {chunk}')
+                raise err
+
+            yield bn_15s
 
     @classmethod
     def _get_last_ar_dates_for_reset(cls, cursor, event_info: List, event_ids: List) -> List:
@@ -14,8 +14,11 @@
 """Snapshot of a COLIN business, normalized to LEAR structure."""
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import pycountry
 from flask import current_app
@@ -28,22 +31,100 @@ from colin_api.models.shares import ShareObject
 from colin_api.resources.db import DB
 
 
+class _SnapshotCache:
+    """Process wide LRU of built snapshots, keyed by (identifier, latest event id, date)."""
+
+    def __init__(self):
+        """Start empty."""
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Return the cached snapshot for the key, if any."""
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                self._entries.move_to_end(key)
+            return snapshot
+
+    def put(self, key: Tuple, snapshot: Dict, max_size: int):
+        """Cache the snapshot, evicting the least recently used ones beyond max_size."""
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached snapshot."""
+        with self._lock:
+            self._entries.clear()
+
+
 class BusinessSnapshot:  # pylint: disable=too-few-public-methods
     """Builds the LEAR-structured snapshot dict for a COLIN business."""
 
     # snapshot offices are limited to the two the amalgamation flow prepopulates
     OFFICE_TYPES = ('registeredOffice', 'recordsOffice')
 
+    cache = _SnapshotCache()
+
     @classmethod
     def get_snapshot(cls, orig_identifier: str) -> Dict:
         """Return the business/parties/offices/shareClasses/resolutions snapshot."""
-        identifier = orig_identifier
-        if identifier.startswith('BC'):
-            identifier = identifier[2:]
+        con = DB.connection
+        return cls._build_snapshot(orig_identifier, con, con.cursor())
+
+    @classmethod
+    def get_current_snapshot(cls, orig_identifier: str, if_none_match=None) -> Tuple[str, Optional[Dict]]:
+        """Return the etag and snapshot of the business, reusing the cached snapshot while it is still current.
 
+        COLIN only changes a corp by writing an event for it, so a snapshot stays valid until the corp gets a
+        new latest event. The date is part of the key too: good standing and the future effective check are
+        relative to today. The snapshot is None when the etag is in if_none_match (the caller's copy is current).
+        """
         con = DB.connection
-        business = Business.find_by_identifier(identifier, con=con)
         cursor = con.cursor()
+        key = (
+            orig_identifier,
+            cls._get_latest_event_id(cursor, cls._corp_num(orig_identifier)),
+            datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        )
+        etag = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        if if_none_match and etag in if_none_match:
+            return etag, None
+
+        max_size = current_app.config.get('SNAPSHOT_CACHE_SIZE', 0)
+        snapshot = cls.cache.get(key) if max_size else None
+        if snapshot is None:
+            snapshot = cls._build_snapshot(orig_identifier, con, cursor)
+            if max_size:
+                cls.cache.put(key, snapshot, max_size)
+        return etag, snapshot
+
+    @staticmethod
+    def _corp_num(orig_identifier: str) -> str:
+        """Return the identifier without the BC prefix, as it is stored in COLIN."""
+        return orig_identifier[2:] if orig_identifier.startswith('BC') else orig_identifier
+
+    @staticmethod
+    def _get_latest_event_id(cursor, corp_num: str) -> Optional[int]:
+        """Return the id of the latest event written for the corp."""
+        cursor.execute(
+            """
+            select max(event_id)
+            from event
+            where corp_num=:corp_num
+            """,
+            corp_num=corp_num
+        )
+        return cursor.fetchone()[0]
+
+    @classmethod
+    def _build_snapshot(cls, orig_identifier: str, con, cursor) -> Dict:
+        """Return the snapshot, read with the given connection."""
+        identifier = cls._corp_num(orig_identifier)
+        business = Business.find_by_identifier(identifier, con=con)
 
         try:
             parties = Party.get_current(cursor, identifier)
@@ -54,8 +135,7 @@ class BusinessSnapshot:  # pylint: disable=too-few-public-methods
         offices = Office.convert_obj_list(Office.get_current(cursor, identifier)) or {}
 
         # mirror the /sharestructure resource: current structure is the one with no end event
-        share_structs = ShareObject.get_all(cursor, identifier) or []
-        share_struct = next((x for x in share_structs if not x.end_event_id), None)
+        share_struct = ShareObject.get_current(cursor, identifier)
         share_classes = share_struct.to_dict()['shareClasses'] if share_struct else []
 
         resolutions = Business.get_resolutions(cursor, identifier)
@@ -26,7 +26,7 @@ from flask import current_app
 from colin_api.exceptions import PartiesNotFoundException
 from colin_api.models import Address, Business  # pylint: disable=cyclic-import
 from colin_api.resources.db import DB
-from colin_api.utils import convert_to_json_date, delete_from_table_by_event_ids, stringify_list
+from colin_api.utils import chunk_list, convert_to_json_date, delete_from_table_by_event_ids, stringify_list
 
 
 class Party:  # pylint: disable=too-many-instance-attributes; need all these fields
@@ -84,18 +84,35 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
 
     def get_start_event_date(self, cursor):
         """Get the start event date of the party."""
-        query = """
-                SELECT event_typ_cd, event_timestmp, effective_dt
+        return self.get_start_event_dates(cursor, [self.start_event_id]).get(self.start_event_id)
+
+    @classmethod
+    def get_start_event_dates(cls, cursor, event_ids: list) -> Dict:
+        """Return the effective (or event) date of each given event, keyed by event id.
+
+        Events of a conversion have no meaningful start date and map to None.
+        """
+        event_ids = list(dict.fromkeys(event_id for event_id in event_ids if event_id))
+        start_dates = {}
+        for chunk in chunk_list(event_ids):
+            cursor.execute(f"""
+                SELECT e.event_id, event_typ_cd, event_timestmp, effective_dt
                 FROM event e
                   LEFT JOIN filing f on f.event_id = e.event_id
-                WHERE e.event_id=:event_id
-                """
-        dates = cursor.execute(query, event_id=self.start_event_id).fetchone()
-        description = cursor.description
-        dates = dict(zip([x[0].lower() for x in description], dates))
-        if dates['event_typ_cd'] in ['CONVICORP', 'CONVAMAL', 'CONVCIN']:
-            return None
-        return convert_to_json_date(dates['effective_dt'] or dates['event_timestmp'])
+                WHERE e.event_id in ({stringify_list(chunk)})
+                """)
+            description = cursor.description
+            for row in cursor.fetchall():
+                dates = dict(zip([x[0].lower() for x in description], row))
+                if dates['event_id'] in start_dates:
+                    # more than one filing for the event: keep the first, as the single event lookup did
+                    continue
+                if dates['event_typ_cd'] in ['CONVICORP', 'CONVAMAL', 'CONVCIN']:
+                    start_dates[dates['event_id']] = None
+                else:
+                    start_dates[dates['event_id']] = convert_to_json_date(
+                        dates['effective_dt'] or dates['event_timestmp'])
+        return start_dates
 
     @classmethod
     def _parse_officer(cls, row):
@@ -112,27 +129,41 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         return officer_obj
 
     @classmethod
-    def _get_offices_held(cls, cursor, corp_party_id: str) -> List[Dict]:
-        """Get the offices held by the party."""
-        query = """
-                SELECT officer_typ_cd
+    def _get_offices_held(cls, cursor, corp_party_ids: list) -> Dict[str, List[str]]:
+        """Get the offices held by each of the parties, keyed by corp_party_id."""
+        offices_held = {}
+        for chunk in chunk_list(list(dict.fromkeys(corp_party_ids))):
+            cursor.execute(f"""
+                SELECT corp_party_id, officer_typ_cd
                 FROM offices_held
-                WHERE corp_party_id=:corp_party_id
-                """
-        cursor.execute(query, corp_party_id=corp_party_id)
-        offices = cursor.fetchall()
+                WHERE corp_party_id in ({stringify_list(chunk)})
+                """)
+            for corp_party_id, officer_typ_cd in cursor.fetchall():
+                offices_held.setdefault(corp_party_id, []).append(officer_typ_cd)
+
+        return offices_held
+
+    @classmethod
+    def _parse_parties(cls, cursor, rows: List[dict]) -> List[Party]:
+        """Parse the party rows, loading their addresses and offices held in bulk."""
+        addresses = Address.get_by_address_ids(
+            cursor,
+            [row[key] for row in rows for key in ('delivery_addr_id', 'mailing_addr_id')]
+        )
+        officer_ids = [row['corp_party_id'] for row in rows if row.get('party_typ_cd') == cls.role_types['Officer']]
+        offices_held = cls._get_offices_held(cursor, officer_ids) if officer_ids else {}
 
-        return [row[0] for row in offices]
+        return [cls._parse_party(row, addresses, offices_held) for row in rows]
 
     @classmethod
-    def _parse_party(cls, cursor, row: dict) -> Party:
-        """Parse the party row."""
+    def _parse_party(cls, row: dict, addresses: Dict[int, Address], offices_held: Dict[str, List[str]]) -> Party:
+        """Parse the party row given the addresses and offices held already loaded for the result set."""
         party = Party()
         party.title = ''
         party.officer = Party._parse_officer(row)
         if row['delivery_addr_id']:
-            party.delivery_address = Address.get_by_address_id(cursor, row['delivery_addr_id']).as_dict()
-        party.mailing_address = Address.get_by_address_id(cursor, row['mailing_addr_id']).as_dict() \
+            party.delivery_address = addresses[row['delivery_addr_id']].as_dict()
+        party.mailing_address = addresses[row['mailing_addr_id']].as_dict() \
             if row['mailing_addr_id'] else party.delivery_address
         party.appointment_date =\
             convert_to_json_date(row.get('appointment_dt', None))
@@ -146,7 +177,7 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
         party.corp_num = row.get('corp_num', None)
 
         if party.role_type == cls.role_types['Officer']:
-            party.offices_held = cls._get_offices_held(cursor, party.corp_party_id)
+            party.offices_held = offices_held.get(party.corp_party_id, [])
         return party
 
     @classmethod
@@ -159,13 +190,14 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
 
         completing_parties = {}
         party_list = []
+        founding_date = None
         description = cursor.description
-        for row in parties:
-            row = dict(zip([x[0].lower() for x in description], row))
-            party = Party._parse_party(cursor, row)
-
+        rows = [dict(zip([x[0].lower() for x in description], row)) for row in parties]
+        for party in Party._parse_parties(cursor, rows):
             if not party.appointment_date:
-                party.appointment_date = Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+                # the founding date is the same for every party so only look it up once
+                founding_date = founding_date or Business.get_founding_date(cursor=cursor, corp_num=corp_num)
+                party.appointment_date = founding_date
 
             if party.role_type == cls.role_types['Director'] and not party.delivery_address:
                 current_app.logger.error('Bad director data for party id: %s, corp num: %s',
@@ -240,13 +272,16 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
             if not parties:
                 raise PartiesNotFoundException(identifier=corp_num)
 
+            party_rows = [dict(zip([x[0].lower() for x in description], party_row)) for party_row in parties]
+            # only the parties without an appointment date fall back to their start event date
+            start_dates = cls.get_start_event_dates(
+                cursor, [row['start_event_id'] for row in party_rows if not row['appointment_dt']])
+
             party_id_map: Dict[str, Party] = {}
             child_party_ids: List[str] = []
             # NB: list is already ordered by start_event_id so we can assume the
             #     1st record is the oldest child and the last one is the newest parent
-            for party_row in parties:
-                party_row = dict(zip([x[0].lower() for x in description], party_row))
-                party = Party._parse_party(cursor, party_row)
+            for party in Party._parse_parties(cursor, party_rows):
                 party_id_map[party.corp_party_id] = party
                 if party.prev_party_id:
                     # only need previous party information for appointment date when applicable
@@ -254,13 +289,13 @@ class Party:  # pylint: disable=too-many-instance-attributes; need all these fie
                         # set the appointment date from previous party record
                         child_party = party_id_map[party.prev_party_id]
                         party.appointment_date = child_party.appointment_date or \
-                            child_party.get_start_event_date(cursor) or 'unknown'
+                            start_dates.get(child_party.start_event_id) or 'unknown'
                     # mark the prev_party_id as a child so its not returned
                     # (not removed in case another party record references it)
                     child_party_ids.append(party.prev_party_id)
                 if not party.appointment_date:
                     # wasn't set by a previous record so set it by its event or filing date
-                    party.appointment_date = party.get_start_event_date(cursor)
+                    party.appointment_date = start_dates.get(party.start_event_id)
 
             # only return the top level parent records
             for party_id in party_id_map:  # pylint: disable=consider-using-dict-items
@@ -18,10 +18,12 @@ Currently this only provides API versioning information
 from __future__ import annotations
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from http import HTTPStatus
 from typing import Dict, List, Optional
 
+import cx_Oracle
 from flask import current_app
 from registry_schemas.utils import get_schema
 
@@ -49,6 +51,9 @@ from colin_api.resources.db import DB
 from colin_api.utils import convert_to_json_date, convert_to_json_datetime, convert_to_pacific_time, convert_to_snake
 
 
+# returned by a component load that could not get a pooled session, so it is read on the request's cursor instead
+_POOL_EXHAUSTED = object()
+
 # Code smells:
 # Cognitive Complexity acceptable for deep method on filing types
 class Filing:  # pylint: disable=too-many-instance-attributes;
@@ -977,11 +982,116 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
             first_nme=first_name[:20] if first_name else None
         )
 
+    _component_plans: Dict[str, frozenset] = {}
+
+    @classmethod
+    def get_component_plan(cls, filing_type: str) -> frozenset:
+        """Return the components of the filing type's schema, read from the schema once per process."""
+        if (plan := cls._component_plans.get(filing_type)) is None:
+            # TODO: simplify after consolidating schema
+            schema = get_schema(f'{convert_to_snake(filing_type)}.json')
+            components = schema.get('properties').keys()
+
+            if filing_type in components:
+                if filing_type == 'changeOfAddress':
+                    components = ['legalType', 'offices']
+                else:
+                    components = schema['properties'][filing_type].get('properties').keys()
+            plan = cls._component_plans[filing_type] = frozenset(components)
+        return plan
+
+    @classmethod
+    def load_component_plans(cls):
+        """Build the component plan of every filing type up front so that requests never read a schema."""
+        for filing_type in cls.FILING_TYPES:
+            try:
+                cls.get_component_plan(filing_type)
+            except Exception:  # pylint: disable=broad-except; a type without a usable schema fails on request
+                continue
+
+    @classmethod
+    def _get_parties_role_type(cls, filing: Filing, filing_event_info: Dict) -> Optional[str]:
+        """Return the role of the parties component of the filing (None for all roles)."""
+        if Filing.is_filing_type_match(filing, 'dissolution', 'voluntary'):
+            return 'Custodian'
+        if filing_event_info['filing_type_code'] == 'CO_DI':
+            return 'Director'
+        return None
+
+    @classmethod
+    def _load_event_components(cls, cursor, filing: Filing, filing_event_info: Dict, components: frozenset,
+                               concurrent: bool) -> Dict:
+        # pylint: disable=too-many-arguments
+        """Read the components of the filing that only depend on its event.
+
+        The reads are independent of each other, so when concurrent they are issued together, each on its own
+        pooled session. The extra sessions are only taken while the pool has them free, a read that finds the pool
+        busy runs on the request's cursor instead of waiting for a session. Callers holding uncommitted work on
+        their own connection must read sequentially.
+        """
+        corp_num = filing.business.corp_num
+        event_id = filing_event_info['event_id']
+        is_annual_report = filing.filing_type == 'annualReport'
+        loads = {}
+        # annual reports read their offices and directors from the component event instead
+        if ('offices' in components and not is_annual_report) or 'custodialOffice' in components:
+            loads['offices'] = (Office.get_by_event, {'event_id': event_id})
+        if 'directors' in components and not is_annual_report:
+            loads['directors'] = (Party.get_by_event, {'corp_num': corp_num, 'event_id': event_id})
+        if 'parties' in components:
+            loads['parties'] = (Party.get_by_event, {
+                'corp_num': corp_num,
+                'event_id': event_id,
+                'role_type': cls._get_parties_role_type(filing, filing_event_info)
+            })
+        if 'shareStructure' in components:
+            loads['shareStructure'] = (ShareObject.get_all, {'corp_num': corp_num, 'event_id': event_id})
+            loads['resolutionDates'] = (Business.get_resolutions, {'corp_num': corp_num, 'event_id': event_id})
+        if 'nameTranslations' in components:
+            loads['nameTranslations'] = (CorpName.get_by_event,
+                                         {'corp_num': corp_num, 'event_id': event_id, 'type_code': 'TR'})
+        if 'nameRequest' in components or 'legalName' in components:
+            loads['names'] = (CorpName.get_by_event, {'corp_num': corp_num, 'event_id': event_id})
+        if 'provisionsRemoved' in components or 'hasProvisions' in components:
+            loads['provisions'] = (Business.get_corp_restriction, {'corp_num': corp_num, 'event_id': event_id})
+
+        workers = min(current_app.config.get('FILING_COMPONENT_WORKERS', 1), len(loads))
+        if not concurrent or workers < 2:
+            return {name: load(cursor=cursor, **kwargs) for name, (load, kwargs) in loads.items()}
+
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+
+        def _load(load, kwargs):
+            with app.app_context():
+                try:
+                    session = DB.try_acquire()
+                except cx_Oracle.Error:  # pylint:disable=c-extension-no-member
+                    session = None
+                if session is None:
+                    return _POOL_EXHAUSTED
+                try:
+                    return load(cursor=session.cursor(), **kwargs)
+                finally:
+                    DB.release(session)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(_load, load, kwargs) for name, (load, kwargs) in loads.items()}
+
+        results = {}
+        for name, future in futures.items():
+            if (result := future.result()) is _POOL_EXHAUSTED:
+                load, kwargs = loads[name]
+                result = load(cursor=cursor, **kwargs)
+            results[name] = result
+        return results
+
     # pylint: disable=too-many-branches, too-many-locals, too-many-statements, too-many-nested-blocks;
     @classmethod
     def get_filing(cls, filing: Filing, con=None, year: int = None) -> Dict:
         """Get a Filing."""
         try:
+            # without a caller connection there is no uncommitted work the component reads need to see
+            concurrent = not con
             if not con:
                 con = DB.connection
                 # con.begin()
@@ -1001,20 +1111,13 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                 'eventId': filing_event_info['event_id']
             }
 
-            # TODO: simplify after consolidating schema
             schema_name = convert_to_snake(filing.filing_type)
-            schema = get_schema(f'{schema_name}.json')
-            # schema = get_schema(f'{schema_name.replace("_application", "")}.json')
-            components = schema.get('properties').keys()
-
-            if filing.filing_type in components:
-                if filing.filing_type == 'changeOfAddress':
-                    components = ['legalType', 'offices']
-                else:
-                    components = schema['properties'][filing.filing_type].get('properties').keys()
+            components = cls.get_component_plan(filing.filing_type)
 
             if filing_event_info['filing_type_code'] == 'CO_DI':
-                components = ['parties']
+                components = frozenset(['parties'])
+
+            loaded = cls._load_event_components(cursor, filing, filing_event_info, components, concurrent)
 
             if 'annualReportDate' in components:
                 filing.body['annualReportDate'] = convert_to_json_date(filing_event_info['period_end_dt'])
@@ -1029,12 +1132,13 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                     filing.body['parties'] = [x.as_dict() for x in parties]
 
             if 'offices' in components:
-                event_id = filing_event_info['event_id']
                 # special rules for ARs with offices included
                 if filing.filing_type == 'annualReport':
                     event_id = cls._get_ar_component_event(
                         cursor=cursor, corp_num=corp_num, type_code='OTADD', ar_filing_event_info=filing_event_info)
-                office_obj_list = Office.get_by_event(cursor=cursor, event_id=event_id)
+                    office_obj_list = Office.get_by_event(cursor=cursor, event_id=event_id)
+                else:
+                    office_obj_list = loaded['offices']
                 if not office_obj_list:
                     if filing.filing_type != 'annualReport':
                         raise OfficeNotFoundException(identifier=corp_num)
@@ -1044,19 +1148,18 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                 filing.body['offices'] = Office.convert_obj_list(office_obj_list)
 
             if 'custodialOffice' in components:
-                event_id = filing_event_info['event_id']
-                office_obj_list = Office.get_by_event(cursor, event_id)
-                converted_offices_list = Office.convert_obj_list(office_obj_list)
+                converted_offices_list = Office.convert_obj_list(loaded['offices'])
                 filing.body['custodialOffice'] = converted_offices_list.get('custodialOffice')
                 filing.paper_only = True
 
             if 'directors' in components:
-                event_id = filing_event_info['event_id']
                 # special rules for coop ARs with directors included
                 if filing.filing_type == 'annualReport':
                     event_id = cls._get_ar_component_event(
                         cursor=cursor, corp_num=corp_num, type_code='OTCDR', ar_filing_event_info=filing_event_info)
-                directors = Party.get_by_event(cursor=cursor, corp_num=corp_num, event_id=event_id)
+                    directors = Party.get_by_event(cursor=cursor, corp_num=corp_num, event_id=event_id)
+                else:
+                    directors = loaded['directors']
                 if not directors:
                     if filing.filing_type != 'annualReport':
                         raise PartiesNotFoundException(identifier=corp_num)
@@ -1066,40 +1169,25 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                 filing.body['directors'] = [x.as_dict() for x in directors]
 
             if 'parties' in components:
-                parties = []
-                if Filing.is_filing_type_match(filing, 'dissolution', 'voluntary'):
-                    parties = Party.get_by_event(
-                        cursor=cursor, corp_num=corp_num, event_id=filing_event_info['event_id'], role_type='Custodian')
-                elif filing_event_info['filing_type_code'] == 'CO_DI':
-                    parties = Party.get_by_event(
-                        cursor=cursor, corp_num=corp_num, event_id=filing_event_info['event_id'], role_type='Director')
-
+                parties = loaded['parties']
+                if filing_event_info['filing_type_code'] == 'CO_DI' and \
+                        not Filing.is_filing_type_match(filing, 'dissolution', 'voluntary'):
                     filing.body['comment'] = cls._get_notation(cursor=cursor,
                                                                corp_num=corp_num,
                                                                filing_event_info=filing_event_info)
-                else:
-                    parties = Party.get_by_event(
-                        cursor=cursor, corp_num=corp_num, event_id=filing_event_info['event_id'], role_type=None)
                 if not parties:
                     raise PartiesNotFoundException(identifier=corp_num)
                 filing.body['parties'] = [x.as_dict() for x in parties]
 
             if 'shareStructure' in components:
-                share_structure = ShareObject.get_all(cursor, corp_num, filing_event_info['event_id'])
-                if share_structure:
+                if share_structure := loaded['shareStructure']:
                     filing.body['shareStructure'] = share_structure.to_dict()
 
-                if resolution_dates := Business.get_resolutions(
-                        cursor=cursor, corp_num=corp_num, event_id=filing_event_info['event_id']):
+                if resolution_dates := loaded['resolutionDates']:
                     filing.body['shareStructure']['resolutionDates'] = resolution_dates
 
             if 'nameTranslations' in components:
-                translations = CorpName.get_by_event(
-                    cursor=cursor,
-                    corp_num=corp_num,
-                    event_id=filing_event_info['event_id'],
-                    type_code='TR'
-                )
+                translations = loaded['nameTranslations']
                 filing.body['nameTranslations'] = []
                 for translation in translations:
                     if translation.event_id == filing_event_info['event_id']:
@@ -1110,8 +1198,7 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                     del filing.body['nameTranslations']
 
             if 'nameRequest' in components or 'legalName' in components:
-                names = CorpName.get_by_event(corp_num=corp_num, event_id=filing_event_info['event_id'], cursor=cursor)
-                for name in names:
+                for name in loaded['names']:
                     if name.event_id == filing_event_info['event_id']:
                         if 'nameRequest' in components:
                             filing.body['nameRequest'] = {
@@ -1164,19 +1251,14 @@ class Filing:  # pylint: disable=too-many-instance-attributes;
                     filing.body['business']['identifier'] = filing.business.corp_num
 
             if 'provisionsRemoved' in components:
-                provisions = Business.get_corp_restriction(
-                    cursor=cursor, event_id=filing_event_info['event_id'], corp_num=corp_num)
+                provisions = loaded['provisions']
                 if provisions and provisions['end_event_id'] == filing_event_info['event_id']:
                     filing.body['provisionsRemoved'] = provisions['restriction_ind'] == 'Y'
                 else:
                     filing.body['provisionsRemoved'] = False
 
             if 'hasProvisions' in components:
-                provisions = Business.get_corp_restriction(
-                    cursor=cursor,
-                    event_id=filing_event_info['event_id'],
-                    corp_num=corp_num
-                )
+                provisions = loaded['provisions']
                 if provisions and provisions['restriction_ind'] == 'Y':
                     filing.body['hasProvisions'] = True
                 else:
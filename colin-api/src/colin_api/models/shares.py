@@ -22,7 +22,7 @@ from typing import List, Optional
 from flask import current_app
 
 from colin_api.resources.db import DB
-from colin_api.utils import delete_from_table_by_event_ids, get_max_value
+from colin_api.utils import chunk_list, delete_from_table_by_event_ids, get_max_value, stringify_list
 
 
 class Share:  # pylint: disable=too-many-instance-attributes;
@@ -129,8 +129,6 @@ class ShareObject:  # pylint: disable=too-many-instance-attributes;
                    par_value_ind, par_value_amt, class_nme, other_currency from share_struct_cls
                    where start_event_id=:event_id and corp_num=:corp_num"""
 
-        share_classes = []
-
         try:
             cursor.execute(query,
                            corp_num=corp_num, event_id=event_id)
@@ -138,20 +136,9 @@ class ShareObject:  # pylint: disable=too-many-instance-attributes;
 
             description = cursor.description
 
-            for row in class_arr:
-                row = dict(zip([x[0].lower() for x in description], row))
-                share_class = ShareClass()
-                share_class.currency_type = row['currency_typ_cd']
-                share_class.other_currency = row['other_currency']
-                share_class.has_max_shares = row['max_share_ind']
-                share_class.has_special_rights = row['spec_rights_ind']
-                share_class.has_par_value = row['par_value_ind']
-                share_class.share_id = row['share_class_id']
-                share_class.share_name = row['class_nme']
-                share_class.par_value_amt = row['par_value_amt']
-                share_class.max_number_shares = row['share_quantity']
-                share_class.series = cls._get_share_series(cursor, share_class, corp_num)
-                share_classes.append(share_class)
+            share_classes = [cls._parse_share_class(dict(zip([x[0].lower() for x in description], row)))
+                             for row in class_arr]
+            cls._load_share_series(cursor, share_classes, corp_num)
 
         except Exception as err:
             current_app.logger.error(f'Error in Share Structure: Failed to retrieve Share Classes for {corp_num}')
@@ -160,38 +147,92 @@ class ShareObject:  # pylint: disable=too-many-instance-attributes;
         return share_classes
 
     @classmethod
-    def _get_share_series(cls, cursor, share_class, identifier):
-        """Retrieve Share Series for Corp."""
-        query = """select series_id, max_share_ind, share_quantity, spec_right_ind,
-                    series_nme from share_series where share_class_id=:class_id and
-                    corp_num=:identifier"""
+    def _parse_share_class(cls, row: dict) -> ShareClass:
+        """Return the share class (without its series) for the share_struct_cls row."""
+        share_class = ShareClass()
+        share_class.currency_type = row['currency_typ_cd']
+        share_class.other_currency = row['other_currency']
+        share_class.has_max_shares = row['max_share_ind']
+        share_class.has_special_rights = row['spec_rights_ind']
+        share_class.has_par_value = row['par_value_ind']
+        share_class.share_id = row['share_class_id']
+        share_class.share_name = row['class_nme']
+        share_class.par_value_amt = row['par_value_amt']
+        share_class.max_number_shares = row['share_quantity']
+        share_class.series = []
+        return share_class
 
-        share_series = []
+    @classmethod
+    def _load_share_series(cls, cursor, share_classes: List[ShareClass], identifier: str):
+        """Set the series of all the given share classes, read with one query per 1000 classes."""
+        class_map = {share_class.share_id: share_class for share_class in share_classes}
         try:
-            cursor.execute(query,
-                           class_id=share_class.share_id,
-                           identifier=identifier
-                           )
+            for chunk in chunk_list(list(class_map)):
+                query = f"""select share_class_id, series_id, max_share_ind, share_quantity, spec_right_ind,
+                            series_nme from share_series where share_class_id in ({stringify_list(chunk)}) and
+                            corp_num=:identifier order by share_class_id, series_id"""
+                cursor.execute(query, identifier=identifier)
+
+                series_arr = cursor.fetchall()
+
+                description = cursor.description
+
+                for row in series_arr:
+                    row = dict(zip([x[0].lower() for x in description], row))
+                    series = Share()
+                    series.has_max_shares = row['max_share_ind']
+                    series.has_special_rights = row['spec_right_ind']
+                    series.max_number_shares = row['share_quantity']
+                    series.share_id = row['series_id']
+                    series.share_name = row['series_nme']
+                    class_map[row['share_class_id']].series.append(series)
 
-            series_arr = cursor.fetchall()
+        except Exception as err:
+            current_app.logger.error(f'Error in Share Structure: Failed to retrieve Share Series for {identifier}')
+            raise err
 
+    @classmethod
+    def get_current(cls, cursor, corp_num: str) -> Optional[ShareObject]:
+        """Return the current share structure for this business.
+
+        Unlike get_all the structure and its classes are read in one query, and the series of every class in
+        one more, so the cost does not grow with the number of classes.
+        """
+        query = """select ss.start_event_id, ss.end_event_id, c.share_class_id, c.currency_typ_cd, c.max_share_ind,
+                   c.share_quantity, c.spec_rights_ind, c.par_value_ind, c.par_value_amt, c.class_nme,
+                   c.other_currency
+                   from share_struct ss
+                     left join share_struct_cls c on c.corp_num = ss.corp_num and c.start_event_id = ss.start_event_id
+                   where ss.corp_num=:corp_num and ss.end_event_id is null
+                   order by ss.start_event_id, c.share_class_id"""
+        try:
+            if not cursor:
+                cursor = DB.connection.cursor()
+            cursor.execute(query, corp_num=corp_num)
             description = cursor.description
+            rows = [dict(zip([x[0].lower() for x in description], row)) for row in cursor.fetchall()]
+            if not rows:
+                return None
 
-            for row in series_arr:
-                row = dict(zip([x[0].lower() for x in description], row))
-                series = Share()
-                series.has_max_shares = row['max_share_ind']
-                series.has_special_rights = row['spec_right_ind']
-                series.max_number_shares = row['share_quantity']
-                series.share_id = row['series_id']
-                series.share_name = row['series_nme']
-                share_series.append(series)
+            start_event_ids = {row['start_event_id'] for row in rows}
+            if len(start_event_ids) > 1:
+                current_app.logger.error(
+                    f'More than 1 active share structure for {corp_num}. This will cause unknown consequences.')
 
-        except Exception as err:
-            current_app.logger.error(f'Error in Share Structure: Failed to retrieve Share Series for {identifier}')
+            share_structure = ShareObject()
+            share_structure.start_event_id = rows[0]['start_event_id']
+            share_structure.end_event_id = rows[0]['end_event_id']
+            share_structure.share_classes = [
+                cls._parse_share_class(row) for row in rows
+                if row['start_event_id'] == share_structure.start_event_id and row['share_class_id'] is not None
+            ]
+            cls._load_share_series(cursor, share_structure.share_classes, corp_num)
+
+        except Exception as err:  # pylint: disable=broad-except; want to catch all errors
+            current_app.logger.error(f'error getting share structure for {corp_num}')
             raise err
 
-        return share_series
+        return share_structure
 
     @classmethod
     def get_all(cls, cursor, corp_num: str, event_id: str = None) -> Optional[List, ShareObject]:
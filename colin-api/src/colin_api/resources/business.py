@@ -100,10 +100,17 @@ class BusinessSnapshotInfo(Resource):
     @cors.crossdomain(origin='*')
     @jwt.requires_roles([COLIN_SVC_ROLE])
     def get(identifier: str):
-        """Return the business/parties/offices/shareClasses/resolutions snapshot."""
+        """Return the business/parties/offices/shareClasses/resolutions snapshot.
+
+        Supports conditional requests: a matching If-None-Match gets a 304 without the snapshot being read.
+        """
         try:
-            snapshot = BusinessSnapshot.get_snapshot(identifier)
-            return jsonify(snapshot), HTTPStatus.OK
+            etag, snapshot = BusinessSnapshot.get_current_snapshot(identifier, request.if_none_match)
+            response = jsonify(snapshot) if snapshot is not None else \
+                current_app.response_class(status=HTTPStatus.NOT_MODIFIED)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
 
         except GenericException as err:  # pylint: disable=duplicate-code
             return jsonify({'message': err.error}), err.status_code
@@ -225,9 +232,16 @@ class InternalBusinessInfo(Resource):
                 json_data = request.get_json()
                 if not json_data or not json_data['identifiers']:
                     return jsonify({'message': 'No input data provided'}), HTTPStatus.BAD_REQUEST
+                max_identifiers = current_app.config['TAX_IDS_MAX_IDENTIFIERS']
+                if len(json_data['identifiers']) > max_identifiers:
+                    return jsonify(
+                        {'message': f'No more than {max_identifiers} identifiers per request.'}
+                    ), HTTPStatus.BAD_REQUEST
                 # remove the BC prefix
                 identifiers = [x[2:] if x.startswith('BC') else x
                                for x in json_data['identifiers']]
+                # every chunk is read before responding (at most TAX_IDS_MAX_IDENTIFIERS entries), so a lookup
+                # failing on a later chunk returns an error status instead of a truncated body
                 bn_15s = Business._get_bn_15s(  # pylint: disable = protected-access; internal call
                     cursor=cursor,
                     identifiers=identifiers
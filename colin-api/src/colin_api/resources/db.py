@@ -14,11 +14,35 @@
 """Create Oracle database connection.
 
 These will get initialized by the application.
+
+The session pool is created once per process (and per app) on first use, rather than per app context.
+OracleDB.connection acquires one session per app context, returns that same session on every later access and
+releases it back to the pool on teardown. When the pool is exhausted an acquire waits up to
+ORACLE_POOL_WAIT_TIMEOUT milliseconds for a session to be released before failing. OracleDB.try_acquire is for
+optional extra sessions, it returns None rather than wait and leaves a session free for the next app context.
 """
+import os
+import threading
+import time
+from contextlib import contextmanager
+
 import cx_Oracle
 from flask import _app_ctx_stack, current_app
 
 
+class _PoolState:  # pylint: disable=too-few-public-methods
+    """The session pool of one app in this process, with its acquire statistics."""
+
+    def __init__(self):
+        """Initialize the state without a pool; the pool is created on first use."""
+        self.pool = None
+        self.pid = None
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
 class OracleDB:
     """Oracle database connection object for re-use in application."""
 
@@ -34,14 +58,15 @@ class OracleDB:
         :return: naked
         """
         self.app = app
+        app.extensions['oracle_db'] = _PoolState()
         app.teardown_appcontext(self.teardown)
 
-    @staticmethod
-    def teardown():
-        """Oracle session pool cleans up after itself."""
+    def teardown(self, exception=None):  # pylint: disable=unused-argument
+        """Release the session acquired during the app context back to the pool."""
         ctx = _app_ctx_stack.top
-        if hasattr(ctx, 'oracle_pool'):
-            ctx.oracle_pool.close()
+        if (session := getattr(ctx, '_oracle_session', None)) is not None:
+            self.release(session)
+            ctx._oracle_session = None  # pylint: disable = protected-access; need this method
 
     @staticmethod
     def _create_pool():
@@ -65,32 +90,110 @@ class OracleDB:
                 current_app.config.get('ORACLE_HOST'),
                 current_app.config.get('ORACLE_PORT'),
                 current_app.config.get('ORACLE_DB_NAME')),
-            min=1,
-            max=10,
+            min=current_app.config.get('ORACLE_POOL_MIN'),
+            max=current_app.config.get('ORACLE_POOL_MAX'),
             increment=1,
             connectiontype=cx_Oracle.Connection,  # pylint:disable=c-extension-no-member
             threaded=True,
-            getmode=cx_Oracle.SPOOL_ATTRVAL_NOWAIT,  # pylint:disable=c-extension-no-member
-            waitTimeout=1500,
+            getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,  # pylint:disable=c-extension-no-member
+            waitTimeout=current_app.config.get('ORACLE_POOL_WAIT_TIMEOUT'),
             timeout=3600,
             sessionCallback=init_session,
             encoding='UTF-8',
             nencoding='UTF-8')
 
+    @staticmethod
+    def _state() -> _PoolState:
+        return current_app.extensions['oracle_db']
+
+    @property
+    def pool(self):
+        """Return the session pool for this process, creating it on first use.
+
+        The pid check makes sure a worker forked after the pool was created builds its own.
+        """
+        state = self._state()
+        pid = os.getpid()
+        if state.pool is None or state.pid != pid:
+            with state.lock:
+                if state.pool is None or state.pid != pid:
+                    state.pool = self._create_pool()
+                    state.pid = pid
+        return state.pool
+
+    def acquire(self):
+        """Acquire a session from the pool, recording how long the caller waited for it."""
+        pool = self.pool
+        start = time.perf_counter()
+        session = pool.acquire()
+        wait = time.perf_counter() - start
+        state = self._state()
+        with state.lock:
+            state.acquired += 1
+            state.total_wait += wait
+            state.max_wait = max(state.max_wait, wait)
+        return session
+
+    def try_acquire(self, keep_free: int = 1):
+        """Acquire a session only when the pool can hand one out and still keep keep_free sessions free.
+
+        Return None instead of waiting when the pool is that busy. An app context acquiring between the check and
+        the acquire can still take the last session, then this waits like acquire does.
+        """
+        pool = self.pool
+        state = self._state()
+        with state.lock:
+            if pool.busy + keep_free >= pool.max:
+                return None
+            session = pool.acquire()
+            state.acquired += 1
+        return session
+
+    def release(self, session):
+        """Release a session back to the pool; any uncommitted work is rolled back."""
+        try:
+            self.pool.release(session)
+        except cx_Oracle.Error:  # pylint:disable=c-extension-no-member
+            # already closed or released, eg. the session was used as a `with` block
+            pass
+
+    @contextmanager
+    def session(self):
+        """Acquire a session for the duration of the block and release it afterwards."""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def stats(self) -> dict:
+        """Return the pool sizing, usage and acquire wait statistics for this process."""
+        state = self._state()
+        pool = state.pool
+        return {
+            'pid': os.getpid(),
+            'min': current_app.config.get('ORACLE_POOL_MIN'),
+            'max': current_app.config.get('ORACLE_POOL_MAX'),
+            'open': pool.opened if pool else 0,
+            'busy': pool.busy if pool else 0,
+            'acquired': state.acquired,
+            'avgWaitMs': round(state.total_wait * 1000 / state.acquired, 3) if state.acquired else 0,
+            'maxWaitMs': round(state.max_wait * 1000, 3)
+        }
+
     @property
     def connection(self):  # pylint: disable=inconsistent-return-statements
         """Create connection property for the NROService.
 
-        If this is running in a Flask context,
-        then either get the existing connection pool or create a new one
-        and then return an acquired session
+        If this is running in a Flask context, return the session of the app context, acquiring it from the
+        process wide pool on first access; the session is released when the app context is torn down.
         :return: cx_Oracle.connection type
         """
         ctx = _app_ctx_stack.top
         if ctx is not None:
-            if not hasattr(ctx, '_oracle_pool'):
-                ctx._oracle_pool = self._create_pool()  # pylint: disable = protected-access; need this method
-            return ctx._oracle_pool.acquire()  # pylint: disable = protected-access; need this method
+            if getattr(ctx, '_oracle_session', None) is None:
+                ctx._oracle_session = self.acquire()  # pylint: disable = protected-access; need this method
+            return ctx._oracle_session  # pylint: disable = protected-access; need this method
 
 
 # export instance of this class
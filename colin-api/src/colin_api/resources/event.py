@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Event info endpoint for colin db."""
-from flask import current_app, jsonify
+from http import HTTPStatus
+
+from flask import current_app, jsonify, request
 from flask_restx import Resource, cors
 
 from colin_api.models import Business
@@ -22,6 +24,10 @@ from colin_api.utils.auth import COLIN_SVC_ROLE, jwt
 from colin_api.utils.util import cors_preflight
 
 
+# largest page of events the keyset feed returns at once
+MAX_EVENT_PAGE_SIZE = 10000
+
+
 @cors_preflight('GET, POST')
 @API.route('/event/<string:corp_type>/<string:event_id>')
 class EventInfo(Resource):
@@ -31,29 +37,60 @@ class EventInfo(Resource):
     @cors.crossdomain(origin='*')
     @jwt.requires_roles([COLIN_SVC_ROLE])
     def get(corp_type, event_id):
-        """Return all event_ids of the corp_type that are greater than the given event_id."""
-        querystring = """
-            select event.event_id, corporation.corp_num, corporation.corp_typ_cd, filing.filing_typ_cd
+        """Return all event_ids of the corp_type that are greater than the given event_id.
+
+        With ?limit=N only the first N events after event_id are returned, in event_id order, along with the
+        nextCursor to request the following page with (None on the last page). The page is cut on distinct
+        event ids, so every filing row of an event is on the same page as the event.
+        """
+        event_filter = """
             from event
             join filing on event.event_id = filing.event_id
             join corporation on EVENT.corp_num = corporation.corp_num
             where corporation.corp_typ_cd = :corp_type
             """
+        limit = request.args.get('limit', type=int)
+        if limit is not None and not 0 < limit <= MAX_EVENT_PAGE_SIZE:
+            return jsonify({'message': f'limit must be between 1 and {MAX_EVENT_PAGE_SIZE}'}), HTTPStatus.BAD_REQUEST
         try:
             cursor = DB.connection.cursor()
             corp_type = Business.map_legal_type_to_colin(corp_type)
+            params = {'corp_type': corp_type}
             if event_id != 'earliest':
-                querystring += 'and event.event_id > :max_event_id '
-                cursor.execute(querystring, max_event_id=event_id, corp_type=corp_type)
+                event_filter += 'and event.event_id > :max_event_id '
+                params['max_event_id'] = event_id
             else:
-                querystring += "and event_timestmp > TO_DATE('2019-03-08', 'yyyy-mm-dd') order by event.event_id asc"
-                cursor.execute(querystring, corp_type=corp_type)
+                event_filter += "and event_timestmp > TO_DATE('2019-03-08', 'yyyy-mm-dd') "
+            if limit:
+                # the first N event ids, then every row of those events
+                event_filter += f"""and event.event_id in (
+                    select event_id from (
+                        select distinct event.event_id {event_filter} order by event.event_id asc
+                    ) where rownum <= :limit
+                )
+                """
+                params['limit'] = limit
+                # fetch the whole page in one round trip, most events have one filing
+                cursor.prefetchrows = limit + 1
+                cursor.arraysize = limit
+            querystring = f"""
+                select event.event_id, corporation.corp_num, corporation.corp_typ_cd, filing.filing_typ_cd
+                {event_filter}
+                """
+            if limit or event_id == 'earliest':
+                querystring += 'order by event.event_id asc '
+            cursor.execute(querystring, **params)
             event_info = cursor.fetchall()
             event_list = []
             for event in event_info:
                 event = dict(zip([x[0].lower() for x in cursor.description], event))
                 event_list.append(event)
-            return jsonify({'events': event_list})
+            if not limit:
+                return jsonify({'events': event_list})
+
+            page_events = len({event['event_id'] for event in event_list})
+            next_cursor = str(event_list[-1]['event_id']) if page_events == limit else None
+            return jsonify({'events': event_list, 'nextCursor': next_cursor})
 
         except Exception as err:  # pylint: disable=broad-except; want to catch all errors
             current_app.logger.error(err.with_traceback(None))
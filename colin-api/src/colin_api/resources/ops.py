@@ -56,3 +56,13 @@ class Readyz(Resource):
     def get():
         """Return a JSON object that identifies if the service is setupAnd ready to work."""
         return {'message': 'api is ready'}, 200
+
+
+@API.route('pool')
+class Pool(Resource):
+    """Reports the Oracle session pool of this worker process."""
+
+    @staticmethod
+    def get():
+        """Return the pool sizing, usage and acquire wait statistics."""
+        return DB.stats(), 200
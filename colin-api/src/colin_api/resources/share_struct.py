@@ -45,13 +45,10 @@ class ShareStruct(Resource):
 
             cursor = DB.connection.cursor()
             identifier = Business.get_colin_identifier(identifier, legal_type)
-            shares = ShareObject.get_all(cursor=cursor, corp_num=identifier)
-            if not shares:
+            share = ShareObject.get_current(cursor=cursor, corp_num=identifier)
+            if not share:
                 return jsonify({'message': f'No share structures found for {identifier}'}), HTTPStatus.NOT_FOUND
-            for share in shares:
-                if not share.end_event_id:
-                    return jsonify(share.to_dict())
-            return jsonify({'message': f'No current share structures found for {identifier}'}), HTTPStatus.NOT_FOUND
+            return jsonify(share.to_dict())
 
         except GenericException as err:  # pylint: disable=duplicate-code
             return jsonify(
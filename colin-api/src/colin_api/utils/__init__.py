@@ -79,6 +79,15 @@ def stringify_list(list_orig: list) -> str:
     return list_str
 
 
+# oracle rejects an IN list with more than 1000 expressions (ORA-01795)
+IN_LIST_LIMIT = 1000
+
+
+def chunk_list(list_orig: list, size: int = IN_LIST_LIMIT) -> list:
+    """Split the given list into lists of at most size items - used to keep IN lists under the oracle limit."""
+    return [list_orig[i:i + size] for i in range(0, len(list_orig), size)]
+
+
 def delete_from_table_by_event_ids(cursor, event_ids: list, table: str, column: str = 'start_event_id'):
     """Delete rows with given event ids from given table."""
     try:
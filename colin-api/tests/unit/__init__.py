@@ -112,7 +112,7 @@ def build_office(office_type):
 
 
 def build_share_structure():
-    """Return the current ShareObject as ShareObject.get_all would build it."""
+    """Return the current ShareObject as ShareObject.get_current would build it."""
     series = Share()
     series.share_id = 1
     series.share_name = 'SERIES 1'
@@ -14,7 +14,7 @@
 
 """Tests to assure the business snapshot end-point."""
 from colin_api.exceptions import BusinessNotFoundException, PartiesNotFoundException
-from colin_api.models import Business, Party, ShareObject
+from colin_api.models import Business, BusinessSnapshot, Party, ShareObject
 from tests.unit import LEAR_ADDRESS, build_business, bypass_auth
 
 
@@ -119,7 +119,7 @@ def test_get_snapshot_without_parties(client, mocker, authorized, mock_db,
 def test_get_snapshot_without_share_structure(client, mocker, authorized, mock_db,
                                               mock_lookups):  # pylint: disable=unused-argument
     """Assert a corp with no share structure returns an empty list rather than failing."""
-    mocker.patch.object(ShareObject, 'get_all', return_value=None)
+    mocker.patch.object(ShareObject, 'get_current', return_value=None)
 
     rv = client.get(SNAPSHOT_URL)
 
@@ -175,6 +175,51 @@ def test_get_snapshot_handles_unexpected_error(client, mocker, authorized, mock_
     assert 'oracle exploded' not in str(rv.json)
 
 
+def test_get_snapshot_conditional_request(client, mocker, authorized, mock_db,
+                                          mock_lookups):  # pylint: disable=unused-argument
+    """Assert a caller holding the current etag gets a 304 without the snapshot being read."""
+    rv = client.get(SNAPSHOT_URL)
+    etag = rv.headers['ETag']
+
+    assert rv.status_code == 200
+    assert etag
+
+    find = mocker.patch.object(Business, 'find_by_identifier', return_value=build_business())
+    rv = client.get(SNAPSHOT_URL, headers={'If-None-Match': etag})
+
+    assert rv.status_code == 304
+    assert rv.headers['ETag'] == etag
+    find.assert_not_called()
+
+    # a new event for the corp changes the etag
+    mock_db.cursor.fetchone.return_value = (12345,)
+    rv = client.get(SNAPSHOT_URL, headers={'If-None-Match': etag})
+
+    assert rv.status_code == 200
+    assert rv.headers['ETag'] != etag
+
+
+def test_get_snapshot_cached_until_new_event(app, client, mocker, authorized, mock_db,
+                                             mock_lookups):  # pylint: disable=unused-argument
+    """Assert the snapshot is reused until a new event is written for the corp."""
+    mocker.patch.dict(app.config, {'SNAPSHOT_CACHE_SIZE': 10})
+    BusinessSnapshot.cache.clear()
+    find = mocker.patch.object(Business, 'find_by_identifier', return_value=build_business())
+    try:
+        first = client.get(SNAPSHOT_URL)
+        second = client.get(SNAPSHOT_URL)
+
+        assert first.json == second.json
+        assert find.call_count == 1
+
+        mock_db.cursor.fetchone.return_value = (12345,)
+        client.get(SNAPSHOT_URL)
+
+        assert find.call_count == 2
+    finally:
+        BusinessSnapshot.cache.clear()
+
+
 def test_get_snapshot_requires_colin_service_role(client, mocker):
     """Assert the endpoint is gated on the colin service role."""
     bypass_auth(mocker, roles_valid=False)
@@ -0,0 +1,72 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the internal tax_ids end-point."""
+from unittest.mock import MagicMock
+
+
+TAX_IDS_URL = '/api/v1/businesses/internal/tax_ids'
+
+
+def _mock_cursor(mocker):
+    """Return a cursor that answers each chunk with a bn_15 for every identifier bound to it."""
+    cursor = MagicMock()
+    cursor.description = [('CORP_NUM',), ('BN_15',)]
+    cursor.execute.side_effect = lambda query, **binds: setattr(
+        cursor, 'rows', [(corp_num, f'{corp_num}BC0001') for corp_num in binds.values()])
+    cursor.fetchall.side_effect = lambda: cursor.rows
+    db = MagicMock()  # pylint: disable=invalid-name; mirrors the patched module attribute
+    db.connection.cursor.return_value = cursor
+    mocker.patch('colin_api.resources.business.DB', db)
+    return cursor
+
+
+def test_get_tax_ids_chunked(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert more identifiers than an oracle IN list allows are looked up in chunks and returned together."""
+    cursor = _mock_cursor(mocker)
+    identifiers = [f'BC{index:07d}' for index in range(2500)]
+
+    rv = client.get(TAX_IDS_URL, json={'identifiers': identifiers})
+
+    assert rv.status_code == 200
+    assert rv.json == {identifier: f'{identifier[2:]}BC0001' for identifier in identifiers}
+    assert cursor.execute.call_count == 3
+    assert max(len(call.kwargs) for call in cursor.execute.call_args_list) == 1000
+
+
+def test_get_tax_ids_over_limit(app, client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert a request over the per request bound is rejected."""
+    _mock_cursor(mocker)
+    mocker.patch.dict(app.config, {'TAX_IDS_MAX_IDENTIFIERS': 2})
+
+    rv = client.get(TAX_IDS_URL, json={'identifiers': ['BC0000001', 'BC0000002', 'BC0000003']})
+
+    assert rv.status_code == 400
+
+
+def test_get_tax_ids_later_chunk_fails(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert a lookup failing after the first chunk returns an error status, not a truncated 200 body."""
+    cursor = _mock_cursor(mocker)
+    answer_chunk = cursor.execute.side_effect
+
+    def _execute(query, **binds):
+        if cursor.execute.call_count > 1:
+            raise Exception('ORA-03113: end-of-file on communication channel')  # pylint: disable=broad-exception-raised
+        answer_chunk(query, **binds)
+    cursor.execute.side_effect = _execute
+
+    rv = client.get(TAX_IDS_URL, json={'identifiers': [f'BC{index:07d}' for index in range(2500)]})
+
+    assert rv.status_code == 500
+    assert rv.json == {'message': 'Something went wrong.'}
@@ -0,0 +1,93 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the event feed end-point."""
+from unittest.mock import MagicMock
+
+
+EVENT_COLUMNS = [('EVENT_ID',), ('CORP_NUM',), ('CORP_TYP_CD',), ('FILING_TYP_CD',)]
+
+
+def _mock_cursor(mocker, rows):
+    cursor = MagicMock()
+    cursor.description = EVENT_COLUMNS
+    cursor.fetchall.return_value = rows
+    db = MagicMock()  # pylint: disable=invalid-name; mirrors the patched module attribute
+    db.connection.cursor.return_value = cursor
+    mocker.patch('colin_api.resources.event.DB', db)
+    return cursor
+
+
+def test_get_events_page(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert a full page returns the cursor of its last event and is read in one round trip."""
+    cursor = _mock_cursor(mocker, [(101, 'CP1234567', 'CP', 'OTANN'), (102, 'CP1234567', 'CP', 'OTADD')])
+
+    rv = client.get('/api/v1/businesses/event/CP/100?limit=2')
+
+    assert rv.status_code == 200
+    assert [event['event_id'] for event in rv.json['events']] == [101, 102]
+    assert rv.json['nextCursor'] == '102'
+    query = cursor.execute.call_args.args[0]
+    assert 'select distinct event.event_id' in query
+    assert 'rownum <= :limit' in query
+    assert 'order by event.event_id asc' in query
+    assert cursor.execute.call_args.kwargs == {'corp_type': 'CP', 'max_event_id': '100', 'limit': 2}
+    assert cursor.arraysize == 2
+
+
+def test_get_events_page_keeps_event_rows_together(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert the page is cut on events, so every filing row of its last event is on the page."""
+    _mock_cursor(mocker, [
+        (101, 'CP1234567', 'CP', 'OTANN'),
+        (102, 'CP1234567', 'CP', 'OTADD'),
+        (102, 'CP1234567', 'CP', 'OTCDR')
+    ])
+
+    rv = client.get('/api/v1/businesses/event/CP/100?limit=2')
+
+    assert rv.status_code == 200
+    assert [event['filing_typ_cd'] for event in rv.json['events']] == ['OTANN', 'OTADD', 'OTCDR']
+    assert rv.json['nextCursor'] == '102'
+
+
+def test_get_events_last_page(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert a short page has no next cursor."""
+    _mock_cursor(mocker, [(101, 'CP1234567', 'CP', 'OTANN')])
+
+    rv = client.get('/api/v1/businesses/event/CP/100?limit=2')
+
+    assert rv.status_code == 200
+    assert rv.json['nextCursor'] is None
+
+
+def test_get_events_without_limit(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert callers that do not page still get every event after the id."""
+    cursor = _mock_cursor(mocker, [(101, 'CP1234567', 'CP', 'OTANN')])
+
+    rv = client.get('/api/v1/businesses/event/CP/100')
+
+    assert rv.status_code == 200
+    assert rv.json == {'events': [
+        {'event_id': 101, 'corp_num': 'CP1234567', 'corp_typ_cd': 'CP', 'filing_typ_cd': 'OTANN'}
+    ]}
+    assert 'rownum' not in cursor.execute.call_args.args[0]
+
+
+def test_get_events_invalid_limit(client, mocker, authorized):  # pylint: disable=unused-argument
+    """Assert an out of range page size is rejected."""
+    _mock_cursor(mocker, [])
+
+    rv = client.get('/api/v1/businesses/event/CP/100?limit=0')
+
+    assert rv.status_code == 400
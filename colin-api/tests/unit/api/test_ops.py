@@ -16,9 +16,44 @@
 
 Test-Suite to ensure that the /ops endpoint is working as expected.
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import cx_Oracle
+
 from tests import oracle_integration
 
 
+class FakeSessionPool:
+    """Stands in for cx_Oracle.SessionPool, counting the pools and sessions handed out."""
+
+    created = 0
+
+    def __init__(self, **kwargs):
+        """Record the pool creation and its sizing."""
+        FakeSessionPool.created += 1
+        self.kwargs = kwargs
+        self.min = kwargs['min']
+        self.max = kwargs['max']
+        self.opened = self.min
+        self.busy = 0
+        self.released = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Hand out a fake session."""
+        with self._lock:
+            self.busy += 1
+        return MagicMock()
+
+    def release(self, session):  # pylint: disable=unused-argument
+        """Take a fake session back."""
+        with self._lock:
+            self.busy -= 1
+            self.released += 1
+
+
 @oracle_integration
 def test_ops_healthz_success(client):
     """Assert that the service is healthy if it can successfully access the database."""
@@ -44,3 +79,67 @@ def test_ops_readyz(client):
 
     assert 200 == rv.status_code
     assert {'message': 'api is ready'} == rv.json
+
+
+def test_ops_pool_one_per_process(app_request, monkeypatch):
+    """Assert concurrent requests share one session pool and every session is released."""
+    monkeypatch.setattr('colin_api.resources.db.cx_Oracle.SessionPool', FakeSessionPool)
+    FakeSessionPool.created = 0
+    requests = 20
+
+    def _get_healthz(_):
+        with app_request.test_client() as client:
+            return client.get('/ops/healthz').status_code
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        assert set(executor.map(_get_healthz, range(requests))) == {200}
+
+    assert FakeSessionPool.created == 1
+    pool = app_request.extensions['oracle_db'].pool
+    assert pool.released == requests
+
+    with app_request.test_client() as client:
+        rv = client.get('/ops/pool')
+    assert rv.status_code == 200
+    assert rv.json['busy'] == 0
+    assert rv.json['acquired'] == requests
+    assert rv.json['max'] == app_request.config['ORACLE_POOL_MAX']
+
+
+def test_connection_one_session_per_app_context(app_request, monkeypatch):
+    """Assert every DB.connection access in an app context reuses one session, however many accesses there are."""
+    monkeypatch.setattr('colin_api.resources.db.cx_Oracle.SessionPool', FakeSessionPool)
+    from colin_api.resources.db import DB  # pylint: disable=import-outside-toplevel
+
+    with app_request.app_context():
+        accesses = app_request.config['ORACLE_POOL_MAX'] + 5
+        sessions = [DB.connection for _ in range(accesses)]
+        pool = app_request.extensions['oracle_db'].pool
+        assert all(session is sessions[0] for session in sessions)
+        assert pool.busy == 1
+        assert pool.kwargs['getmode'] == cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT  # pylint:disable=c-extension-no-member
+        assert pool.kwargs['waitTimeout'] == app_request.config['ORACLE_POOL_WAIT_TIMEOUT']
+
+    assert pool.busy == 0
+    assert pool.released == 1
+
+
+def test_try_acquire_keeps_a_session_free(app_request, monkeypatch):
+    """Assert try_acquire returns None instead of waiting once only one pooled session is left."""
+    monkeypatch.setattr('colin_api.resources.db.cx_Oracle.SessionPool', FakeSessionPool)
+    from colin_api.resources.db import DB  # pylint: disable=import-outside-toplevel
+
+    with app_request.app_context():
+        pool = DB.pool
+        sessions = [DB.try_acquire() for _ in range(pool.max)]
+
+        assert sessions.count(None) == 1
+        assert pool.busy == pool.max - 1
+        assert DB.connection is not None
+        assert pool.busy == pool.max
+
+        for session in sessions:
+            if session is not None:
+                DB.release(session)
+
+    assert pool.busy == 0
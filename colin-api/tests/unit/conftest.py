@@ -96,7 +96,7 @@ def mock_lookups(mocker):
         return_value=[build_office('registeredOffice'), build_office('recordsOffice'),
                       build_office('liquidationOffice')]
     )
-    mocker.patch.object(ShareObject, 'get_all', return_value=[build_share_structure()])
+    mocker.patch.object(ShareObject, 'get_current', return_value=build_share_structure())
     mocker.patch.object(Business, 'get_resolutions', return_value=['2020-01-01', '2019-06-15'])
 
 
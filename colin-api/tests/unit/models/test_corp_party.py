@@ -0,0 +1,114 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Party model."""
+import datetime
+
+from colin_api.models import Party
+
+
+ADDRESS_COLUMNS = [
+    'province', 'city', 'postal_cd', 'addr_line_1', 'addr_line_2', 'addr_line_3', 'unit_type', 'unit_no',
+    'civic_no', 'civic_no_suffix', 'street_name', 'street_type', 'street_direction', 'address_format_type',
+    'route_service_type', 'lock_box_no', 'route_service_no', 'installation_type', 'installation_name', 'addr_id',
+    'full_desc', 'delivery_instructions'
+]
+PARTY_COLUMNS = [
+    'first_nme', 'middle_nme', 'last_nme', 'delivery_addr_id', 'mailing_addr_id', 'appointment_dt', 'cessation_dt',
+    'start_event_id', 'end_event_id', 'business_nme', 'party_typ_cd', 'corp_party_id', 'prev_party_id', 'corp_num',
+    'short_desc'
+]
+
+
+def _address_row(addr_id: int) -> tuple:
+    address = dict.fromkeys(ADDRESS_COLUMNS)
+    address.update({'addr_id': addr_id, 'addr_line_1': f'{addr_id} MAIN ST', 'city': 'VICTORIA', 'province': 'BC',
+                    'postal_cd': 'V8V 1A1', 'full_desc': 'Canada'})
+    return tuple(address[column] for column in ADDRESS_COLUMNS)
+
+
+class FakeCursor:
+    """Cursor that answers each query by the table it reads and counts the round trips."""
+
+    def __init__(self, party_rows: list):
+        """Serve the given corp_party rows."""
+        self.party_rows = party_rows
+        self.queries = []
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, **kwargs):  # pylint: disable=unused-argument
+        """Record the query and stage its result."""
+        self.queries.append(query)
+        if 'FROM ADDRESS' in query:
+            self.description = [(column.upper(),) for column in ADDRESS_COLUMNS]
+            ids = [int(addr_id.strip("'")) for addr_id in query.split('in (')[1].split(')')[0].split(',')]
+            self._rows = [_address_row(addr_id) for addr_id in ids]
+        elif 'FROM event' in query:
+            self.description = [('EVENT_ID',), ('EVENT_TYP_CD',), ('EVENT_TIMESTMP',), ('EFFECTIVE_DT',)]
+            self._rows = [(row[7], 'FILE', datetime.datetime(2020, 1, 1), None) for row in self.party_rows]
+        elif 'FROM offices_held' in query:
+            self.description = [('CORP_PARTY_ID',), ('OFFICER_TYP_CD',)]
+            self._rows = [(row[11], 'PRES') for row in self.party_rows if row[10] == 'OFF']
+        elif 'FROM corporation' in query:
+            self.description = [('RECOGNITION_DTS',)]
+            self._rows = [(datetime.datetime(2019, 1, 1),)]
+        else:
+            self.description = [(column.upper(),) for column in PARTY_COLUMNS]
+            self._rows = self.party_rows
+        return self
+
+    def fetchall(self):
+        """Return the staged rows."""
+        return self._rows
+
+    def fetchone(self):
+        """Return the first staged row."""
+        return self._rows[0] if self._rows else None
+
+
+def _party_row(corp_party_id: int, party_typ_cd: str = 'DIR', appointment_dt=None) -> tuple:
+    return (f'FIRST{corp_party_id}', '', 'LAST', corp_party_id * 10, corp_party_id * 10 + 1, appointment_dt, None,
+            corp_party_id + 100, None, None, party_typ_cd, corp_party_id, None, 'BC0870226', 'Director')
+
+
+def test_get_current_loads_in_constant_round_trips():
+    """Assert addresses, offices held and the founding date are loaded once for the whole result set."""
+    cursor = FakeCursor([_party_row(i, 'OFF' if i % 2 else 'DIR') for i in range(1, 51)])
+
+    parties = Party.get_current(cursor, 'BC0870226', role_type=None)
+
+    assert len(parties) == 50
+    # parties, addresses, offices held and the founding date
+    assert len(cursor.queries) == 4
+    officer = next(party for party in parties if party.role_type == 'OFF')
+    assert officer.offices_held == ['PRES']
+    assert officer.delivery_address['streetAddress'] == f'{officer.corp_party_id * 10} MAIN ST'
+    assert officer.mailing_address['streetAddress'] == f'{officer.corp_party_id * 10 + 1} MAIN ST'
+    assert all(party.appointment_date == datetime.datetime(2019, 1, 1) for party in parties)
+
+
+def test_get_all_parties_loads_start_dates_in_bulk():
+    """Assert the start event dates of parties without an appointment date are loaded with one query."""
+    rows = [_party_row(i) for i in range(1, 31)]
+    rows[0] = _party_row(1, appointment_dt=datetime.datetime(2021, 6, 1))
+    cursor = FakeCursor(rows)
+
+    parties = Party.get_all_parties(cursor, 'BC0870226')
+
+    assert len(parties) == 30
+    # parties, addresses and start event dates
+    assert len(cursor.queries) == 3
+    assert parties[0].appointment_date == '2021-06-01'
+    assert all(party.appointment_date == '2020-01-01' for party in parties[1:])
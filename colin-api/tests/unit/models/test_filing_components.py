@@ -0,0 +1,110 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the component plan and component loads of Filing.get_filing."""
+import threading
+from unittest.mock import MagicMock
+
+import cx_Oracle
+
+from colin_api.models import Business, CorpName, Office, Party, ShareObject
+from colin_api.models.filing import Filing
+from tests.unit import build_business
+
+
+INCORPORATION_COMPONENTS = frozenset(['offices', 'parties', 'shareStructure', 'nameRequest', 'nameTranslations'])
+
+
+def _overlapping(reads: threading.Barrier, result):
+    def _read(*args, **kwargs):  # pylint: disable=unused-argument
+        reads.wait()
+        return result
+    return _read
+
+
+def _incorporation_filing() -> Filing:
+    filing = Filing()
+    filing.business = build_business()
+    filing.filing_type = 'incorporationApplication'
+    return filing
+
+
+def test_component_plan_reads_schema_once(mocker):
+    """Assert the schema of a filing type is only read the first time its plan is needed."""
+    get_schema = mocker.patch('colin_api.models.filing.get_schema', return_value={
+        'properties': {'incorporationApplication': {'properties': {'offices': {}, 'parties': {}}}}
+    })
+    mocker.patch.object(Filing, '_component_plans', {})
+
+    assert Filing.get_component_plan('incorporationApplication') == frozenset(['offices', 'parties'])
+    assert Filing.get_component_plan('incorporationApplication') == frozenset(['offices', 'parties'])
+    assert get_schema.call_count == 1
+
+
+def test_load_event_components_concurrently(app, mocker):
+    """Assert the component reads of an incorporation application are issued together, one session each.
+
+    Every read waits on a barrier sized to all six reads, so the reads only complete when they overlap; read one
+    at a time the first would break the barrier.
+    """
+    reads = threading.Barrier(6, timeout=5)
+    db = MagicMock()  # pylint: disable=invalid-name; mirrors the patched module attribute
+    mocker.patch('colin_api.models.filing.DB', db)
+    mocker.patch.object(Office, 'get_by_event', side_effect=_overlapping(reads, ['offices']))
+    mocker.patch.object(Party, 'get_by_event', side_effect=_overlapping(reads, ['parties']))
+    mocker.patch.object(ShareObject, 'get_all', side_effect=_overlapping(reads, 'share structure'))
+    mocker.patch.object(Business, 'get_resolutions', side_effect=_overlapping(reads, []))
+    mocker.patch.object(CorpName, 'get_by_event', side_effect=_overlapping(reads, ['names']))
+    cursor = MagicMock()
+
+    with app.app_context():
+        mocker.patch.dict(app.config, {'FILING_COMPONENT_WORKERS': 6})
+        loaded = Filing._load_event_components(  # pylint: disable=protected-access
+            cursor, _incorporation_filing(), {'event_id': 1, 'filing_type_code': 'ICORP'},
+            INCORPORATION_COMPONENTS, concurrent=True)
+
+    assert loaded == {
+        'offices': ['offices'],
+        'parties': ['parties'],
+        'shareStructure': 'share structure',
+        'resolutionDates': [],
+        'nameTranslations': ['names'],
+        'names': ['names']
+    }
+    assert db.try_acquire.call_count == 6
+    assert db.release.call_count == 6
+    assert not reads.broken
+
+
+def test_load_event_components_pool_exhausted(app, mocker):
+    """Assert a read that cannot get a free pooled session falls back to the request's cursor without waiting."""
+    db = MagicMock()  # pylint: disable=invalid-name; mirrors the patched module attribute
+    # the first read finds the pool busy, the second loses the race for the last session
+    db.try_acquire.side_effect = [None, cx_Oracle.DatabaseError('ORA-24418')]  # pylint: disable=c-extension-no-member
+    mocker.patch('colin_api.models.filing.DB', db)
+    get_by_event = mocker.patch.object(Office, 'get_by_event', return_value=['offices'])
+    get_parties = mocker.patch.object(Party, 'get_by_event', return_value=['parties'])
+    cursor = MagicMock()
+
+    with app.app_context():
+        mocker.patch.dict(app.config, {'FILING_COMPONENT_WORKERS': 4})
+        loaded = Filing._load_event_components(  # pylint: disable=protected-access
+            cursor, _incorporation_filing(), {'event_id': 1, 'filing_type_code': 'ICORP'},
+            frozenset(['offices', 'parties']), concurrent=True)
+
+    assert loaded == {'offices': ['offices'], 'parties': ['parties']}
+    assert get_by_event.call_args.kwargs['cursor'] is cursor
+    assert get_parties.call_args.kwargs['cursor'] is cursor
+    db.acquire.assert_not_called()
+    db.release.assert_not_called()
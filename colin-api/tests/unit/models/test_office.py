@@ -0,0 +1,61 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Office model."""
+from colin_api.models import Office
+from tests.unit.models.test_corp_party import ADDRESS_COLUMNS, _address_row
+
+
+OFFICE_COLUMNS = ['start_event_id', 'end_event_id', 'mailing_addr_id', 'delivery_addr_id', 'office_typ_cd']
+MISSING_ADDR_ID = 999
+
+
+class FakeCursor:
+    """Cursor that serves the given office rows and the addresses that exist."""
+
+    def __init__(self, office_rows: list):
+        """Serve the given office rows."""
+        self.office_rows = office_rows
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, **kwargs):  # pylint: disable=unused-argument
+        """Stage the result of the query."""
+        if 'FROM ADDRESS' in query:
+            self.description = [(column.upper(),) for column in ADDRESS_COLUMNS]
+            ids = [int(addr_id.strip("'")) for addr_id in query.split('in (')[1].split(')')[0].split(',')]
+            self._rows = [_address_row(addr_id) for addr_id in ids if addr_id != MISSING_ADDR_ID]
+        else:
+            self.description = [(column.upper(),) for column in OFFICE_COLUMNS]
+            self._rows = self.office_rows
+        return self
+
+    def fetchall(self):
+        """Return the staged rows."""
+        return self._rows
+
+
+def test_get_current_skips_addresses_of_unknown_office_types():
+    """Assert that a bad address of an office type that is not returned does not fail the read."""
+    cursor = FakeCursor([
+        (1, None, 11, 10, 'RG'),
+        (1, None, None, 20, 'RC'),
+        (1, None, MISSING_ADDR_ID, MISSING_ADDR_ID, 'XX')
+    ])
+
+    offices = Office.get_current(cursor, 'BC0870226')
+
+    assert [office.office_type for office in offices] == ['registeredOffice', 'recordsOffice']
+    assert offices[0].mailing_address['streetAddress'] == '11 MAIN ST'
+    assert offices[1].mailing_address == offices[1].delivery_address
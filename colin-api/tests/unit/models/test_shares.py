@@ -38,3 +38,44 @@ def test_get_share_classes_carries_other_currency():
     assert share_classes[0].other_currency == 'BITCOIN'
     assert share_classes[0].to_dict()['currencyAdditional'] == 'BITCOIN'
     assert share_classes[0].to_dict()['currency'] == 'OTH'
+
+
+def test_get_current_loads_series_in_bulk():
+    """Assert the current structure is read with one query for its classes and one for all their series."""
+    cursor = MagicMock()
+    class_description = [
+        ('START_EVENT_ID',), ('END_EVENT_ID',), ('SHARE_CLASS_ID',), ('CURRENCY_TYP_CD',), ('MAX_SHARE_IND',),
+        ('SHARE_QUANTITY',), ('SPEC_RIGHTS_IND',), ('PAR_VALUE_IND',), ('PAR_VALUE_AMT',), ('CLASS_NME',),
+        ('OTHER_CURRENCY',)
+    ]
+    series_description = [
+        ('SHARE_CLASS_ID',), ('SERIES_ID',), ('MAX_SHARE_IND',), ('SHARE_QUANTITY',), ('SPEC_RIGHT_IND',),
+        ('SERIES_NME',)
+    ]
+    descriptions = iter([class_description, series_description])
+    cursor.execute.side_effect = lambda *args, **kwargs: setattr(cursor, 'description', next(descriptions))
+    cursor.fetchall.side_effect = [
+        [(10, None, 0, 'CAD', 'N', 100, 'N', 'N', None, 'CLASS A', None),
+         (10, None, 1, 'CAD', 'Y', None, 'Y', 'N', None, 'CLASS B', None)],
+        [(0, 0, 'Y', None, 'N', 'SERIES A1'), (1, 0, 'Y', None, 'N', 'SERIES B1'),
+         (1, 1, 'N', 50, 'N', 'SERIES B2')]
+    ]
+
+    share_structure = ShareObject.get_current(cursor, '0870226')
+
+    assert cursor.execute.call_count == 2
+    assert share_structure.start_event_id == 10
+    assert share_structure.end_event_id is None
+    share_classes = share_structure.to_dict()['shareClasses']
+    assert [share_class['name'] for share_class in share_classes] == ['CLASS A', 'CLASS B']
+    assert [series['name'] for series in share_classes[0]['series']] == ['SERIES A1']
+    assert [series['name'] for series in share_classes[1]['series']] == ['SERIES B1', 'SERIES B2']
+
+
+def test_get_current_without_share_structure():
+    """Assert None is returned when the corp has no current share structure."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = []
+
+    assert ShareObject.get_current(cursor, '0870226') is None
+    assert cursor.execute.call_count == 1
@@ -28,6 +28,8 @@ class _Config:
     SERVICE_NAME = "emailer-reminder-job"
 
     SEND_OUTSTANDING_BCOMPS = os.getenv("SEND_OUTSTANDING_BCOMPS", None)
+    EMAIL_REMINDER_BATCH_SIZE = int(os.getenv("EMAIL_REMINDER_BATCH_SIZE", "500"))
+    EMAIL_REMINDER_PUBLISH_WORKERS = int(os.getenv("EMAIL_REMINDER_PUBLISH_WORKERS", "5"))
     LD_SDK_KEY = os.getenv("LEAR_LD_SDK_KEY", None)
 
     # service account
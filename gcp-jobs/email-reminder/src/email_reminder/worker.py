@@ -33,13 +33,14 @@
 # POSSIBILITY OF SUCH DAMAGE.
 """Email Reminder job worker functionality is contained here."""
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import requests
 from business_account import AccountService
 from business_model.models import Business, Filing, db
-from flask import current_app
-from flask_sqlalchemy.pagination import Pagination
+from flask import Flask, current_app
 from simple_cloudevent import SimpleCloudEvent, to_queue_message
 from sqlalchemy.sql.expression import text
 
@@ -98,8 +99,8 @@ def get_ar_fee(legal_type: str, token: str) -> str:
     return str(ar_fee)
 
 
-def get_businesses(legal_types: list) -> Pagination:
-    """Get businesses to send AR reminder today."""
+def get_businesses(legal_types: list, after_id: int = 0, limit: int = 500) -> list[Business]:
+    """Get the next batch of businesses to send AR reminder today, keyset paged by id after after_id."""
     where_clause = text(
         "CASE WHEN last_ar_reminder_year IS NULL THEN date(founding_date)" +
         " ELSE date(founding_date)" +
@@ -113,8 +114,39 @@ def get_businesses(legal_types: list) -> Pagination:
         Business.restoration_expiry_date == None,
         # businesses in liquidation do not file annual reports
         Business.in_liquidation == False,
+        Business.id > after_id,
         where_clause
-    ).order_by(Business.id).paginate(per_page=20)
+    ).order_by(Business.id).limit(limit).all()
+
+
+def stream_businesses(legal_types: list, batch_size: int) -> Iterator[list[Business]]:
+    """Yield the businesses to send AR reminder today in batches.
+
+    Paging by id rather than offset keeps the stream stable while the caller updates (and so filters out)
+    the businesses it has already reminded.
+    """
+    after_id = 0
+    while businesses := get_businesses(legal_types, after_id, batch_size):
+        # read before yielding, the caller's commit expires the batch
+        after_id = businesses[-1].id
+        yield businesses
+
+
+def send_emails(app: Flask, reminders: list[tuple[int, str, int]]) -> set[int]:
+    """Publish a batch of (business_id, ar_fee, ar_year) reminders concurrently; return the ids that were queued."""
+    def _send(reminder: tuple[int, str, int]) -> bool:
+        business_id, ar_fee, ar_year = reminder
+        with app.app_context():
+            try:
+                send_email(business_id, ar_fee, str(ar_year))
+                current_app.logger.debug(f"Successfully queued ar reminder for business id {business_id}.")
+                return True
+            except Exception:
+                return False
+
+    with ThreadPoolExecutor(max_workers=app.config["EMAIL_REMINDER_PUBLISH_WORKERS"]) as executor:
+        sent = executor.map(_send, reminders)
+        return {business_id for (business_id, _, _), ok in zip(reminders, sent, strict=True) if ok}
 
 
 def find_and_send_ar_reminder():
@@ -141,26 +173,21 @@ def find_and_send_ar_reminder():
             ar_fees[legal_type] = get_ar_fee(legal_type, token)
 
         current_app.logger.debug("Getting businesses to send AR reminder today")
-        pagination = get_businesses(legal_types)
-        while pagination.items:
+        app = current_app._get_current_object()  # pylint: disable=protected-access
+        for businesses in stream_businesses(legal_types, current_app.config["EMAIL_REMINDER_BATCH_SIZE"]):
             current_app.logger.debug("Processing businesses to send AR reminder")
-            for item in pagination.items:
-                business: Business = item  # setting new variable for the typing
-                ar_year = (business.last_ar_reminder_year
-                           if business.last_ar_reminder_year else business.founding_date.year) + 1
-                try:
-                    send_email(business.id, ar_fees[business.legal_type], str(ar_year))
-                    current_app.logger.debug(f"Successfully queued ar reminder for business id {business.id}.")
-                    business.last_ar_reminder_year = ar_year
-                    business.save()
-                except Exception:
+            ar_years = {business.id: (business.last_ar_reminder_year or business.founding_date.year) + 1
+                        for business in businesses}
+            sent_ids = send_emails(app, [(business.id, ar_fees[business.legal_type], ar_years[business.id])
+                                         for business in businesses])
+            for business in businesses:
+                if business.id in sent_ids:
+                    business.last_ar_reminder_year = ar_years[business.id]
+                else:
                     # log error for human review
                     current_app.logger.error("Error sending email reminder for %s", business.identifier)
-
-            if pagination.next_num:
-                pagination = pagination.next()
-            else:
-                break
+            # one commit for the whole batch instead of one per business
+            db.session.commit()
 
     except Exception as err:
         current_app.logger.error(err)
@@ -75,10 +75,10 @@ def test_get_businesses(app, session, _test_name, founding_date, reminder_year,
     print(expected)
     resp = get_businesses([business.legal_type])
     if expected:
-        assert len(resp.items) == 1
-        assert resp.items[0].id == business.id
+        assert len(resp) == 1
+        assert resp[0].id == business.id
     else:
-        assert len(resp.items) == 0
+        assert len(resp) == 0
 
 @pytest.mark.parametrize('_test_name, ld_flag_value, legal_type, last_reminder_year, expected',[
     ('BEN_flag_off', False, Business.LegalTypes.BCOMP.value, 2023, True),
@@ -107,6 +107,23 @@ def test_find_and_send_ar_reminder(ld, app, session, _test_name, ld_flag_value,
                     assert_publish_mock(app, publish_mock, business.id, test_fee, ar_year)
             
     
+def test_find_and_send_ar_reminder_in_batches(app, session, monkeypatch):
+    """Assert every eligible business is reminded and updated when the businesses span several batches."""
+    monkeypatch.setitem(app.config, 'EMAIL_REMINDER_BATCH_SIZE', 2)
+    businesses = [factory_business(identifier=f'BC000000{i}',
+                                   entity_type=Business.LegalTypes.BCOMP.value,
+                                   last_ar_reminder_year=2023)
+                  for i in range(5)]
+    with patch.object(AccountService, 'get_bearer_token', return_value='token'),\
+        patch.object(gcp_queue, 'publish', return_value=None) as publish_mock,\
+            patch("email_reminder.worker.get_ar_fee", return_value='43.50'):
+                find_and_send_ar_reminder()
+
+    assert publish_mock.call_count == len(businesses)
+    for business in businesses:
+        assert Business.find_by_internal_id(business.id).last_ar_reminder_year == 2024
+
+
 @pytest.mark.parametrize('_test_name, legal_type, last_ar_year, expected',[
     ('BEN_publish', Business.LegalTypes.BCOMP.value, 2023, True),
     ('BEN_no_ar_publish', Business.LegalTypes.BCOMP.value, None, True),
@@ -40,6 +40,9 @@ class _Config:  # pylint: disable=too-few-public-methods
     ACCOUNT_SVC_CLIENT_SECRET = os.getenv("ACCOUNT_SVC_CLIENT_SECRET", None)
     ACCOUNT_SVC_TIMEOUT = os.getenv("ACCOUNT_SVC_TIMEOUT", "20")
 
+    # number of put back off filings created at the same time
+    PUT_BACK_OFF_MAX_WORKERS = int(os.getenv("PUT_BACK_OFF_MAX_WORKERS", "5"))
+
     SECRET_KEY = "a secret"
 
     TESTING = False
@@ -15,11 +15,38 @@
 
 This module is being used to process businesses with expired limited restorations.
 """
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from http import HTTPStatus
 
 import requests
 from flask import current_app
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class RunSummary:
+    """Counts and latency of a job run."""
+
+    found: int = 0
+    filed: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        """Return the summary in the shape logged at the end of a run."""
+        latencies = sorted(self.latencies)
+        return {
+            "found": self.found,
+            "filed": self.filed,
+            "failed": self.failed,
+            "elapsedSeconds": round(self.elapsed, 3),
+            "filingLatencyP50": round(latencies[len(latencies) // 2], 3) if latencies else None,
+            "filingLatencyMax": round(latencies[-1], 3) if latencies else None,
+        }
 
 
 def get_bearer_token(timeout):
@@ -65,10 +92,10 @@ def get_businesses_to_process():
     return response.json().get("businesses", [])
 
 
-def create_put_back_off_filing(business: dict):
+def create_put_back_off_filing(business: dict, token: str | None = None, session: requests.Session | None = None):
     """Create a putBackOff filing for the business."""
     timeout = int(current_app.config.get("ACCOUNT_SVC_TIMEOUT"))
-    token = get_bearer_token(timeout)
+    token = token or get_bearer_token(timeout)
     identifier = business["identifier"]
     legal_type = business["legalType"]
     filing_data = {
@@ -88,7 +115,7 @@ def create_put_back_off_filing(business: dict):
         }
     }
 
-    response = requests.post(
+    response = (session or requests).post(
         f'{current_app.config["LEAR_SVC_URL"]}/businesses/{identifier}/filings',
         json=filing_data,
         headers={
@@ -107,30 +134,65 @@ def create_put_back_off_filing(business: dict):
     return response.json()
 
 
+def create_put_back_off_filings(businesses: list[dict]) -> RunSummary:
+    """Create the putBackOff filings concurrently and return a summary of the run.
+
+    A failure for one business is logged and counted; the remaining businesses are still processed.
+    """
+    start = time.perf_counter()
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    workers = int(app.config.get("PUT_BACK_OFF_MAX_WORKERS"))
+    token = get_bearer_token(int(app.config.get("ACCOUNT_SVC_TIMEOUT")))
+    summary = RunSummary(found=len(businesses))
+
+    with requests.Session() as session:
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+        def _file(business: dict) -> tuple[dict | None, float | None, Exception | None]:
+            # runs in a worker thread; the caller logs the outcome
+            with app.app_context():
+                started = time.perf_counter()
+                try:
+                    filing = create_put_back_off_filing(business, token, session)
+                except Exception as err:  # pylint: disable=broad-except;
+                    return None, None, err
+                return filing, time.perf_counter() - started, None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for business, (filing, latency, err) in zip(businesses, executor.map(_file, businesses), strict=True):
+                identifier = business["identifier"]
+                if err:
+                    current_app.logger.error(f"Error processing business {identifier}: {err}")
+                    summary.failed += 1
+                    continue
+                filing_id = filing["filing"]["header"]["filingId"]
+                current_app.logger.debug(f"Successfully created put back off filing {filing_id} for {identifier}")
+                summary.filed += 1
+                summary.latencies.append(latency)
+
+    summary.elapsed = time.perf_counter() - start
+    return summary
+
+
 def run_job():  # pylint: disable=redefined-outer-name
     """Run the methods for processing expired limited restorations."""
     try:
         # 1. get businesses that need to be processed
+        # (legal-api leaves out businesses with a put back off filing still waiting on the filer, so a rerun
+        # does not file twice)
         businesses = get_businesses_to_process()
 
         if not businesses:
             current_app.logger.debug("No businesses to process")
             return
 
+        # one filing per business, even if it is listed twice
+        businesses = list({business["identifier"]: business for business in businesses}.values())
         current_app.logger.debug(f"Processing {len(businesses)} businesses")
 
         # 2. create put back off filing for each business
-        for business in businesses:
-            try:
-                # create putBackOff filing via API
-                identifier = business["identifier"]
-                filing = create_put_back_off_filing(business)
-                filing_id = filing["filing"]["header"]["filingId"]
-                current_app.logger.debug(
-                    f"Successfully created put back off filing {filing_id} for {identifier}"
-                )
-            except Exception as err:  # pylint: disable=broad-except;
-                current_app.logger.error(f"Error processing business {identifier}: {err}")
-                continue
+        summary = create_put_back_off_filings(businesses)
+        current_app.logger.info(f"Expired limited restoration run summary: {summary.as_dict()}")
     except Exception as err:  # pylint: disable=broad-except;
         current_app.logger.error(f"Job failed: {err}")
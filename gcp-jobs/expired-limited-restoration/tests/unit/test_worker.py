@@ -1,12 +1,13 @@
 from unittest.mock import patch
 
-from expired_limited_restoration.worker import run_job
+from expired_limited_restoration.worker import create_put_back_off_filings, run_job
 
 
+@patch("expired_limited_restoration.worker.get_bearer_token", return_value="token")
 @patch("expired_limited_restoration.worker.create_put_back_off_filing")
 @patch("expired_limited_restoration.worker.get_businesses_to_process")
 @patch("expired_limited_restoration.worker.current_app")
-def test_run_job_success(mock_current_app, mock_get_businesses, mock_create_filing, app):
+def test_run_job_success(mock_current_app, mock_get_businesses, mock_create_filing, mock_get_token, app):
     businesses = [
         {"identifier":"BUS123", "legalType":"C"},
         {"identifier":"BUS456", "legalType":"A"},
@@ -19,6 +20,8 @@ def test_run_job_success(mock_current_app, mock_get_businesses, mock_create_fili
 
     mock_get_businesses.assert_called_once()
     assert mock_create_filing.call_count == len(businesses)
+    # one token for the whole run
+    mock_get_token.assert_called_once()
     mock_current_app.logger.debug.assert_any_call(
         "Successfully created put back off filing 12345 for BUS123"
     )
@@ -40,10 +43,12 @@ def test_run_job_no_businesses(mock_current_app, mock_get_businesses, mock_creat
     mock_current_app.logger.debug.assert_called_with("No businesses to process")
 
 
+@patch("expired_limited_restoration.worker.get_bearer_token", return_value="token")
 @patch("expired_limited_restoration.worker.create_put_back_off_filing")
 @patch("expired_limited_restoration.worker.get_businesses_to_process")
 @patch("expired_limited_restoration.worker.current_app")
-def test_run_job_filing_creation_failure(mock_current_app, mock_get_businesses, mock_create_filing, app):
+def test_run_job_filing_creation_failure(mock_current_app, mock_get_businesses, mock_create_filing, mock_get_token,
+                                         app):
     businesses = [
         {"identifier":"BUS123", "legalType":"C"},
         {"identifier":"BUS456", "legalType":"A"},
@@ -75,3 +80,44 @@ def test_run_job_general_failure(mock_current_app, mock_get_businesses, mock_cre
     mock_get_businesses.assert_called_once()
     mock_create_filing.assert_not_called()
     mock_current_app.logger.error.assert_any_call("Job failed: Mocked general failure")
+
+
+@patch("expired_limited_restoration.worker.get_bearer_token", return_value="token")
+@patch("expired_limited_restoration.worker.create_put_back_off_filing")
+@patch("expired_limited_restoration.worker.get_businesses_to_process")
+@patch("expired_limited_restoration.worker.current_app")
+def test_run_job_files_each_business_once(mock_current_app, mock_get_businesses, mock_create_filing, mock_get_token,
+                                          app):
+    mock_get_businesses.return_value = [
+        {"identifier":"BUS123", "legalType":"C"},
+        {"identifier":"BUS123", "legalType":"C"},
+        {"identifier":"BUS456", "legalType":"A"}
+    ]
+    mock_create_filing.return_value = {"filing": {"header": {"filingId": 12345}}}
+
+    run_job()
+
+    assert [call.args[0]["identifier"] for call in mock_create_filing.call_args_list] == ["BUS123", "BUS456"]
+
+
+def test_create_put_back_off_filings_summary(app, requests_mock, monkeypatch):
+    """Assert the filings share one token, and failures are counted without stopping the run."""
+    monkeypatch.setitem(app.config, "LEAR_SVC_URL", "https://legal-api.test")
+    monkeypatch.setitem(app.config, "ACCOUNT_SVC_AUTH_URL", "https://auth.test/token")
+    monkeypatch.setitem(app.config, "PUT_BACK_OFF_MAX_WORKERS", 3)
+    token_mock = requests_mock.post("https://auth.test/token", json={"access_token": "token"})
+    businesses = [{"identifier": f"BC000000{i}", "legalType": "BC"} for i in range(6)]
+    for i, business in enumerate(businesses):
+        requests_mock.post(f'https://legal-api.test/businesses/{business["identifier"]}/filings',
+                           status_code=201 if i else 400,
+                           json={"filing": {"header": {"filingId": i}}})
+
+    with app.app_context():
+        summary = create_put_back_off_filings(businesses)
+
+    assert token_mock.call_count == 1
+    assert summary.found == 6
+    assert summary.filed == 5
+    assert summary.failed == 1
+    assert len(summary.latencies) == 5
+    assert summary.as_dict()["filingLatencyMax"] is not None
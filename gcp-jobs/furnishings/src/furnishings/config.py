@@ -95,11 +95,17 @@ class _Config:
     # Letter - GCP Gotenberg report service
     REPORT_API_GOTENBERG_AUDIENCE = os.getenv("REPORT_API_GOTENBERG_AUDIENCE", "")
     REPORT_API_GOTENBERG_URL = os.getenv("REPORT_API_GOTENBERG_URL", "https://")
+    # number of letters rendered by gotenberg at the same time
+    REPORT_API_GOTENBERG_WORKERS = int(os.getenv("REPORT_API_GOTENBERG_WORKERS", "5"))
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_PATH", "report-templates")
     # Letter - MRAS
     MRAS_SVC_URL = os.getenv("MRAS_SVC_URL")
     MRAS_SVC_API_KEY = os.getenv("MRAS_SVC_API_KEY")
 
+    # concurrent auth contact lookups and furnishings committed per transaction in stage one
+    FURNISHINGS_AUTH_WORKERS = int(os.getenv("FURNISHINGS_AUTH_WORKERS", "8"))
+    FURNISHINGS_COMMIT_SIZE = int(os.getenv("FURNISHINGS_COMMIT_SIZE", "500"))
+
 
 class DevelopmentConfig(_Config):
     """Development environment configuration."""
@@ -16,13 +16,15 @@
 NOTE: This is copied from legal-api.
 It was decided not to turn this into a common service as it is only used in 2 places."""
 import io
-from typing import Final
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Final
 
-import PyPDF2
 from flask import current_app
 from sqlalchemy import text
 
 from business_model.models import Furnishing, db
+from furnishings.services.pdf_concatenator import PdfConcatenator
 from furnishings.services.reports.report_v2 import ReportTypes, ReportV2
 
 COVER_REPORT_DATE_FORMAT: Final = "%B %d, %Y %I:%M:%S %p"
@@ -42,28 +44,64 @@ class FurnishingDocumentsService:
 
     def get_merged_furnishing_document(self, furnishings: list) -> bytes:
         """Return a merged batch furnishing document with cover."""
-        pdfs = self._get_batch_furnishing_documents(furnishings)
+        with tempfile.TemporaryDirectory() as spool_dir:
+            files = self.spool_merged_furnishing_documents(furnishings, spool_dir)
+            try:
+                writer_buffer = io.BytesIO()
+                self.merge_documents(files, writer_buffer)
+                return writer_buffer.getvalue()
+            except Exception as e:
+                current_app.logger.error(f"Error merging PDF:{e}")
+                return None
+
+    def spool_merged_furnishing_documents(self, furnishings: list, spool_dir: str) -> dict:
+        """Render the batch furnishing documents and cover into files in spool_dir.
+
+        Return the file paths in the shape merge_documents expects, so the rendered letters are not held in memory
+        while the batch is generated.
+        """
+        pdfs = self._get_batch_furnishing_documents(furnishings, spool_dir)
         cover = self._get_batch_cover(pdfs)
-        files = {
-            "cover": cover,
+        return {
+            "cover": self._spool(cover, spool_dir) if cover else None,
             "contents": pdfs
         }
-        return self._merge_documents(files)
 
-    def _get_batch_furnishing_documents(self, furnishings: list) -> list:
+    def _get_batch_furnishing_documents(self, furnishings: list, spool_dir: str) -> list:
+        """Render the furnishing documents concurrently and return the paths of the spooled pdfs in order."""
         self._report._document_key = ReportTypes.DISSOLUTION  # pylint: disable=protected-access
+        workers = current_app.config.get("REPORT_API_GOTENBERG_WORKERS")
+
+        def _render(pdf_request: dict) -> str | None:
+            # runs in a worker thread: no database or app context access, only the render and the spool
+            pdf = ReportV2.post_pdf_request(pdf_request)
+            return self._spool(pdf, spool_dir) if pdf else None
+
         pdfs = []
-        for f in furnishings:
-            self._report.set_report_data(business=f.business, furnishing=f)
-            pdf = self._report.get_pdf()
-            if not pdf:
-                current_app.logger.error(
-                    f"Error generating PDF for furnishing {f.id}, business {f.business.id}, skip."
-                )
-                continue
-            pdfs.append(pdf)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # build the requests a window at a time so only a few rendered letters are held in memory at once
+            window = workers * 2
+            for start in range(0, len(furnishings), window):
+                chunk = furnishings[start:start + window]
+                pdf_requests = []
+                for f in chunk:
+                    self._report.set_report_data(business=f.business, furnishing=f)
+                    pdf_requests.append(self._report.get_pdf_request())
+                for f, pdf in zip(chunk, executor.map(_render, pdf_requests), strict=True):
+                    if not pdf:
+                        current_app.logger.error(
+                            f"Error generating PDF for furnishing {f.id}, business {f.business.id}, skip."
+                        )
+                        continue
+                    pdfs.append(pdf)
         return pdfs
 
+    @staticmethod
+    def _spool(pdf: bytes, spool_dir: str) -> str:
+        with tempfile.NamedTemporaryFile(dir=spool_dir, suffix=".pdf", delete=False) as spool_file:
+            spool_file.write(pdf)
+            return spool_file.name
+
     def _get_batch_cover(self, files: list) -> bytes:
         self._report._document_key = ReportTypes.DISSOLUTION_COVER
         self._report._report_data = {
@@ -81,21 +119,18 @@ class FurnishingDocumentsService:
         return cover
 
     @staticmethod
-    def _merge_documents(files: dict) -> bytes:
-        try:
-            merger = PyPDF2.PdfMerger()
-            if files["cover"]:
-                merger.append(io.BytesIO(files["cover"]))
-            contents = files["contents"]
-            for _, pdf in enumerate(contents):
-                merger.append(io.BytesIO(pdf))
-            writer_buffer = io.BytesIO()
-            merger.write(writer_buffer)
-            merger.close()
-            return writer_buffer.getvalue()
-        except Exception as e:
-            current_app.logger.error(f"Error merging PDF:{e}")
-            return None
+    def merge_documents(files: dict, output: BinaryIO):
+        """Merge the spooled cover and contents pdfs (file paths) into output.
+
+        The merged document is written to output as each pdf is read, with one letter in memory at a time,
+        so output can be the remote SFTP file and memory stays flat however many letters are in the batch.
+        """
+        concatenator = PdfConcatenator(output)
+        if files["cover"]:
+            concatenator.append(files["cover"])
+        for pdf in files["contents"]:
+            concatenator.append(pdf)
+        concatenator.close()
 
     @staticmethod
     def _get_batch_custom_identifier() -> int:
@@ -0,0 +1,124 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This writes the pages of many pdfs into one pdf as they are read.
+
+PyPDF2's PdfMerger keeps every input and the whole merged document in memory until it is written.
+PdfConcatenator instead renumbers the objects of one input at a time and writes them straight to the output,
+keeping only the byte offset of each object written and the page object numbers (8 bytes each) for the cross
+reference table and page tree written at the end.
+"""
+import copy
+from array import array
+from typing import BinaryIO
+
+import PyPDF2
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, StreamObject
+
+_CATALOG = 1
+_PAGES = 2
+
+
+class PdfConcatenator:
+    """Concatenate the pages of pdfs into output, holding one input pdf in memory at a time."""
+
+    def __init__(self, output: BinaryIO):
+        """Start the merged pdf in output."""
+        self._output = output
+        self._position = 0
+        # indexed by object number, object 0 is the head of the free list
+        self._offsets = array("Q", [0] * (_PAGES + 1))
+        self._page_numbers = array("Q")
+        self.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def write(self, data: bytes):
+        """Write data to output, tracking the position for the cross reference table."""
+        self._output.write(data)
+        self._position += len(data)
+
+    def append(self, path: str):
+        """Write the pages of the pdf at path, with every object they use."""
+        reader = PyPDF2.PdfReader(path)
+        numbers = {}  # (object number, generation) in the input -> object number in the output
+        pending = []
+
+        def _reference(reference: IndirectObject) -> IndirectObject:
+            key = (reference.idnum, reference.generation)
+            if key not in numbers:
+                numbers[key] = self._allocate()
+                pending.append(reference)
+            return IndirectObject(numbers[key], 0, None)
+
+        def _renumber(obj):
+            if isinstance(obj, IndirectObject):
+                return _reference(obj)
+            if isinstance(obj, (DictionaryObject, ArrayObject)):
+                # direct objects can be shared, e.g. the attributes pages inherit, so renumber a copy
+                obj = copy.copy(obj)
+            if isinstance(obj, DictionaryObject):
+                for key, value in list(obj.items()):
+                    # a stream writes its own length
+                    if not (key == "/Length" and isinstance(obj, StreamObject)):
+                        obj[key] = _renumber(value)
+            elif isinstance(obj, ArrayObject):
+                for index, value in enumerate(obj):
+                    obj[index] = _renumber(value)
+            return obj
+
+        # number the pages first, so objects pointing back at a page (e.g. annotations) reuse its number
+        pages = list(reader.pages)
+        for page in pages:
+            reference = page.indirect_reference
+            numbers[(reference.idnum, reference.generation)] = self._allocate()
+
+        for page in pages:
+            reference = page.indirect_reference
+            number = numbers[(reference.idnum, reference.generation)]
+            # the inherited attributes were copied onto the page when the reader flattened the page tree
+            page = _renumber(DictionaryObject({key: value for key, value in page.items() if key != "/Parent"}))
+            page[NameObject("/Parent")] = IndirectObject(_PAGES, 0, None)
+            self._write_object(number, page)
+            self._page_numbers.append(number)
+
+        while pending:
+            reference = pending.pop()
+            self._write_object(numbers[(reference.idnum, reference.generation)],
+                               _renumber(reference.get_object()))
+
+    def close(self):
+        """Write the page tree, catalog and cross reference table that finish the merged pdf."""
+        self._offsets[_PAGES] = self._position
+        self.write(f"{_PAGES} 0 obj\n<< /Type /Pages /Count {len(self._page_numbers)} /Kids [".encode())
+        for number in self._page_numbers:
+            self.write(f" {number} 0 R".encode())
+        self.write(b" ] >>\nendobj\n")
+        self._offsets[_CATALOG] = self._position
+        self.write(f"{_CATALOG} 0 obj\n<< /Type /Catalog /Pages {_PAGES} 0 R >>\nendobj\n".encode())
+
+        xref_position = self._position
+        size = len(self._offsets)
+        self.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+        for number in range(1, size):
+            self.write(f"{self._offsets[number]:010d} 00000 n \n".encode())
+        self.write(f"trailer\n<< /Size {size} /Root {_CATALOG} 0 R >>\n"
+                   f"startxref\n{xref_position}\n%%EOF\n".encode())
+
+    def _allocate(self) -> int:
+        self._offsets.append(0)
+        return len(self._offsets) - 1
+
+    def _write_object(self, number: int, obj):
+        self._offsets[number] = self._position
+        self.write(f"{number} 0 obj\n".encode())
+        obj.write_to_stream(self, None)
+        self.write(b"\nendobj\n")
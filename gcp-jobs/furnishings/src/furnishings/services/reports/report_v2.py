@@ -67,6 +67,14 @@ class ReportV2:
 
     def get_pdf(self):
         """Render the furnishing document pdf response."""
+        return ReportV2.post_pdf_request(self.get_pdf_request())
+
+    def get_pdf_request(self) -> dict:
+        """Return the gotenberg request for the current report data.
+
+        Building the request reads the database, so it must happen in the app context; posting it with
+        post_pdf_request does not, which lets several documents render concurrently.
+        """
         headers = {}
         token = ReportV2.get_report_api_token()
         if token:
@@ -77,8 +85,13 @@ class ReportV2:
             "template": self._get_template(),
             "templateVars": self._get_template_data()
         }
-        files = self._get_report_files(data)
-        response = requests.post(url=url, headers=headers, data=REPORT_META_DATA, files=files, timeout=1800.0)
+        return {"url": url, "headers": headers, "files": self._get_report_files(data)}
+
+    @staticmethod
+    def post_pdf_request(pdf_request: dict):
+        """Post a request from get_pdf_request to gotenberg and return the pdf content."""
+        response = requests.post(url=pdf_request["url"], headers=pdf_request["headers"], data=REPORT_META_DATA,
+                                 files=pdf_request["files"], timeout=1800.0)
 
         if response.status_code != HTTPStatus.OK:
             return None
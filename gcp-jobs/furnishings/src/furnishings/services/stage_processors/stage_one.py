@@ -13,7 +13,10 @@
 # limitations under the License.
 """Furnishings job processing rules for stage one of involuntary dissolution."""
 import base64
+import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import UTC, datetime
 from http import HTTPStatus
 from io import BytesIO
@@ -21,6 +24,7 @@ from io import BytesIO
 import pytz
 import requests
 from flask import Flask, current_app
+from requests.adapters import HTTPAdapter
 from simple_cloudevent import SimpleCloudEvent, to_queue_message
 
 from business_account import AccountService
@@ -49,10 +53,16 @@ class StageOneProcessor:
         self._xpro_mail_furnishings = []
         self._bc_letters = None
         self._xpro_letters = None
+        self._letters_dir = None
         self._disable_bcmail_sftp = None
 
         self._bcmail_sftp_connection = None
 
+        # contact emails resolved for this run, by business identifier
+        self._emails = {}
+        self._auth_calls = 0
+        self._pending_emails = []
+
         if app and queue:
             self.init_app(app, queue)
     
@@ -85,20 +95,46 @@ class StageOneProcessor:
                 .filter(Batch.batch_type == Batch.BatchType.INVOLUNTARY_DISSOLUTION)
                 .filter(Batch.status == Batch.BatchStatus.PROCESSING)
             ).all()
-            for batch_processing in batch_processings:
-                self.process_batch(batch_processing)
+            furnishings = self._get_furnishings(batch_processings)
+            # look up the contacts of every business getting its first notice up front, instead of one at a time
+            self._prefetch_email_addresses([
+                batch_processing.business_identifier for batch_processing in batch_processings
+                if not furnishings.get((batch_processing.batch_id, batch_processing.business_id))
+            ])
+
+            commit_size = self._app.config.get("FURNISHINGS_COMMIT_SIZE")
+            for index, batch_processing in enumerate(batch_processings, start=1):
+                self.process_batch(
+                    batch_processing, furnishings.get((batch_processing.batch_id, batch_processing.business_id), [])
+                )
+                if index % commit_size == 0:
+                    self._commit_and_send_emails()
+            self._commit_and_send_emails()
+            self._app.logger.info(
+                f"Stage one processed {len(batch_processings)} businesses "
+                f"with {self._auth_calls} auth API calls for {len(self._emails)} contacts."
+            )
+
             self.generate_paper_letters()
             self.process_paper_letters()
 
         except (OSError, Exception) as err:
             current_app.logger.error(err)
-
-    def process_batch(self, batch_processing: BatchProcessing):
-        """Process batch_processing entry."""
-        furnishings = Furnishing.find_by(
-                batch_id=batch_processing.batch_id,
-                business_id=batch_processing.business_id
-                )
+        finally:
+            if self._letters_dir:
+                self._letters_dir.cleanup()
+                self._letters_dir = None
+
+    def process_batch(self, batch_processing: BatchProcessing, furnishings: list[Furnishing] | None = None):
+        """Process batch_processing entry.
+
+        New furnishings are added to the session; process commits them in batches.
+        """
+        if furnishings is None:
+            furnishings = Furnishing.find_by(
+                    batch_id=batch_processing.batch_id,
+                    business_id=batch_processing.business_id
+                    )
         if not furnishings:
             self._send_first_round_notification(batch_processing, batch_processing.business)
         else:
@@ -127,29 +163,113 @@ class StageOneProcessor:
             if has_elapsed_email_entry and not has_mail_entry:
                 self._send_second_round_notification(batch_processing)
 
+    @staticmethod
+    def _get_furnishings(batch_processings: list[BatchProcessing]) -> dict:
+        """Return the existing furnishings of the batch processing entries by (batch_id, business_id)."""
+        furnishings = {}
+        if not batch_processings:
+            return furnishings
+        batch_ids = {batch_processing.batch_id for batch_processing in batch_processings}
+        business_ids = {batch_processing.business_id for batch_processing in batch_processings}
+        for furnishing in (
+            db.session.query(Furnishing)
+            .filter(Furnishing.batch_id.in_(batch_ids))
+            .filter(Furnishing.business_id.in_(business_ids))
+        ).all():
+            furnishings.setdefault((furnishing.batch_id, furnishing.business_id), []).append(furnishing)
+        return furnishings
+
+    def _prefetch_email_addresses(self, identifiers: list[str]):
+        """Resolve the contact emails of the businesses concurrently over one pooled session and token."""
+        identifiers = [identifier for identifier in dict.fromkeys(identifiers) if identifier not in self._emails]
+        if not identifiers:
+            return
+        app = self._app
+        workers = app.config.get("FURNISHINGS_AUTH_WORKERS")
+        try:
+            token = AccountService.get_bearer_token()
+        except requests.exceptions.RequestException as err:
+            # the contacts are then looked up one business at a time as they are processed
+            app.logger.error(f"Unable to get a token to look up the contacts in bulk: {err}")
+            return
+        with requests.Session() as session:
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+            def _lookup(identifier: str) -> str | None:
+                with app.app_context():
+                    return self._get_email_address_from_auth(identifier, token, session)
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for identifier, email in zip(identifiers, executor.map(_lookup, identifiers), strict=True):
+                    self._emails[identifier] = email
+        self._auth_calls += len(identifiers)
+
+    def _get_email_address(self, identifier: str) -> str | None:
+        """Return the contact email of the business, from the run cache when it was prefetched."""
+        if identifier not in self._emails:
+            self._emails[identifier] = self._get_email_address_from_auth(identifier)
+            self._auth_calls += 1
+        return self._emails[identifier]
+
+    def _commit_and_send_emails(self):
+        """Commit the furnishings created so far, then queue the emails for them (the emailer reads them back)."""
+        db.session.commit()
+        for furnishing in self._pending_emails:
+            self._send_email(furnishing)
+            self._app.logger.debug(
+                f"Successfully put email message on the queue for furnishing entry with ID: {furnishing.id}")
+        self._pending_emails = []
+
     def generate_paper_letters(self):
-        """Generate merged paper letter with cover for BC/XPRO businesses."""
+        """Generate paper letters with cover for BC/XPRO businesses.
+
+        The letters are spooled to a temporary directory and merged into the upload one letter at a time,
+        so memory stays flat however many letters are in the batch.
+        """
         self._app.logger.debug("Start generating batch letters.")
         try:
             document_service = FurnishingDocumentsService(ReportTypes.DISSOLUTION, "greyscale")
+            if self._bc_mail_furnishings or self._xpro_mail_furnishings:
+                self._letters_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
             if self._bc_mail_furnishings:
                 self._app.logger.debug("Start generating BC batch letter.")
-                self._bc_letters = document_service.get_merged_furnishing_document(self._bc_mail_furnishings)
+                self._bc_letters = document_service.spool_merged_furnishing_documents(self._bc_mail_furnishings,
+                                                                                      self._letters_dir.name)
                 self._app.logger.debug("Finish generating BC batch letter.")
             if self._xpro_mail_furnishings:
                 self._app.logger.debug("Start generating XPRO batch letter.")
-                self._xpro_letters = document_service.get_merged_furnishing_document(self._xpro_mail_furnishings)
+                self._xpro_letters = document_service.spool_merged_furnishing_documents(self._xpro_mail_furnishings,
+                                                                                        self._letters_dir.name)
                 self._app.logger.debug("Finish generating XPRO batch letter.")
         except Exception as e:
             self._app.logger.error(f"Error generating batch letters: {e}")
         self._app.logger.debug("Finish generating batch letters.")
 
     def upload_to_sftp(self, client, data, filename):
-        """SFTP data to targeted destination."""
-        return client.putfo(
-            fl=BytesIO(data),
-            remotepath=f'{self._app.config.get("BCMAIL_SFTP_STORAGE_DIRECTORY")}/{filename}'
-        )
+        """SFTP data to targeted destination.
+
+        data is either the pdf bytes or the spooled letters from generate_paper_letters. Spooled letters are
+        merged into a temporary remote file that is only renamed to filename once the merge is complete,
+        so a failed merge never leaves a partial letter under the name BCMail+ picks up.
+        """
+        remotepath = f'{self._app.config.get("BCMAIL_SFTP_STORAGE_DIRECTORY")}/{filename}'
+        if isinstance(data, dict):
+            partial_remotepath = f"{remotepath}.part"
+            try:
+                with client.open(partial_remotepath, "wb") as remote_file:
+                    remote_file.set_pipelined(True)
+                    FurnishingDocumentsService.merge_documents(data, remote_file)
+                # replace a letter uploaded earlier the same day, as putfo does
+                with suppress(FileNotFoundError):
+                    client.remove(remotepath)
+                client.rename(partial_remotepath, remotepath)
+            except Exception:
+                with suppress(OSError):
+                    client.remove(partial_remotepath)
+                raise
+            return client.stat(remotepath)
+        return client.putfo(fl=BytesIO(data), remotepath=remotepath)
 
     def update_notes_and_status(self, furnishings_list, funishing_status, furnishing_notes=None):
         """Update the notes and status of furnishing entries in a list."""
@@ -157,7 +277,8 @@ class StageOneProcessor:
             furnishing.notes = furnishing_notes
             furnishing.status = funishing_status
             furnishing.processed_date = datetime.now(UTC)
-            furnishing.save()
+            db.session.add(furnishing)
+        db.session.commit()
 
     def process_paper_letters(self):
         """Process the generated paper letts of BC and XPRO businesses (SFTP)."""
@@ -215,13 +336,13 @@ class StageOneProcessor:
         )
         if not eligible_details:
             return
-        # send email/letter notification for the first time
-        email = self._get_email_address_from_auth(batch_processing.business_identifier)
+        # send email/letter notification for the first time, a paper letter if business doesn't have email address
+        email = self._get_email_address(batch_processing.business_identifier)
         business = Business.find_by_identifier(batch_processing.business_identifier)
         new_furnishing = self._create_new_furnishing(
                 batch_processing,
                 eligible_details,
-                Furnishing.FurnishingType.EMAIL,
+                Furnishing.FurnishingType.EMAIL if email else Furnishing.FurnishingType.MAIL,
                 business.last_ar_date if business.last_ar_date else business.founding_date,
                 business.legal_name,
                 email
@@ -235,22 +356,12 @@ class StageOneProcessor:
             self._app.logger.debug(f"Created address (first round) with furnishing ID: {new_furnishing.id}")
 
         if email:
-            # send email letter
-            self._send_email(new_furnishing)
-            self._app.logger.debug(
-                f"Successfully put email message on the queue for furnishing entry with ID: {new_furnishing.id}")
+            # the email is queued once the furnishing is committed
+            self._pending_emails.append(new_furnishing)
+        elif business.legal_type == Business.LegalTypes.EXTRA_PRO_A.value:
+            self._xpro_mail_furnishings.append(new_furnishing)
         else:
-            # send paper letter if business doesn't have email address
-            new_furnishing.furnishing_type = Furnishing.FurnishingType.MAIL
-            new_furnishing.save()
-            self._app.logger.debug(f"Changed furnishing type to MAIL for funishing with ID: {new_furnishing.id}")
-
-            if business.legal_type == Business.LegalTypes.EXTRA_PRO_A.value:
-                self._xpro_mail_furnishings.append(new_furnishing)
-            else:
-                self._bc_mail_furnishings.append(new_furnishing)
-
-            new_furnishing.save()
+            self._bc_mail_furnishings.append(new_furnishing)
 
     def _send_second_round_notification(self, batch_processing: BatchProcessing):
         """Send paper letter if business is still not in good standing after 5 days of email letter sent out."""
@@ -283,8 +394,6 @@ class StageOneProcessor:
         else:
             self._bc_mail_furnishings.append(new_furnishing)
 
-        new_furnishing.save()
-
     def _create_new_furnishing(  # noqa: PLR0913
             self,
             batch_processing: BatchProcessing,
@@ -294,7 +403,7 @@ class StageOneProcessor:
             business_name: str,
             email: str | None = None
             ) -> Furnishing:
-        """Create new furnishing entry."""
+        """Create new furnishing entry, flushed but not committed."""
         business = batch_processing.business
         if business.legal_type == Business.LegalTypes.EXTRA_PRO_A.value:
             furnishing_name = (
@@ -325,7 +434,8 @@ class StageOneProcessor:
             business_name=business_name,
             email=email
         )
-        new_furnishing.save()
+        db.session.add(new_furnishing)
+        db.session.flush()
 
         return new_furnishing
 
@@ -342,7 +452,7 @@ class StageOneProcessor:
             delivery_instructions=mailing_address.delivery_instructions,
             furnishings_id=furnishings_id
         )
-        furnishing_address.save()
+        db.session.add(furnishing_address)
 
         return furnishing_address
 
@@ -383,9 +493,11 @@ class StageOneProcessor:
             return None
 
     @staticmethod
-    def _get_email_address_from_auth(identifier: str):
+    def _get_email_address_from_auth(identifier: str,
+                                     token: str | None = None,
+                                     session: requests.Session | None = None):
         """Return email address from auth for notification, return None if it doesn't have one."""
-        token = AccountService.get_bearer_token()
+        token = token or AccountService.get_bearer_token()
         headers = {
             "Accept": "application/json",
             "Authorization": f"Bearer {token}"
@@ -393,7 +505,7 @@ class StageOneProcessor:
 
         url = f'{current_app.config["AUTH_SVC_URL"]}/entities/{identifier}'
         try:
-            contact_info = requests.get(url, headers=headers)
+            contact_info = (session or requests).get(url, headers=headers)
             contact_info.raise_for_status()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == HTTPStatus.NOT_FOUND:
@@ -20,6 +20,7 @@ import copy
 import datetime
 from unittest.mock import MagicMock, patch
 
+import PyPDF2
 import pytest
 from registry_schemas.example_data import FILING_HEADER, RESTORATION
 
@@ -148,6 +149,42 @@ def test_process_first_notification(requests_mock, app, session, test_name, enti
             assert furnishing_address.business_id == None
             assert furnishing_address.office_id == None
 
+def test_process_first_notification_bulk_contacts(requests_mock, app, session):
+    """Assert that the contacts of a run are looked up once each, with one token, before the furnishings are made."""
+    requests_mock.post(app.config.get("ACCOUNT_SVC_AUTH_URL"), json={"access_token": "token"})
+    batch = factory_batch()
+    identifiers = ["BC0000001", "BC0000002", "BC0000003"]
+    entity_mocks = {}
+    for identifier in identifiers:
+        business = factory_business(identifier=identifier)
+        factory_batch_processing(batch_id=batch.id, business_id=business.id, identifier=identifier)
+        url = f"{app.config['AUTH_SVC_URL']}/entities/{identifier}"
+        if identifier == "BC0000003":
+            entity_mocks[identifier] = requests_mock.get(url, status_code=404)
+        else:
+            entity_mocks[identifier] = requests_mock.get(url, json={"contacts": [{"email": f"{identifier}@no-reply.com"}]})
+
+    qsm = MagicMock()
+    with patch.object(StageOneProcessor, "_send_email", return_value=None) as mock_send_email, \
+        patch.object(FurnishingDocumentsService, "spool_merged_furnishing_documents",
+                     return_value={"cover": None, "contents": []}):
+        processor = StageOneProcessor(app, qsm)
+        processor.process()
+
+    assert all(entity_mock.call_count == 1 for entity_mock in entity_mocks.values())
+    assert processor._auth_calls == len(identifiers)
+    assert mock_send_email.call_count == 2
+    for identifier in identifiers:
+        furnishings = Furnishing.find_by(business_id=Business.find_by_identifier(identifier).id)
+        assert len(furnishings) == 1
+        if identifier == "BC0000003":
+            assert furnishings[0].furnishing_type == Furnishing.FurnishingType.MAIL
+            assert furnishings[0] in processor._bc_mail_furnishings
+        else:
+            assert furnishings[0].furnishing_type == Furnishing.FurnishingType.EMAIL
+            assert furnishings[0].email == f"{identifier}@no-reply.com"
+
+
 @pytest.mark.parametrize(
     "test_name, has_email_furnishing, has_mail_furnishing, is_email_elapsed", [
         (
@@ -279,7 +316,8 @@ def test_generate_paper_letters(app, session, test_name, entity_type):
 
     qsm = MagicMock()
     with patch.object(StageOneProcessor, "_get_email_address_from_auth", return_value=email), \
-        patch.object(FurnishingDocumentsService, "get_merged_furnishing_document", return_value=b"TEST") as mock_get_document:
+        patch.object(FurnishingDocumentsService, "spool_merged_furnishing_documents",
+                     return_value={"cover": None, "contents": []}) as mock_get_document:
         StageOneProcessor(app, qsm).process()
         if test_name == "TEST_NO_GENERATION":
             mock_get_document.assert_not_called()
@@ -342,3 +380,40 @@ def test_process_paper_letters(app, session, sftpserver, sftpconnection, test_na
                 # Assert the correct note is added based on the entity type
                 expected_note = "SFTP of BC batch letter was a success" if entity_type == Business.LegalTypes.COMP.value else "SFTP of XPRO batch letter was a success"
                 assert expected_note in updated_furnishing.notes
+
+
+def test_upload_spooled_letters(app, sftpserver, sftpconnection, tmp_path):
+    """Assert that spooled letters are merged into a temporary file that is renamed once complete."""
+    def _spool_blank_pdf(name):
+        path = tmp_path / name
+        writer = PyPDF2.PdfWriter()
+        writer.add_blank_page(width=72, height=72)
+        with open(path, "wb") as pdf_file:
+            writer.write(pdf_file)
+        return str(path)
+
+    files = {
+        "cover": _spool_blank_pdf("cover.pdf"),
+        "contents": [_spool_blank_pdf("letter_1.pdf"), _spool_blank_pdf("letter_2.pdf")]
+    }
+    processor = StageOneProcessor(app, MagicMock())
+    storage_directory = app.config.get("BCMAIL_SFTP_STORAGE_DIRECTORY")
+    with sftpserver.serve_content({storage_directory: {}}), sftpconnection as client:
+        resp = processor.upload_to_sftp(client, files, "letters.pdf")
+
+        assert resp.st_size
+        with client.open(f"{storage_directory}/letters.pdf", "rb") as uploaded:
+            assert len(PyPDF2.PdfReader(uploaded).pages) == 3
+        assert client.listdir(storage_directory) == ["letters.pdf"]
+
+
+def test_upload_spooled_letters_merge_error(app, sftpserver, sftpconnection):
+    """Assert that a failed merge leaves no file behind."""
+    files = {"cover": None, "contents": ["missing.pdf"]}
+    processor = StageOneProcessor(app, MagicMock())
+    storage_directory = app.config.get("BCMAIL_SFTP_STORAGE_DIRECTORY")
+    with sftpserver.serve_content({storage_directory: {}}), sftpconnection as client:
+        with pytest.raises(FileNotFoundError):
+            processor.upload_to_sftp(client, files, "letters.pdf")
+
+        assert client.listdir(storage_directory) == []
@@ -0,0 +1,88 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the pdf concatenator."""
+import tracemalloc
+
+import PyPDF2
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject, RectangleObject
+
+from furnishings.services.pdf_concatenator import PdfConcatenator
+
+
+def _spool_letter(tmp_path, index: int) -> str:
+    """Write a two page letter with its own text, a shared font and a link annotation."""
+    writer = PyPDF2.PdfWriter()
+    font = writer._add_object(DictionaryObject({  # pylint: disable=protected-access
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica")
+    }))
+    for page_number in range(2):
+        writer.add_blank_page(width=612, height=792)
+        page = writer.pages[-1]
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (letter {index} page {page_number}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)  # pylint: disable=protected-access
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+    writer.add_uri(1, "https://www.bcregistry.ca", RectangleObject([0, 0, 100, 100]))
+    path = tmp_path / f"letter_{index}.pdf"
+    with open(path, "wb") as pdf_file:
+        writer.write(pdf_file)
+    return str(path)
+
+
+def test_concatenate(tmp_path):
+    """Assert that the pages of every pdf are written in order, with their contents and annotations."""
+    letters = [_spool_letter(tmp_path, index) for index in range(3)]
+    merged = tmp_path / "merged.pdf"
+
+    with open(merged, "wb") as output:
+        concatenator = PdfConcatenator(output)
+        for letter in letters:
+            concatenator.append(letter)
+        concatenator.close()
+
+    reader = PyPDF2.PdfReader(str(merged), strict=True)
+    assert [page.extract_text() for page in reader.pages] == \
+        [f"letter {index} page {page_number}" for index in range(3) for page_number in range(2)]
+    link = reader.pages[5]["/Annots"][0].get_object()
+    assert link["/A"]["/URI"] == "https://www.bcregistry.ca"
+
+
+def test_concatenate_memory(tmp_path):
+    """Assert that concatenating holds a small fraction of what PdfMerger holds for the same batch."""
+    letters = [_spool_letter(tmp_path, index) for index in range(200)]
+
+    tracemalloc.start()
+    with open(tmp_path / "merged.pdf", "wb") as output:
+        concatenator = PdfConcatenator(output)
+        for letter in letters:
+            concatenator.append(letter)
+        concatenator.close()
+    concatenator_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    merger = PyPDF2.PdfMerger()
+    for letter in letters:
+        merger.append(letter)
+    with open(tmp_path / "merged_in_memory.pdf", "wb") as output:
+        merger.write(output)
+    merger.close()
+    merger_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert concatenator_peak < merger_peak / 4, f"concatenator {concatenator_peak}, merger {merger_peak}"
@@ -75,6 +75,15 @@ class _Config:  # pylint: disable=too-few-public-methods
     PUBLISHER_AUDIENCE = os.getenv("PUBLISHER_AUDIENCE", "https://pubsub.googleapis.com/google.pubsub.v1.Publisher")
     BUSINESS_FILER_TOPIC = os.getenv("BUSINESS_FILER_TOPIC", "")
 
+    # Dispatcher: the rate should match what the filer can apply; 0 disables throttling.
+    FUTURE_EFFECTIVE_MAX_WORKERS = int(os.getenv("FUTURE_EFFECTIVE_MAX_WORKERS", "4"))
+    FUTURE_EFFECTIVE_BATCH_SIZE = int(os.getenv("FUTURE_EFFECTIVE_BATCH_SIZE", "50"))
+    FUTURE_EFFECTIVE_RATE_LIMIT = float(os.getenv("FUTURE_EFFECTIVE_RATE_LIMIT", "10"))
+    # unset by default: a repeat publish is skipped by the filer, the checkpoint only avoids sending it and has to
+    # be on a mounted volume to outlive the container
+    FUTURE_EFFECTIVE_CHECKPOINT_FILE = os.getenv("FUTURE_EFFECTIVE_CHECKPOINT_FILE", None)
+    FUTURE_EFFECTIVE_REQUEUE_AFTER = int(os.getenv("FUTURE_EFFECTIVE_REQUEUE_AFTER", "3600"))
+
     SECRET_KEY = "a secret"
 
     TESTING = False
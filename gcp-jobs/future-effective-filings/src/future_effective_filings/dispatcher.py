@@ -0,0 +1,181 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dispatch due future effective filings to the entity filer queue.
+
+Filings are published concurrently by a bounded pool of workers, throttled to the rate the filer can absorb.
+
+Publishing a filing more than once is safe: every message for a filing carries the same cloud event id, and the
+filer locks the filing row and skips a filing that is already completed, so the filing is applied once. That is
+what makes a rerun (e.g. after a crash part way through a large backlog) idempotent. The optional checkpoint file
+(FUTURE_EFFECTIVE_CHECKPOINT_FILE, unset by default) only saves the repeat publishes of the filings already queued,
+and only across runs that share the file, i.e. when it is on a mounted volume rather than the container's disk.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from flask import Flask
+from simple_cloudevent import SimpleCloudEvent, to_queue_message
+
+# namespace for the deterministic cloud event ids, so every publish of a filing carries the same id
+FILING_MESSAGE_NAMESPACE = uuid.UUID("5f0c6a36-0c59-4d7c-9d0e-7c6a8c1c1f7e")
+
+
+@dataclass
+class RunSummary:
+    """Counts and latency of a dispatcher run."""
+
+    found: int = 0
+    queued: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        """Return the summary in the shape logged at the end of a run."""
+        latencies = sorted(self.latencies)
+        return {
+            "found": self.found,
+            "queued": self.queued,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "elapsedSeconds": round(self.elapsed, 3),
+            "filingsPerSecond": round(self.queued / self.elapsed, 1) if self.elapsed else 0,
+            "publishLatencyP50": round(latencies[len(latencies) // 2], 3) if latencies else None,
+            "publishLatencyMax": round(latencies[-1], 3) if latencies else None,
+        }
+
+
+class RateLimiter:
+    """Space calls evenly so that no more than rate_per_second are made across all threads."""
+
+    def __init__(self, rate_per_second: float):
+        """Create the limiter; a rate of 0 disables throttling."""
+        self._interval = 1 / rate_per_second if rate_per_second else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the caller may make its next call."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+        if (delay := slot - now) > 0:
+            time.sleep(delay)
+
+
+class Checkpoint:
+    """The filings queued by previous runs, persisted as {filing_id: queued_at epoch seconds}."""
+
+    def __init__(self, path: str | None, requeue_after: int):
+        """Load the checkpoint file at path; without a path nothing is persisted."""
+        self._path = path
+        self._requeue_after = requeue_after
+        self._queued: dict[str, float] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as checkpoint_file:
+                self._queued = json.load(checkpoint_file)
+
+    def was_queued(self, filing_id: int) -> bool:
+        """Return True if the filing was queued recently enough that the filer should still be applying it."""
+        queued_at = self._queued.get(str(filing_id))
+        return queued_at is not None and time.time() - queued_at < self._requeue_after
+
+    def mark_queued(self, filing_id: int):
+        """Record the filing as queued now."""
+        self._queued[str(filing_id)] = time.time()
+
+    def save(self, due_filing_ids: list[int]):
+        """Write the checkpoint, dropping filings that are no longer due (i.e. the filer has applied them)."""
+        if not self._path:
+            return
+        due = {str(filing_id) for filing_id in due_filing_ids}
+        self._queued = {filing_id: queued_at for filing_id, queued_at in self._queued.items() if filing_id in due}
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(self._queued, checkpoint_file)
+        os.replace(tmp_path, self._path)
+
+
+def get_filing_message(application: Flask, filing_id: int) -> SimpleCloudEvent:
+    """Return the filer queue message for the filing."""
+    return SimpleCloudEvent(
+        id=str(uuid.uuid5(FILING_MESSAGE_NAMESPACE, str(filing_id))),
+        source=application.config.get("CLIENT_NAME"),
+        subject=application.config["BUSINESS_FILER_TOPIC"],
+        time=datetime.now(UTC),
+        type="filingMessage",
+        data={"filingMessage": {"filingIdentifier": filing_id}}
+    )
+
+
+def dispatch(application: Flask, gcp_queue, filing_ids: list[int]) -> RunSummary:
+    """Put the filings on the filer queue and return a summary of the run.
+
+    A failure to publish one filing is logged and counted; the remaining filings are still dispatched.
+    """
+    start = time.perf_counter()
+    topic = application.config["BUSINESS_FILER_TOPIC"]
+    batch_size = application.config["FUTURE_EFFECTIVE_BATCH_SIZE"]
+    limiter = RateLimiter(application.config["FUTURE_EFFECTIVE_RATE_LIMIT"])
+    checkpoint = Checkpoint(application.config["FUTURE_EFFECTIVE_CHECKPOINT_FILE"],
+                            application.config["FUTURE_EFFECTIVE_REQUEUE_AFTER"])
+
+    filing_ids = list(dict.fromkeys(filing_ids))
+    summary = RunSummary(found=len(filing_ids))
+    pending = []
+    for filing_id in filing_ids:
+        if checkpoint.was_queued(filing_id):
+            application.logger.debug(f"Skipping filing {filing_id}, already queued by a previous run.")
+            summary.skipped += 1
+        else:
+            pending.append(filing_id)
+
+    def _publish(filing_id: int) -> tuple[int, float | None, Exception | None]:
+        # runs in a worker thread; the caller logs the outcome from the app context
+        limiter.wait()
+        published = time.perf_counter()
+        try:
+            gcp_queue.publish(topic, to_queue_message(get_filing_message(application, filing_id)))
+        except Exception as err:  # pylint: disable=broad-exception-caught;
+            return filing_id, None, err
+        return filing_id, time.perf_counter() - published, None
+
+    with ThreadPoolExecutor(max_workers=application.config["FUTURE_EFFECTIVE_MAX_WORKERS"]) as executor:
+        for index in range(0, len(pending), batch_size):
+            for filing_id, latency, err in executor.map(_publish, pending[index:index + batch_size]):
+                if err:
+                    application.logger.error(f"Failed to put filing {filing_id} on the queue: {err!r}")
+                    summary.failed += 1
+                    continue
+                application.logger.debug(f"Successfully put filing {filing_id} on the queue.")
+                checkpoint.mark_queued(filing_id)
+                summary.queued += 1
+                summary.latencies.append(latency)
+            # checkpoint each batch so a crash only repeats the batch in flight
+            checkpoint.save(filing_ids)
+    if not pending:
+        checkpoint.save(filing_ids)
+
+    summary.elapsed = time.perf_counter() - start
+    return summary
@@ -16,15 +16,13 @@
 This module script is for putting filings with future effective dates on the entity filer queue.
 """
 import os
-import uuid
-from datetime import UTC, datetime
 
 import requests
 from dotenv import find_dotenv, load_dotenv
 from flask import Flask
-from simple_cloudevent import SimpleCloudEvent, to_queue_message
 
 from future_effective_filings.config import get_named_config
+from future_effective_filings.dispatcher import dispatch
 from gcp_queue import GcpQueue
 from structured_logging import StructuredLogging
 
@@ -87,28 +85,17 @@ def get_filing_ids(app: Flask):
 
 def run(application: Flask):  # pylint: disable=redefined-outer-name
     """Run the methods for applying future effective filings."""
-    
     with application.app_context():
-        subject = application.config["BUSINESS_FILER_TOPIC"]
         try:
             if not (filing_ids := get_filing_ids(application)):
                 application.logger.debug("No filings found to apply.")
-            for filing_id in filing_ids:
-                application.logger.debug(f"Attempting to place filing on Filer Queue with id {filing_id}")
-                msg = {"filingMessage": {"filingIdentifier": filing_id}}
-                ce = SimpleCloudEvent(
-                    id=str(uuid.uuid4()),
-                    source=application.config.get("CLIENT_NAME"),
-                    subject=subject,
-                    time=datetime.now(UTC),
-                    type="filingMessage",
-                    data = msg
-                )
-                gcp_queue.publish(subject, to_queue_message(ce))
-                application.logger.debug(f"Successfully put filing {filing_id} on the queue.")
+                return
+            summary = dispatch(application, gcp_queue, filing_ids)
+            application.logger.info(f"Future effective filings run summary: {summary.as_dict()}")
         except Exception as err:  # pylint: disable=broad-except;
             application.logger.error(err)
 
+
 if __name__ == "__main__":
     application = create_app()
     try:
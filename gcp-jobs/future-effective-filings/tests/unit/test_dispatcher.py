@@ -0,0 +1,70 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the future effective filings dispatcher."""
+from unittest.mock import MagicMock, patch
+
+from future_effective_filings import create_app
+from future_effective_filings.dispatcher import dispatch
+
+
+def _create_app(checkpoint_file=None):
+    app = create_app("testing")
+    app.config.update(FUTURE_EFFECTIVE_RATE_LIMIT=0,
+                      FUTURE_EFFECTIVE_BATCH_SIZE=2,
+                      FUTURE_EFFECTIVE_CHECKPOINT_FILE=checkpoint_file)
+    return app
+
+
+def test_dispatch_continues_after_failure():
+    app = _create_app()
+    gcp_queue = MagicMock()
+    gcp_queue.publish.side_effect = [None, Exception("publish failed"), None, None]
+
+    with app.app_context():
+        summary = dispatch(app, gcp_queue, [1, 2, 3, 4, 4])
+
+    assert gcp_queue.publish.call_count == 4
+    assert summary.as_dict()["found"] == 4
+    assert summary.queued == 3
+    assert summary.failed == 1
+
+
+def test_dispatch_rerun_skips_queued_filings(tmp_path):
+    app = _create_app(str(tmp_path / "checkpoint.json"))
+    gcp_queue = MagicMock()
+
+    with app.app_context():
+        dispatch(app, gcp_queue, [1, 2, 3])
+        summary = dispatch(app, gcp_queue, [1, 2, 3, 5])
+
+    assert gcp_queue.publish.call_count == 4
+    assert summary.skipped == 3
+    assert summary.queued == 1
+
+
+def test_dispatch_rerun_without_checkpoint_repeats_event_ids():
+    """Without a checkpoint a rerun publishes again, with the event ids the filer sees as the same filings."""
+    app = _create_app()
+    gcp_queue = MagicMock()
+
+    # publish the cloud events themselves, to read their ids
+    with app.app_context(), patch("future_effective_filings.dispatcher.to_queue_message", lambda event: event):
+        dispatch(app, gcp_queue, [1, 2])
+        summary = dispatch(app, gcp_queue, [1, 2])
+
+    assert summary.skipped == 0
+    event_ids = [call.args[1].id for call in gcp_queue.publish.call_args_list]
+    assert len(event_ids) == 4
+    assert sorted(event_ids[:2]) == sorted(event_ids[2:])
+    assert len(set(event_ids)) == 2
@@ -24,7 +24,16 @@ from sqlalchemy import Date, cast, func
 from sqlalchemy.orm import aliased
 
 from business_common.core.filing import Filing as CoreFiling
-from business_model.models import Batch, BatchProcessing, Business, Configuration, Filing, Furnishing, db
+from business_model.models import (
+    Batch,
+    BatchProcessing,
+    Business,
+    Configuration,
+    DissolutionEligibility,
+    Filing,
+    Furnishing,
+    db,
+)
 from business_model.models.db import init_db
 from dissolution_service import InvoluntaryDissolutionService
 from gcp_queue import GcpQueue
@@ -178,6 +187,11 @@ def stage_1_process(app: Flask):  # pylint: disable=redefined-outer-name,too-man
             app.logger.debug("Skipping job run since batch job has already run today.")
             return
 
+        # catch up the eligibility of businesses changed outside the filer since the last run
+        refreshed = DissolutionEligibility.refresh_stale()
+        db.session.commit()
+        app.logger.debug(f"Refreshed the dissolution eligibility of {refreshed} businesses.")
+
         # get first NUM_DISSOLUTIONS_ALLOWED number of businesses
         num_dissolutions_allowed = Configuration.find_by_name(config_name="NUM_DISSOLUTIONS_ALLOWED").val
         businesses_eligible = InvoluntaryDissolutionService.get_businesses_eligible(num_dissolutions_allowed)
@@ -217,8 +231,9 @@ def stage_1_process(app: Flask):  # pylint: disable=redefined-outer-name,too-man
                 "overdueTransition": transition_overdue,
                 "stage_1_date": datetime.now(UTC).isoformat()
             }
-            batch_processing.save()
-            app.logger.debug(f"New batch processing has been created with ID: {batch_processing.id}")
+            db.session.add(batch_processing)
+        db.session.commit()
+        app.logger.debug(f"{len(businesses_eligible)} new batch processing entries created for batch {batch.id}")
 
 
     except Exception as err:  # pylint: disable=redefined-outer-name; noqa: B902
@@ -28,6 +28,7 @@ class _Config:
 
     JOB_TOTAL_LIMIT = int(os.getenv("JOB_TOTAL_LIMIT", "500"))
     JOB_BATCH_LIMIT = int(os.getenv("JOB_BATCH_LIMIT", "50"))
+    JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "5"))
 
     COLIN_SVC_URL = os.getenv("COLIN_API_URL", "") + os.getenv("COLIN_API_VERSION", "")
     COLIN_SVC_TIMEOUT = int(os.getenv("COLIN_SVC_TIMEOUT", "20"))
@@ -12,26 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Worker for the Update COLIN Filings service."""
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
 import requests
-from flask import current_app
+from flask import Flask, current_app
+from requests.adapters import HTTPAdapter
 
 from business_account import AccountService
 
 
-def get_filings(token, limit, offset):
-    """Get filings from LEAR that need syncing to COLIN."""
-    req = requests.get(f'{current_app.config["LEAR_SVC_URL"]}/businesses/internal/filings?offset={offset}&limit={limit}',
-                       headers={"Authorization": "Bearer " + token},
-                       timeout=current_app.config["LEAR_SVC_TIMEOUT"])
+def get_session(pool_size: int) -> requests.Session:
+    """Return a session whose connection pool can serve every worker thread."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_filings(token, limit, after_transaction_id=None, session=None):
+    """Get filings from LEAR that need syncing to COLIN.
+
+    Return the page of filings and the transaction id to continue the next page after.
+    """
+    params = {"limit": limit}
+    if after_transaction_id is not None:
+        params["afterTransactionId"] = after_transaction_id
+    req = (session or requests).get(f'{current_app.config["LEAR_SVC_URL"]}/businesses/internal/filings',
+                                    params=params,
+                                    headers={"Authorization": "Bearer " + token},
+                                    timeout=current_app.config["LEAR_SVC_TIMEOUT"])
     if not req or req.status_code != HTTPStatus.OK:
         current_app.logger.error(f"Failed to collect filings from legal-api. {req} {req.json()} {req.status_code}")
         raise Exception  # pylint: disable=broad-exception-raised
-    return req.json().get("filings")
+    return req.json().get("filings"), req.json().get("lastTransactionId")
 
 
-def send_filing(token: str, filing: dict, filing_id: str):
+def send_filing(token: str, filing: dict, filing_id: str, session: requests.Session | None = None):
     """Post to colin-api with filing."""
     clean_none(filing)
 
@@ -41,11 +60,12 @@ def send_filing(token: str, filing: dict, filing_id: str):
 
     response = None
     if legal_type and identifier and filing_type:
-        response = requests.post(f'{current_app.config["COLIN_SVC_URL"]}/businesses/{legal_type}/{identifier}/filings/{filing_type}',
-                                 headers={"Content-Type": "application/json",
-                                          "Authorization": "Bearer " + token},
-                                 json=filing,
-                                 timeout=current_app.config["COLIN_SVC_TIMEOUT"])
+        response = (session or requests).post(
+            f'{current_app.config["COLIN_SVC_URL"]}/businesses/{legal_type}/{identifier}/filings/{filing_type}',
+            headers={"Content-Type": "application/json",
+                     "Authorization": "Bearer " + token},
+            json=filing,
+            timeout=current_app.config["COLIN_SVC_TIMEOUT"])
 
     if not response or response.status_code != HTTPStatus.CREATED:
         current_app.logger.error(f"Filing {filing_id} not created in colin {identifier}.")
@@ -56,9 +76,9 @@ def send_filing(token: str, filing: dict, filing_id: str):
     return response.json()["filing"]["header"]["colinIds"]
 
 
-def update_colin_id(token: dict, filing_id: str, colin_ids: list):
+def update_colin_id(token: dict, filing_id: str, colin_ids: list, session: requests.Session | None = None):
     """Update the colin_id in the filings table."""
-    req = requests.patch(
+    req = (session or requests).patch(
         f'{current_app.config["LEAR_SVC_URL"]}/businesses/internal/filings/{filing_id}',
         headers={"Authorization": "Bearer " + token},
         json={"colinIds": colin_ids},
@@ -84,7 +104,7 @@ def clean_none(dictionary: dict | None = None):
             dictionary[key] = ""
 
 
-def process_filing(filing: dict, token: str, job_stats: dict):
+def process_filing(filing: dict, token: str, job_stats: dict, session: requests.Session | None = None):
     """Send the filing to COLIN and update LEAR."""
     filing_id = filing["filingId"]
     identifier = filing["filing"]["business"]["identifier"]
@@ -93,10 +113,10 @@ def process_filing(filing: dict, token: str, job_stats: dict):
         current_app.logger.debug(f'Skipping filing {filing_id} for'
                                     f' {filing["filing"]["business"]["identifier"]}.')
     else:
-        colin_ids = send_filing(token, filing, filing_id)
+        colin_ids = send_filing(token, filing, filing_id, session)
         update = None
         if colin_ids:
-            update = update_colin_id(token, filing_id, colin_ids)
+            update = update_colin_id(token, filing_id, colin_ids, session)
         if update:
             current_app.logger.debug(f"Successfully updated filing {filing_id}")
             job_stats["success"] += 1
@@ -105,8 +125,28 @@ def process_filing(filing: dict, token: str, job_stats: dict):
             current_app.logger.error(f"Failed to update filing {filing_id} with colin event id.")
 
 
+def process_corp_filings(app: Flask, filings: list, token: str, session: requests.Session, failed: bool) -> dict:
+    """Send the filings of one corp to COLIN in order and return the stats for them.
+
+    Runs in a worker thread. Once a filing fails (or the corp already failed earlier in the run) the rest of the
+    corp's filings are skipped so they are never applied to COLIN out of order.
+    """
+    job_stats = {
+        "corps_with_failed_filing": [filings[0]["filing"]["business"]["identifier"]] if failed else [],
+        "skipped_sync": 0,
+        "success": 0
+    }
+    with app.app_context():
+        for filing in filings:
+            process_filing(filing, token, job_stats, session)
+    return job_stats
+
+
 def run():
-    """Get filings that haven't been synced with colin and send them to the colin-api."""
+    """Get filings that haven't been synced with colin and send them to the colin-api.
+
+    Each page of filings is grouped by corp; corps are synced concurrently and each corp's filings in order.
+    """
     job_stats = {
         "corps_with_failed_filing": [],
         "skipped_sync": 0,
@@ -114,21 +154,50 @@ def run():
     }
     total_limit = current_app.config["JOB_TOTAL_LIMIT"]
     limit = current_app.config["JOB_BATCH_LIMIT"]
+    max_workers = current_app.config["JOB_MAX_WORKERS"]
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    start = time.perf_counter()
     try:
         # get updater-job token
         token = AccountService.get_bearer_token()
-        while filings := get_filings(token, limit, len(job_stats["corps_with_failed_filing"]) + job_stats["skipped_sync"]):
-            total_processed = len(job_stats["corps_with_failed_filing"]) + job_stats["skipped_sync"] + job_stats["success"]
-            if total_processed > total_limit:
-                current_app.logger.warning("Job hit total filing limit for run. Ending job cycle.")
-                break
-            for filing in filings:
-                process_filing(filing, token, job_stats)
-
+        after_transaction_id = None
+        with get_session(max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                filings, last_transaction_id = get_filings(token, limit, after_transaction_id, session)
+                if not filings:
+                    break
+                total_processed = (len(job_stats["corps_with_failed_filing"]) + job_stats["skipped_sync"] +
+                                   job_stats["success"])
+                if total_processed > total_limit:
+                    current_app.logger.warning("Job hit total filing limit for run. Ending job cycle.")
+                    break
+
+                corp_filings = {}
+                for filing in filings:
+                    corp_filings.setdefault(filing["filing"]["business"]["identifier"], []).append(filing)
+                futures = [executor.submit(process_corp_filings, app, corp_page, token, session,
+                                           identifier in job_stats["corps_with_failed_filing"])
+                           for identifier, corp_page in corp_filings.items()]
+                # the whole page finishes before the next one starts, keeping each corp's filings in order
+                for future in futures:
+                    corp_stats = future.result()
+                    for identifier in corp_stats["corps_with_failed_filing"]:
+                        if identifier not in job_stats["corps_with_failed_filing"]:
+                            job_stats["corps_with_failed_filing"].append(identifier)
+                    job_stats["skipped_sync"] += corp_stats["skipped_sync"]
+                    job_stats["success"] += corp_stats["success"]
+
+                if last_transaction_id is None or last_transaction_id == after_transaction_id:
+                    break
+                after_transaction_id = last_transaction_id
+
+        elapsed = time.perf_counter() - start
         current_app.logger.debug("Success: %s, Failed: %s, Skipped: %s",
                                  job_stats["success"],
                                  len(job_stats["corps_with_failed_filing"]),
                                  job_stats["skipped_sync"])
+        current_app.logger.info("Synced %s filings to colin in %.1fs (%.1f filings/s)",
+                                job_stats["success"], elapsed, job_stats["success"] / elapsed if elapsed else 0)
 
     except Exception as err:
         current_app.logger.error(err)
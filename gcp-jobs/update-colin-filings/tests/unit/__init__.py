@@ -37,8 +37,14 @@ def get_mocked_colin_resp(colin_ids: list[str]):
     """Return a mocked colin resp with the given colin ids."""
     return {"filing":{"header":{"colinIds":colin_ids}}}
 
-def get_mocked_lear_resp(filing_id: int, filing_name: str, identifier: str, legal_type: str):
+def get_mocked_lear_filing(filing_id: int, filing_name: str, identifier: str, legal_type: str):
+    """Return a mocked lear filing based on the given values"""
+    return {"filingId": filing_id,
+            "filing":{"header":{"name":filing_name},
+                      "business": {"identifier": identifier, "legalType": legal_type}}}
+
+def get_mocked_lear_resp(filing_id: int, filing_name: str, identifier: str, legal_type: str,
+                         last_transaction_id: int = 1):
     """Return a mocked lear resp for getting filings based on the given values"""
-    return {"filings":[{"filingId": filing_id,
-                        "filing":{"header":{"name":filing_name},
-                                  "business": {"identifier": identifier, "legalType": legal_type}}}]}
+    return {"filings":[get_mocked_lear_filing(filing_id, filing_name, identifier, legal_type)],
+            "lastTransactionId": last_transaction_id}
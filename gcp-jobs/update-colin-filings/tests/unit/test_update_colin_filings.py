@@ -36,7 +36,7 @@ from http import HTTPStatus
 
 from update_colin_filings.worker import run
 
-from . import get_mocked_colin_resp, get_mocked_lear_resp
+from . import get_mocked_colin_resp, get_mocked_lear_filing, get_mocked_lear_resp
 
 
 def test_worker_run(requests_mock, app):
@@ -49,8 +49,11 @@ def test_worker_run(requests_mock, app):
     # auth token mock
     auth_mock = requests_mock.post(app.config.get("ACCOUNT_SVC_AUTH_URL"), json={"access_token": "token"})
     # lear get outstanding filings mock
-    lear_get_url = f'{app.config["LEAR_SVC_URL"]}/businesses/internal/filings?offset=0&limit=50'
-    get_filings_mock = requests_mock.get(lear_get_url, json=get_mocked_lear_resp(filing_id, filing_name, identifier, legal_type))
+    lear_get_url = f'{app.config["LEAR_SVC_URL"]}/businesses/internal/filings'
+    get_filings_mock = requests_mock.get(lear_get_url, [
+        {"json": get_mocked_lear_resp(filing_id, filing_name, identifier, legal_type)},
+        {"json": {"filings": [], "lastTransactionId": 1}}
+    ])
     # colin post filing mock
     colin_url = f'{app.config["COLIN_SVC_URL"]}/businesses/{legal_type}/{identifier}/filings/{filing_name}'
     update_colin_mock = requests_mock.post(colin_url, json=get_mocked_colin_resp(colin_ids), status_code=HTTPStatus.CREATED)
@@ -67,5 +70,37 @@ def test_worker_run(requests_mock, app):
     # assert patch mock was called with expected colin_ids
     assert update_ids_mock.called
     assert update_ids_mock.request_history[0].json() == {"colinIds": colin_ids}
-    
-    
+    # the next page is requested after the last transaction instead of by offset
+    assert get_filings_mock.request_history[1].qs == {"limit": ["50"], "aftertransactionid": ["1"]}
+
+
+def test_worker_run_orders_filings_per_corp(requests_mock, app, monkeypatch):
+    """Ensure a failed filing blocks the rest of its corp while other corps keep syncing."""
+    monkeypatch.setitem(app.config, "JOB_TOTAL_LIMIT", 10)
+    requests_mock.post(app.config.get("ACCOUNT_SVC_AUTH_URL"), json={"access_token": "token"})
+    lear_get_url = f'{app.config["LEAR_SVC_URL"]}/businesses/internal/filings'
+    requests_mock.get(lear_get_url, [
+        {"json": {"filings": [get_mocked_lear_filing(1, "annualReport", "BC1111111", "BC"),
+                              get_mocked_lear_filing(2, "annualReport", "BC2222222", "BC"),
+                              get_mocked_lear_filing(3, "changeOfAddress", "BC1111111", "BC")],
+                  "lastTransactionId": 3}},
+        {"json": {"filings": [get_mocked_lear_filing(4, "changeOfDirectors", "BC1111111", "BC")],
+                  "lastTransactionId": 4}},
+        {"json": {"filings": [], "lastTransactionId": 4}}
+    ])
+    colin_url = f'{app.config["COLIN_SVC_URL"]}/businesses/BC'
+    failed_mock = requests_mock.post(f"{colin_url}/BC1111111/filings/annualReport",
+                                     json={"error": "failed"}, status_code=HTTPStatus.BAD_REQUEST)
+    skipped_mock = requests_mock.post(f"{colin_url}/BC1111111/filings/changeOfAddress",
+                                      json=get_mocked_colin_resp([3]), status_code=HTTPStatus.CREATED)
+    synced_mock = requests_mock.post(f"{colin_url}/BC2222222/filings/annualReport",
+                                     json=get_mocked_colin_resp([2]), status_code=HTTPStatus.CREATED)
+    update_ids_mock = requests_mock.patch(f'{app.config["LEAR_SVC_URL"]}/businesses/internal/filings/2',
+                                          status_code=HTTPStatus.ACCEPTED)
+
+    run()
+
+    assert failed_mock.call_count == 1
+    assert not skipped_mock.called
+    assert synced_mock.call_count == 1
+    assert update_ids_mock.call_count == 1
@@ -30,8 +30,14 @@ class _Config:  # pylint: disable=too-few-public-methods
 
     COLIN_SVC_URL = os.getenv("COLIN_API_URL", "") + os.getenv("COLIN_API_VERSION", "")
     COLIN_SVC_TIMEOUT = int(os.getenv("COLIN_SVC_TIMEOUT", "50"))
+    COLIN_EVENT_PAGE_SIZE = int(os.getenv("COLIN_EVENT_PAGE_SIZE", "1000"))
+    # identifiers per colin tax_ids request, colin-api looks them up 1000 at a time
+    COLIN_TAX_IDS_PAGE_SIZE = int(os.getenv("COLIN_TAX_IDS_PAGE_SIZE", "1000"))
     LEAR_SVC_URL = os.getenv("BUSINESS_API_URL", "") + os.getenv("BUSINESS_API_VERSION_2", "")
     LEAR_SVC_TIMEOUT = int(os.getenv("BUSINESS_SVC_TIMEOUT", "50"))
+    LEAR_SVC_BATCH_SIZE = int(os.getenv("BUSINESS_SVC_BATCH_SIZE", "500"))
+    # bounds the concurrent requests (and pooled connections) the job makes to the apis
+    MAX_WORKERS = int(os.getenv("UPDATE_LEGAL_FILINGS_MAX_WORKERS", "5"))
 
     # Pub/Sub
 
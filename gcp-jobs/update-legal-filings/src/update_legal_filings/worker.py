@@ -35,6 +35,7 @@
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from http import HTTPStatus
 
@@ -43,6 +44,7 @@ import pytz
 import requests
 import simple_cloudevent
 from flask import current_app
+from requests.adapters import HTTPAdapter
 from simple_cloudevent import to_queue_message
 
 from business_account import AccountService
@@ -67,10 +69,64 @@ def _get_ce(data):
         data=data
     )
 
+
+def _get_session() -> requests.Session:
+    """Return a session with a connection pool large enough to serve every worker thread."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=current_app.config["MAX_WORKERS"])
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_existing_in_lear(session: requests.Session, token: str, colin_ids: list, identifiers: list) -> tuple[set, set]:
+    """Return the colin event ids and business identifiers that already exist in lear.
+
+    The ids are posted in batches to the bulk lookup endpoint, with the batches sent concurrently.
+    """
+    url = current_app.config["LEAR_SVC_URL"] + "/businesses/internal/filings/colin_ids/existing"
+    headers = {"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"}
+    timeout = current_app.config["LEAR_SVC_TIMEOUT"]
+    batch_size = current_app.config["LEAR_SVC_BATCH_SIZE"]
+
+    def _post(batch: dict) -> dict:
+        # runs outside the app context, so only uses the values captured above
+        response = session.post(url, json=batch, headers=headers, timeout=timeout)
+        if response.status_code != HTTPStatus.OK:
+            raise Exception(  # pylint: disable=broad-exception-raised
+                f"Error checking colin ids in legal: {response.status_code}")
+        return response.json()
+
+    batches = [{"colinIds": colin_ids[start:start + batch_size], "identifiers": identifiers[start:start + batch_size]}
+               for start in range(0, max(len(colin_ids), len(identifiers)), batch_size)]
+    existing_colin_ids = set()
+    existing_identifiers = set()
+    with ThreadPoolExecutor(max_workers=current_app.config["MAX_WORKERS"]) as executor:
+        for result in executor.map(_post, batches):
+            existing_colin_ids.update(result["colinIds"])
+            existing_identifiers.update(result["identifiers"])
+    return existing_colin_ids, existing_identifiers
+
+
+def _get_manual_filings(session: requests.Session, token: str, events: list) -> list:
+    """Return the events that are missing from legal for businesses that are in legal."""
+    # check every event id and corp num against legal in bulk instead of one call per event
+    corp_nums = list(dict.fromkeys(info["corp_num"] for info in events))
+    exist_in_lear_ids, exist_in_lear = get_existing_in_lear(
+        session, token, [info["event_id"] for info in events], corp_nums)
+
+    for corp_num in corp_nums:
+        if corp_num not in exist_in_lear:
+            current_app.logger.error(f"Error getting {corp_num} from legal db")
+
+    # for each event_id: if not in legal db table then add event_id to list
+    # (only for events associated with one of the coops loaded into legal db)
+    return [info for info in events if info["corp_num"] in exist_in_lear and info["event_id"] not in exist_in_lear_ids]
+
+
 def check_for_manual_filings(token: dict | None = None):
     """Check for colin filings in oracle."""
     id_list = []
-    colin_events = None
     legal_url = current_app.config["LEAR_SVC_URL"] + "/businesses"
     colin_url = current_app.config["COLIN_SVC_URL"]
     corp_types = [ColinApiTypeCodes.COOP.value]
@@ -88,55 +144,31 @@ def check_for_manual_filings(token: dict | None = None):
         )
         current_app.logger.debug(f"last_event_id: {last_event_id}")
 
-        # get all event_ids greater than above
-        try:
+        # walk the colin event feed one page at a time, checking each page against legal in bulk
+        page_size = current_app.config["COLIN_EVENT_PAGE_SIZE"]
+        headers = {**AccountService.CONTENT_TYPE_JSON, "Authorization": AccountService.BEARER + token}
+        with _get_session() as session:
             for corp_type in corp_types:
                 current_app.logger.debug(f"corp_type: {corp_type}")
-                url = f"{colin_url}/businesses/event/{corp_type}/{last_event_id}"
-                current_app.logger.debug(f"url: {url}")
-                # call colin api for ids + filing types list
-                response = requests.get(url,
-                                        headers={**AccountService.CONTENT_TYPE_JSON,
-                                                    "Authorization": AccountService.BEARER + token},
-                                        timeout=current_app.config["COLIN_SVC_TIMEOUT"])
-                event_info = dict(response.json())
-                events = event_info.get("events")
-                if colin_events:
-                    colin_events.get("events").extend(events)
-                else:
-                    colin_events = event_info
-
-        except Exception as err:
-            current_app.logger.error("Error getting event_ids from colin: %s", repr(err), exc_info=True)
-            raise err
-
-        exist_in_lear = set()
-        # for each event_id: if not in legal db table then add event_id to list
-        for info in colin_events["events"]:
-            # check that event is associated with one of the coops loaded into legal db
-            if info["corp_num"] not in exist_in_lear:
-                response = requests.get(
-                    f'{legal_url}/{info["corp_num"]}',
-                    headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
-                    timeout=current_app.config["LEAR_SVC_TIMEOUT"]
-                )
-                if response.status_code == HTTPStatus.OK:
-                    exist_in_lear.add(info["corp_num"])
-                else:
-                    current_app.logger.error(
-                        f"Error getting {info['corp_num']} from legal db"
-                    )
-                    continue
-
-            # check legal table
-            response = requests.get(
-                f'{legal_url}/internal/filings/colin_id/{info["event_id"]}',
-                headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
-                timeout=current_app.config["LEAR_SVC_TIMEOUT"])
-            if response.status_code == HTTPStatus.NOT_FOUND:
-                id_list.append(info)
-            elif response.status_code != HTTPStatus.OK:
-                current_app.logger.error(f'Error checking for colin id {info["event_id"]} in legal')
+                event_cursor = last_event_id
+                while event_cursor:
+                    url = f"{colin_url}/businesses/event/{corp_type}/{event_cursor}"
+                    current_app.logger.debug(f"url: {url}")
+                    try:
+                        # call colin api for ids + filing types list
+                        response = session.get(url, params={"limit": page_size}, headers=headers,
+                                               timeout=current_app.config["COLIN_SVC_TIMEOUT"])
+                        if response.status_code != HTTPStatus.OK:
+                            # an error body has no events, which would otherwise end the walk as if it was done
+                            raise Exception(  # pylint: disable=broad-exception-raised
+                                f"Error getting event_ids from colin: {response.status_code}")
+                        event_page = dict(response.json())
+                    except Exception as err:
+                        current_app.logger.error("Error getting event_ids from colin: %s", repr(err), exc_info=True)
+                        raise err
+
+                    id_list.extend(_get_manual_filings(session, token, event_page.get("events") or []))
+                    event_cursor = event_page.get("nextCursor")
 
     return id_list
 
@@ -281,6 +313,24 @@ def publish_queue_events(tax_ids: dict):  # pylint: disable=redefined-outer-name
             current_app.logger.error("Update-legal-filings: Failed to publish bn entity event for %s.", identifier)
 
 
+def get_colin_tax_ids(token: str, identifiers: list):
+    """Yield the tax ids colin has for the identifiers, one dict per page of COLIN_TAX_IDS_PAGE_SIZE identifiers."""
+    page_size = current_app.config["COLIN_TAX_IDS_PAGE_SIZE"]
+    for start in range(0, len(identifiers), page_size):
+        page = identifiers[start:start + page_size]
+        current_app.logger.debug(f"Getting tax ids for {len(page)} identifiers from colin api...")
+        response = requests.get(
+            current_app.config["COLIN_SVC_URL"] + "/businesses/internal/tax_ids",
+            json={"identifiers": page},
+            headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
+            timeout=current_app.config["COLIN_SVC_TIMEOUT"]
+        )
+        if response.status_code != HTTPStatus.OK:
+            current_app.logger.error("legal-updater failed to get tax_ids from colin-api.")
+            raise Exception  # pylint: disable=broad-exception-raised
+        yield response.json()
+
+
 def update_business_nos():  # pylint: disable=redefined-outer-name
     """Update the tax_ids for corps with new bn_15s."""
     try:
@@ -300,24 +350,7 @@ def update_business_nos():  # pylint: disable=redefined-outer-name
         business_identifiers = response.json()
 
         if business_identifiers["identifiers"]:
-            start = 0
-            end = 20
-            # make a colin-api call with 20 identifiers at a time
-            while identifiers := business_identifiers["identifiers"][start:end]:
-                start = end
-                end += 20
-                # get tax ids that exist for above entities
-                current_app.logger.debug(f"Getting tax ids for {identifiers} from colin api...")
-                response = requests.get(
-                    current_app.config["COLIN_SVC_URL"] + "/businesses/internal/tax_ids",
-                    json={"identifiers": identifiers},
-                    headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
-                    timeout=current_app.config["COLIN_SVC_TIMEOUT"]
-                )
-                if response.status_code != HTTPStatus.OK:
-                    current_app.logger.error("legal-updater failed to get tax_ids from colin-api.")
-                    raise Exception  # pylint: disable=broad-exception-raised
-                tax_ids: dict = response.json()
+            for tax_ids in get_colin_tax_ids(token, business_identifiers["identifiers"]):
                 if tax_ids.keys():
                     # update lear with new tax ids from colin
                     current_app.logger.debug(f"Updating tax ids for {tax_ids.keys()} in lear...")
@@ -331,7 +364,10 @@ def update_business_nos():  # pylint: disable=redefined-outer-name
                         current_app.logger.error("legal-updater failed to update tax_ids in lear.")
                         raise Exception  # pylint: disable=broad-exception-raised
 
-                    publish_queue_events(tax_ids)
+                    # only notify for the businesses lear actually updated
+                    results = response.json().get("results", {})
+                    publish_queue_events({identifier: tax_id for identifier, tax_id in tax_ids.items()
+                                          if results.get(identifier) == "updated"})
 
                     current_app.logger.debug("Successfully updated tax ids in lear.")
                 else:
@@ -426,33 +462,38 @@ def check_ben_to_bc_filings(token: str) -> list[dict]:
     """Check for new filings in COLIN."""
     legal_url = current_app.config["LEGAL_API_URL"] + "/businesses"
     colin_url = current_app.config["COLIN_URL"]
-    colin_events = []
+    headers = {"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"}
+    lear_timeout = current_app.config["LEAR_SVC_TIMEOUT"]
+    colin_timeout = current_app.config["COLIN_SVC_TIMEOUT"]
     businesses = _get_ben_to_bc_identifiers()
-    for identifier in businesses:
+
+    def _get_events(session: requests.Session, identifier: str) -> list[dict]:
+        # runs outside the app context, so only uses the values captured above
         # Get the last colin event id for the identifier
-        response = requests.get(
-            f"{legal_url}/internal/last-event-id/{identifier}",
-            headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
-            timeout=current_app.config["LEAR_SVC_TIMEOUT"])
+        response = session.get(f"{legal_url}/internal/last-event-id/{identifier}", headers=headers,
+                               timeout=lear_timeout)
         last_event_id = response.json()["maxId"]
 
         # check if there are filings to send to legal
         colin_identifier = identifier[2:]
-        response = requests.get(
-            f"{colin_url}/event/corp_num/{colin_identifier}/{last_event_id}",
-            headers={"Content-Type": CONTENT_TYPE_JSON, "Authorization": f"Bearer {token}"},
-            timeout=current_app.config["COLIN_SVC_TIMEOUT"]
-        )
+        response = session.get(f"{colin_url}/event/corp_num/{colin_identifier}/{last_event_id}", headers=headers,
+                               timeout=colin_timeout)
         if response.status_code != HTTPStatus.OK:
-            current_app.logger.error("legal-updater failed to get filings from colin-api.")
-            raise Exception  # pylint: disable=broad-exception-raised
-        event_info = dict(response.json())
-        events = event_info.get("events")
-        for event in events:
+            raise Exception(  # pylint: disable=broad-exception-raised
+                f"legal-updater failed to get filings for {identifier} from colin-api.")
+        events = []
+        for event in dict(response.json()).get("events"):
             # None filing_typ_cd found in 'BC1294238', 'BC1265645', 'BC1263326', 'BC1263195' without filings
             if event["filing_typ_cd"] not in ["COGS1", None]:
                 event["corp_num"] = identifier
-                colin_events.append(event)
+                events.append(event)
+        return events
+
+    colin_events = []
+    with _get_session() as session, ThreadPoolExecutor(max_workers=current_app.config["MAX_WORKERS"]) as executor:
+        # map keeps the results in business order, so the events are applied in the same order as before
+        for events in executor.map(lambda identifier: _get_events(session, identifier), businesses):
+            colin_events.extend(events)
 
     return colin_events
 
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, patch
 
-from update_legal_filings.worker import publish_queue_events, update_business_nos
+import pytest
+
+from update_legal_filings.worker import check_for_manual_filings, publish_queue_events, update_business_nos
 
 
 @patch("update_legal_filings.worker.gcp_queue.publish")
@@ -50,12 +52,96 @@ def test_update_business_nos_success(mock_logger_error, mock_publish_queue_event
         MagicMock(status_code=200, json=MagicMock(return_value={"identifiers": ["123", "456"]})),
         MagicMock(status_code=200, json=MagicMock(return_value={"123": "tax_id_123", "456": "tax_id_456"}))
     ]
-    mock_requests_post.return_value = MagicMock(status_code=201)
+    mock_requests_post.return_value = MagicMock(
+        status_code=201,
+        json=MagicMock(return_value={"results": {"123": "updated", "456": "unchanged"}}))
     mock_publish_queue_events.return_value = None
 
     update_business_nos()
 
     assert mock_requests_get.call_count == number_of_get_requests
     assert mock_requests_post.call_count == number_of_post_requests
-    mock_publish_queue_events.assert_called_once()
+    mock_publish_queue_events.assert_called_once_with({"123": "tax_id_123"})
     mock_logger_error.assert_not_called()
+
+
+def test_check_for_manual_filings_bulk_lookup(app, requests_mock):
+    legal_url = app.config["LEAR_SVC_URL"] + "/businesses"
+    colin_url = app.config["COLIN_SVC_URL"]
+    requests_mock.get(f"{legal_url}/internal/filings/colin_id", json={"maxId": 100})
+    requests_mock.get(f"{colin_url}/businesses/event/CP/100", json={"events": [
+        {"corp_num": "CP1234567", "event_id": 101, "filing_typ_cd": "OTANN"},
+        {"corp_num": "CP1234567", "event_id": 102, "filing_typ_cd": "OTADD"},
+        {"corp_num": "CP7654321", "event_id": 103, "filing_typ_cd": "OTANN"},
+        {"corp_num": "CP0000000", "event_id": 104, "filing_typ_cd": "OTANN"},
+    ]})
+    bulk = requests_mock.post(f"{legal_url}/internal/filings/colin_ids/existing",
+                              json={"colinIds": [101], "identifiers": ["CP1234567", "CP7654321"]})
+
+    id_list = check_for_manual_filings("test_token")
+
+    # one bulk lookup replaces the per-event and per-business calls
+    assert bulk.call_count == 1
+    assert bulk.last_request.json() == {"colinIds": [101, 102, 103, 104],
+                                        "identifiers": ["CP1234567", "CP7654321", "CP0000000"]}
+    assert [info["event_id"] for info in id_list] == [102, 103]
+
+
+def test_check_for_manual_filings_pages_event_feed(app, requests_mock):
+    legal_url = app.config["LEAR_SVC_URL"] + "/businesses"
+    colin_url = app.config["COLIN_SVC_URL"]
+    requests_mock.get(f"{legal_url}/internal/filings/colin_id", json={"maxId": 100})
+    first_page = requests_mock.get(f"{colin_url}/businesses/event/CP/100", json={"events": [
+        {"corp_num": "CP1234567", "event_id": 101, "filing_typ_cd": "OTANN"},
+        {"corp_num": "CP1234567", "event_id": 102, "filing_typ_cd": "OTADD"},
+    ], "nextCursor": "102"})
+    last_page = requests_mock.get(f"{colin_url}/businesses/event/CP/102", json={"events": [
+        {"corp_num": "CP7654321", "event_id": 103, "filing_typ_cd": "OTANN"},
+    ], "nextCursor": None})
+    bulk = requests_mock.post(f"{legal_url}/internal/filings/colin_ids/existing",
+                              json={"colinIds": [101], "identifiers": ["CP1234567", "CP7654321"]})
+
+    id_list = check_for_manual_filings("test_token")
+
+    # each page is requested with the page size and checked against legal on its own
+    assert first_page.last_request.qs == {"limit": [str(app.config["COLIN_EVENT_PAGE_SIZE"])]}
+    assert last_page.call_count == 1
+    assert bulk.call_count == 2
+    assert bulk.request_history[1].json() == {"colinIds": [103], "identifiers": ["CP7654321"]}
+    assert [info["event_id"] for info in id_list] == [102, 103]
+
+
+def test_check_for_manual_filings_event_feed_error(app, requests_mock):
+    legal_url = app.config["LEAR_SVC_URL"] + "/businesses"
+    colin_url = app.config["COLIN_SVC_URL"]
+    requests_mock.get(f"{legal_url}/internal/filings/colin_id", json={"maxId": 100})
+    requests_mock.get(f"{colin_url}/businesses/event/CP/100", json={"events": [
+        {"corp_num": "CP1234567", "event_id": 101, "filing_typ_cd": "OTANN"},
+    ], "nextCursor": "101"})
+    requests_mock.get(f"{colin_url}/businesses/event/CP/101", status_code=500, json={"message": "error"})
+    requests_mock.post(f"{legal_url}/internal/filings/colin_ids/existing",
+                       json={"colinIds": [], "identifiers": ["CP1234567"]})
+
+    # a failed page is not mistaken for the end of the feed
+    with pytest.raises(Exception, match="Error getting event_ids from colin: 500"):
+        check_for_manual_filings("test_token")
+
+
+@patch("update_legal_filings.worker.AccountService.get_bearer_token", return_value="test_token")
+@patch("update_legal_filings.worker.publish_queue_events")
+def test_update_business_nos_pages_identifiers(mock_publish_queue_events, mock_get_bearer_token, app, requests_mock):
+    legal_url = app.config["LEAR_SVC_URL"] + "/businesses/internal/tax_ids"
+    colin_url = app.config["COLIN_SVC_URL"] + "/businesses/internal/tax_ids"
+    identifiers = [f"BC{index:07d}" for index in range(5)]
+    requests_mock.get(legal_url, json={"identifiers": identifiers})
+    colin = requests_mock.get(colin_url, [{"json": {"BC0000000": "tax_id_0"}}, {"json": {}}, {"json": {}}])
+    lear = requests_mock.post(legal_url, status_code=201, json={"results": {"BC0000000": "updated"}})
+
+    with patch.dict(app.config, {"COLIN_TAX_IDS_PAGE_SIZE": 2}):
+        update_business_nos()
+
+    assert [request.json()["identifiers"] for request in colin.request_history] == [
+        identifiers[0:2], identifiers[2:4], identifiers[4:5]]
+    # only pages with tax ids are sent to lear
+    assert lear.call_count == 1
+    mock_publish_queue_events.assert_called_once_with({"BC0000000": "tax_id_0"})
@@ -70,6 +70,11 @@ class _Config:  # pylint: disable=too-few-public-methods
     REPORT_SVC_URL = f"{REPORT_API_URL + REPORT_API_VERSION}/reports"
     NAICS_API_URL = f"{BUSINESS_API_URL + BUSINESS_API_VERSION_2}/naics"
 
+    # task list pay details: looked up concurrently, cut off after PAY_DETAILS_TIMEOUT seconds and cached briefly
+    PAY_DETAILS_TIMEOUT = int(os.getenv("PAY_DETAILS_TIMEOUT", "5"))
+    PAY_DETAILS_MAX_WORKERS = int(os.getenv("PAY_DETAILS_MAX_WORKERS", "5"))
+    PAY_DETAILS_CACHE_TTL = int(os.getenv("PAY_DETAILS_CACHE_TTL", "30"))
+
     REPORT_TEMPLATE_PATH = os.getenv("REPORT_PATH", "report-templates")
     FONTS_PATH = os.getenv("FONTS_PATH", "fonts")
 
@@ -166,11 +171,22 @@ class _Config:  # pylint: disable=too-few-public-methods
         CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
     except (TypeError, ValueError):
         CACHE_DEFAULT_TIMEOUT = 300
+    # computed business warnings are reused for this long while the business is unchanged; 0 disables the cache
+    WARNINGS_CACHE_TTL = int(os.getenv("WARNINGS_CACHE_TTL", "86400"))
 
     # MRAS
     MRAS_SVC_URL = os.getenv("MRAS_SVC_URL")
     MRAS_SVC_API_KEY = os.getenv("MRAS_SVC_API_KEY")
 
+    # Reference lookups (NAICS, MRAS) are cached for TTL seconds, misses for NEGATIVE_TTL seconds and expired values
+    # are still served for STALE_TTL seconds when the upstream is unavailable
+    REFERENCE_API_TIMEOUT = int(os.getenv("REFERENCE_API_TIMEOUT", "20"))
+    NAICS_CACHE_TTL = int(os.getenv("NAICS_CACHE_TTL", "3600"))
+    NAICS_CACHE_NEGATIVE_TTL = int(os.getenv("NAICS_CACHE_NEGATIVE_TTL", "300"))
+    NAICS_CACHE_STALE_TTL = int(os.getenv("NAICS_CACHE_STALE_TTL", "86400"))
+    MRAS_CACHE_TTL = int(os.getenv("MRAS_CACHE_TTL", "900"))
+    MRAS_CACHE_STALE_TTL = int(os.getenv("MRAS_CACHE_STALE_TTL", "86400"))
+
     # involuntary dissolution
     STAGE_1_DELAY = int(os.getenv("STAGE_1_DELAY", "42"))
     STAGE_2_DELAY = int(os.getenv("STAGE_2_DELAY", "30"))
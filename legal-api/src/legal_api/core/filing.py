@@ -330,17 +330,26 @@ class Filing:  # pylint: disable=too-many-public-methods
     def get_most_recent_filing_json(business_id: str, filing_type: str | None = None, jwt: JwtManager = None):
         """Return the most recent filing json."""
         if storage := FilingStorage.get_most_recent_filing(business_id, filing_type):
-            submitter_displayname = REDACTED_STAFF_SUBMITTER
-            if (submitter := storage.filing_submitter) \
-                and submitter.username and jwt \
-                    and not Filing.redact_submitter(storage.submitter_roles, jwt):
-                submitter_displayname = submitter.username
-
             filing_json = storage.json
-            filing_json["filing"]["header"]["submitter"] = submitter_displayname
+            filing_json["filing"]["header"]["submitter"] = Filing._get_submitter_displayname(storage, jwt)
             return filing_json
         return None
 
+    @staticmethod
+    def get_most_recent_filing_submitter(business_id: str, jwt: JwtManager = None) -> str | None:
+        """Return the submitter of the most recent filing, without loading or rendering the filing documents."""
+        if storage := FilingStorage.get_most_recent_filing(business_id, with_documents=False):
+            return Filing._get_submitter_displayname(storage, jwt)
+        return None
+
+    @staticmethod
+    def _get_submitter_displayname(storage: FilingStorage, jwt: JwtManager | None) -> str:
+        if (submitter := storage.filing_submitter) \
+            and submitter.username and jwt \
+                and not Filing.redact_submitter(storage.submitter_roles, jwt):
+            return submitter.username
+        return REDACTED_STAFF_SUBMITTER
+
     def legal_filings(self) -> list | None:
         """Return a list of the filings extracted from this filing submission.
 
@@ -389,7 +398,8 @@ class Filing:  # pylint: disable=too-many-public-methods
 
         business = Business.find_by_internal_id(business_id)
 
-        query = FilingStorage.query.filter(FilingStorage.business_id == business_id)
+        query = FilingStorage.query.options(FilingStorage.with_documents()). \
+            filter(FilingStorage.business_id == business_id)
 
         if effective_date:
             query = query.filter(FilingStorage.effective_date <= effective_date)
@@ -202,14 +202,15 @@ class BusinessDocument:
 
     def _set_epoch_date(self, business: dict):
         """Set the epoch filing date (date it was imported from COLIN)."""
-        epoch_filing = Filing.get_filings_by_status(self._business.id, [Filing.Status.EPOCH])
+        epoch_filing = Filing.get_filings_by_status(self._business.id, [Filing.Status.EPOCH], with_documents=False)
         if epoch_filing:
             self._epoch_filing_date = epoch_filing[0].effective_date
             business["business"]["epochFilingDate"] = self._epoch_filing_date.isoformat()
 
     def _set_tombstone_date(self):
         """Set the tombstone filing date if the business is tombstone."""
-        tombstone_filing = Filing.get_filings_by_status(self._business.id, [Filing.Status.TOMBSTONE])
+        tombstone_filing = Filing.get_filings_by_status(self._business.id, [Filing.Status.TOMBSTONE],
+                                                        with_documents=False)
         if tombstone_filing:
             self._tombstone_filing_date = tombstone_filing[0].effective_date
 
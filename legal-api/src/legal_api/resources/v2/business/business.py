@@ -15,6 +15,7 @@
 
 Provides all the search and retrieval from the business entity datastore.
 """
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from http import HTTPStatus
 
@@ -34,6 +35,7 @@ from legal_api.services import (
     flags,
 )
 from legal_api.services.authz import authorized, get_allowable_actions, get_allowed, get_could_files
+from legal_api.services.business_context import BusinessContext
 from legal_api.services.permissions import ListActionsPermissionsAllowed, PermissionService
 from legal_api.services.search_service import AffiliationSearchDetails, BusinessSearchService
 from legal_api.utils.auth import jwt
@@ -71,28 +73,34 @@ def get_businesses(identifier: str):
                         f"You are not authorized to view business {identifier}."}), \
             HTTPStatus.UNAUTHORIZED
 
-    warnings = check_warnings(business)
-    # TODO remove complianceWarnings line when UI has been integrated to use warnings instead of complianceWarnings
-    business.compliance_warnings = warnings
-    business.warnings = warnings
+    q_account = request.args.get("account")
+    current_app.logger.info("account info request, for account: %s", q_account)
+    account_future = None
+    if q_account and jwt.has_one_of_roles([SYSTEM_ROLE, ACCOUNT_IDENTITY]):
+        # the auth-api lookup does not depend on the business data, so it runs while that is loaded
+        account_future = _get_affiliated_account(identifier)
 
-    allowable_actions = get_allowable_actions(jwt, business)
-    business.allowable_actions = allowable_actions
+    # warnings, allowable actions and the business json are answered from the same loaded filings
+    with BusinessContext.scope(business):
+        warnings = check_warnings(business)
+        # TODO remove complianceWarnings line when UI has been integrated to use warnings instead of complianceWarnings
+        business.compliance_warnings = warnings
+        business.warnings = warnings
 
-    business_json = business.json()
+        allowable_actions = get_allowable_actions(jwt, business)
+        business.allowable_actions = allowable_actions
 
-    recent_filing_json = CoreFiling.get_most_recent_filing_json(business.id, None, jwt)
-    if recent_filing_json:
-        business_json["submitter"] = recent_filing_json["filing"]["header"]["submitter"]
+        business_json = business.json()
+
+    if submitter := CoreFiling.get_most_recent_filing_submitter(business.id, jwt):
+        business_json["submitter"] = submitter
 
     allowed_filings = str(request.args.get("allowed_filings", None)).lower() == "true"
     if allowed_filings:
         business_json["allowedFilings"] = get_allowed(business.state, business.legal_type, jwt)
 
-    q_account = request.args.get("account")
-    current_app.logger.info("account info request, for account: %s", q_account)
-    if q_account and jwt.has_one_of_roles([SYSTEM_ROLE, ACCOUNT_IDENTITY]):
-        account_response = AccountService.get_account_by_affiliated_identifier(identifier, flags)
+    if account_future:
+        account_response = account_future.result()
         current_app.logger.info("VALID account request, for accountId: %s, by: %s, jwt: %s, for org account: %s",
                                 q_account,
                                 g.jwt_oidc_token_info.get("preferred_username"),
@@ -110,6 +118,21 @@ def get_businesses(identifier: str):
     return jsonify(business=business_json)
 
 
+def _get_affiliated_account(identifier: str) -> Future:
+    """Start looking up the accounts affiliated to the business in a worker thread."""
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+
+    def _get_account():
+        with app.app_context():
+            return AccountService.get_account_by_affiliated_identifier(identifier, flags)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    account_future = executor.submit(_get_account)
+    # the submitted lookup still runs to completion, no further work is accepted
+    executor.shutdown(wait=False)
+    return account_future
+
+
 @bp.route("/<string:identifier>/public", methods=["GET"])
 @cross_origin()
 @jwt.requires_auth
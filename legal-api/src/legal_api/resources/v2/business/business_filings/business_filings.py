@@ -625,7 +625,9 @@ class ListFilingResource:  # pylint: disable=too-many-public-methods
         """Is the filings before the launch of COOPS."""
         if not business or not filing_json:
             return False
-        epoch_filing = Filing.get_filings_by_status(business_id=business.id, status=[Filing.Status.EPOCH.value])
+        epoch_filing = Filing.get_filings_by_status(business_id=business.id,
+                                                    status=[Filing.Status.EPOCH.value],
+                                                    with_documents=False)
         if len(epoch_filing) != 1:
             current_app.logger.error("Business:%s either none or too many epoch filings", business.identifier)
             return False
@@ -648,7 +650,9 @@ class ListFilingResource:  # pylint: disable=too-many-public-methods
                 raise KeyError
 
             if (epoch_filing :=
-                    Filing.get_filings_by_status(business_id=business.id, status=[Filing.Status.EPOCH.value])
+                    Filing.get_filings_by_status(business_id=business.id,
+                                                 status=[Filing.Status.EPOCH.value],
+                                                 with_documents=False)
                 ) and \
                     ListFilingResource.is_before_epoch_filing(filing.filing_json, business):
                 filing.transaction_id = epoch_filing[0].transaction_id
@@ -30,7 +30,7 @@ from .bp import bp
 @bp.route("/<string:identifier>/parties/<int:party_id>", methods=["GET", "OPTIONS"])
 @cross_origin()
 @jwt.requires_auth
-def get_parties(identifier, party_id=None):  # noqa: PLR0912
+def get_parties(identifier, party_id=None):
     """Return a JSON of the parties."""
     business = Business.find_by_identifier(identifier)
 
@@ -71,32 +71,7 @@ def get_parties(identifier, party_id=None):  # noqa: PLR0912
         else:
             party_roles = PartyRole.get_party_roles(business.id, end_date, request.args.get("role"))
 
-    party_role_dict = {}
-    party_list = []
-    for party_role in party_roles:
-        party_role_json = party_role.json
-
-        role_dict = {
-            "roleType": party_role_json["role"].replace("_", " ").title(),
-            "appointmentDate": party_role_json["appointmentDate"],
-            "cessationDate": party_role_json["cessationDate"]
-        }
-        # only add roleClass if it exists
-        if "roleClass" in party_role_json:
-            role_dict["roleClass"] = party_role_json["roleClass"]
-
-        party_role_dict.setdefault(party_role.party_id, []).append(role_dict)
-
-    for key, value in party_role_dict.items():
-        party = next(x for x in party_roles if x.party_id == key)
-        party_json = party.json
-        del party_json["role"]
-        del party_json["appointmentDate"]
-        del party_json["cessationDate"]
-        # safely remove roleClass, use pop to not throw error if roleClass does not exist
-        party_json.pop("roleClass", None)
-        party_json["roles"] = value
-        party_list.append(party_json)
+    party_list = PartyRole.parties_json(party_roles)
 
     if party_id:
         return {"party": party_list[0]}
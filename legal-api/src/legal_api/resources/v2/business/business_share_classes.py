@@ -16,6 +16,7 @@ from http import HTTPStatus
 
 from flask import jsonify
 from flask_cors import cross_origin
+from sqlalchemy.orm import selectinload
 
 from business_model.models import Business, ShareClass
 from legal_api.services import authorized
@@ -48,7 +49,7 @@ def get_share_class(identifier, share_class_id=None):
         return jsonify(share_class or msg), code
 
     share_classes = []
-    for share_class in business.share_classes.all():
+    for share_class in business.share_classes.options(selectinload(ShareClass.series)).all():
         share_classes.append(share_class.json)
 
     return jsonify(shareClasses=share_classes)
@@ -16,6 +16,7 @@
 Provides all the search and retrieval from the business filings datastore.
 """
 
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import UTC, datetime
 from http import HTTPStatus
 
@@ -28,12 +29,16 @@ from requests import exceptions
 from business_common.utils.legislation_datetime import LegislationDatetime
 from business_model.models import Business, Filing
 from legal_api.services import check_warnings, namex
+from legal_api.services.cache import cache
 from legal_api.services.request_context import add_account_linking_key_header
 from legal_api.services.warnings.business.business_checks import BusinessWarningCodes, WarningType
 from legal_api.utils.auth import jwt
 
 from .bp import bp
 
+# shared so that the connections to pay-api are reused across requests
+_pay_session = requests.Session()
+
 
 @bp.route("/<string:identifier>/tasks", methods=["GET", "OPTIONS"])
 @cross_origin()
@@ -117,6 +122,15 @@ def construct_task_list(business: Business):  # noqa: PLR0915
                                                                  Filing.Status.PENDING.value,
                                                                  Filing.Status.PENDING_CORRECTION.value,
                                                                  Filing.Status.ERROR.value])
+    # get the current pay details of the unpaid filings from pay-api
+    payment_details, pay_unreachable = _get_payment_details(
+        [filing.payment_token for filing in pending_filings
+         if filing.payment_status_code == "CREATED" and filing.payment_token]
+    )
+    if pay_unreachable:
+        current_app.logger.error(f"Payment connection failure for {business.identifier} task list.")
+        return "pay_connection_error"
+
     # Create a todo item for each pending filing
     pending_tr_type: str = None
     for filing in pending_filings:
@@ -125,28 +139,9 @@ def construct_task_list(business: Business):  # noqa: PLR0915
 
         filing_json = filing.json
         if filing.payment_status_code == "CREATED" and filing.payment_token:
-            # get current pay details from pay-api
-            try:
-                headers = {
-                    "Authorization": f"Bearer {jwt.get_token_auth_header()}",
-                    "Content-Type": "application/json"
-                }
-                add_account_linking_key_header(headers)
-                pay_response = requests.get(
-                    url=f'{current_app.config.get("PAYMENT_SVC_URL")}/{filing.payment_token}',
-                    headers=headers
-                )
-                pay_details = {
-                    "isPaymentActionRequired": pay_response.json().get("isPaymentActionRequired", False),
-                    "paymentMethod": pay_response.json().get("paymentMethod", "")
-                }
+            if pay_details := payment_details.get(filing.payment_token):
                 filing_json["filing"]["header"].update(pay_details)
 
-            except (exceptions.ConnectionError, exceptions.Timeout) as err:
-                current_app.logger.error(
-                    f"Payment connection failure for {business.identifier} task list. ", err)
-                return "pay_connection_error"
-
         task = {"task": filing_json, "order": order, "enabled": True}
         tasks.append(task)
         order += 1
@@ -202,6 +197,63 @@ def construct_task_list(business: Business):  # noqa: PLR0915
     return tasks
 
 
+def _get_payment_details(payment_tokens: list) -> tuple[dict, bool]:
+    """Return the pay-api details of each payment token, looked up concurrently and cached for a short time.
+
+    Tokens whose lookup fails or does not finish within PAY_DETAILS_TIMEOUT seconds are left out, so the task list
+    is still returned without their details. The second value is True if pay-api could not be reached at all.
+    """
+    details = {}
+    pending = []
+    for token in dict.fromkeys(payment_tokens):
+        if (cached := cache.get(f"pay_details_{token}")) is not None:
+            details[token] = cached
+        else:
+            pending.append(token)
+    if not pending:
+        return details, False
+
+    # built here, the worker threads have no request context
+    headers = {
+        "Authorization": f"Bearer {jwt.get_token_auth_header()}",
+        "Content-Type": "application/json"
+    }
+    add_account_linking_key_header(headers)
+    payment_svc_url = current_app.config.get("PAYMENT_SVC_URL")
+    timeout = current_app.config.get("PAY_DETAILS_TIMEOUT")
+
+    def _get_details(token) -> tuple[dict, bool]:
+        pay_response = _pay_session.get(url=f"{payment_svc_url}/{token}", headers=headers, timeout=timeout)
+        pay_json = pay_response.json()
+        return {
+            "isPaymentActionRequired": pay_json.get("isPaymentActionRequired", False),
+            "paymentMethod": pay_json.get("paymentMethod", "")
+        }, pay_response.ok
+
+    executor = ThreadPoolExecutor(max_workers=min(len(pending), current_app.config.get("PAY_DETAILS_MAX_WORKERS")))
+    futures = {executor.submit(_get_details, token): token for token in pending}
+    done, not_done = wait(futures, timeout=timeout)
+    # don't hold the response for lookups that are still running, they end on their own timeout
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    connection_errors = 0
+    for future in done:
+        token = futures[future]
+        try:
+            details[token], cacheable = future.result()
+        except (exceptions.RequestException, ValueError) as err:
+            current_app.logger.error(f"Failed to get payment details for payment {token}: {err!r}")
+            connection_errors += isinstance(err, exceptions.ConnectionError)
+            continue
+        if cacheable:
+            cache.set(f"pay_details_{token}", details[token], timeout=current_app.config.get("PAY_DETAILS_CACHE_TTL"))
+    if not_done:
+        current_app.logger.warning(
+            f"pay-api did not respond within {timeout}s for {len(not_done)} of {len(pending)} payments.")
+
+    return details, not details and connection_errors == len(pending)
+
+
 def add_tr_tasks(business: Business, tasks: list, order: int, pending_tr_type: str | None = None):
     """Add Transparency Register tasks to the tasks list."""
     entity_types_no_tr = ["SP", "GP", "CP"]
@@ -16,6 +16,7 @@
 These endpoint are reqired as long as we sync to colin.
 """
 import copy
+import time
 from http import HTTPStatus
 
 from flask import current_app, jsonify, request
@@ -58,9 +59,16 @@ def get_completed_filings_for_colin():
 
     limit = int(request.args.get("limit", 20))
     offset = int(request.args.get("offset", 0))
-    pending_filings = Filing.get_completed_filings_for_colin(limit, offset)
+    after_transaction_id = request.args.get("afterTransactionId", None, type=int)
+    pending_filings = Filing.get_completed_filings_for_colin(limit, offset, after_transaction_id)
+
+    # prefetch what the page needs so each filing does not query for it on its own
+    businesses = _get_businesses(pending_filings)
+    batch_processings = _get_batch_processings(pending_filings)
+    mailing_addresses = _get_mailing_addresses(pending_filings)
+
     for filing in pending_filings:
-        business = Business.find_by_internal_id(filing.business_id)
+        business = businesses[filing.business_id]
 
         filing_json = _get_initial_filing_json(filing, business)
 
@@ -90,17 +98,61 @@ def get_completed_filings_for_colin():
                 filing_json["filing"]["header"]["name"] = None
 
         elif (filing.filing_type == "dissolution" and filing.filing_sub_type == "involuntary"):
-            if batch_processings := BatchProcessing.find_by(filing_id=filing.id):
-                filing_json["filing"]["dissolution"]["metaData"] = batch_processings[0].meta_data
+            if batch_processing := batch_processings.get(filing.id):
+                filing_json["filing"]["dissolution"]["metaData"] = batch_processing.meta_data
             else:
                 current_app.logger.error(f"dissolution: filingId={filing.id}, missing batch processing info")
                 # to skip this filing and block subsequent filing from syncing in update-colin-filings
                 filing_json["filing"]["header"]["name"] = None
         elif (filing.filing_type == "dissolution" and filing.filing_sub_type == "voluntary"):
-            mailing = business.mailing_address.one_or_none()
+            # businesses without a registered office (e.g. SP/GP) use the fallbacks of Business.mailing_address
+            if not (mailing := mailing_addresses.get(filing.business_id)):
+                mailing = business.mailing_address.one_or_none()
             filing_json["filing"]["dissolution"]["mailingAddress"] = mailing.json
         filings.append(filing_json)
-    return jsonify({"filings": filings}), HTTPStatus.OK
+
+    last_transaction_id = pending_filings[-1].transaction_id if pending_filings else after_transaction_id
+    return jsonify({"filings": filings, "lastTransactionId": last_transaction_id}), HTTPStatus.OK
+
+
+def _get_businesses(filings: list[Filing]) -> dict:
+    """Return the businesses of the filings keyed by id."""
+    business_ids = {filing.business_id for filing in filings}
+    if not business_ids:
+        return {}
+    return {business.id: business for business in Business.query.filter(Business.id.in_(business_ids)).all()}
+
+
+def _get_batch_processings(filings: list[Filing]) -> dict:
+    """Return the first batch processing of each involuntary dissolution filing keyed by filing id."""
+    filing_ids = [filing.id for filing in filings
+                  if filing.filing_type == "dissolution" and filing.filing_sub_type == "involuntary"]
+    batch_processings = {}
+    if filing_ids:
+        for batch_processing in (db.session.query(BatchProcessing)
+                                 .filter(BatchProcessing.filing_id.in_(filing_ids))
+                                 .order_by(BatchProcessing.id)
+                                 .all()):
+            batch_processings.setdefault(batch_processing.filing_id, batch_processing)
+    return batch_processings
+
+
+def _get_mailing_addresses(filings: list[Filing]) -> dict:
+    """Return the registered office mailing address of each voluntary dissolution business keyed by business id.
+
+    Businesses without a registered office mailing address are left out.
+    """
+    business_ids = {filing.business_id for filing in filings
+                    if filing.filing_type == "dissolution" and filing.filing_sub_type == "voluntary"}
+    if not business_ids:
+        return {}
+    addresses = (db.session.query(Office.business_id, Address)
+                 .join(Address, Address.office_id == Office.id)
+                 .filter(Office.business_id.in_(business_ids))
+                 .filter(Office.office_type == "registeredOffice")
+                 .filter(Address.address_type == Address.MAILING)
+                 .all())
+    return dict(addresses)
 
 
 def _get_initial_filing_json(filing: Filing, business: Business):
@@ -437,6 +489,26 @@ def get_colin_event_id(colin_id=None):
     return {"maxId": last_event_id[0]}, HTTPStatus.OK if request.method == "GET" else HTTPStatus.CREATED
 
 
+@bp.route("/internal/filings/colin_ids/existing", methods=["POST"])
+@cross_origin()
+@jwt.has_one_of_roles([UserRoles.colin])
+def get_existing_colin_event_ids():
+    """Return which of the given colin event ids and business identifiers already exist in legal.
+
+    Lets the updater job check a whole page of colin events in one round trip instead of one call per event.
+    """
+    json_input = request.get_json(silent=True)
+    if not json_input:
+        return {"message": "No colinIds or identifiers in body of post."}, HTTPStatus.BAD_REQUEST
+
+    colin_ids = json_input.get("colinIds", [])
+    identifiers = json_input.get("identifiers", [])
+    return jsonify({
+        "colinIds": ColinEventId.get_existing_colin_ids(colin_ids) if colin_ids else [],
+        "identifiers": Business.get_existing_identifiers(identifiers) if identifiers else []
+    }), HTTPStatus.OK
+
+
 @bp.route("/internal/last-event-id/<identifier>", methods=["GET"])
 @cross_origin()
 @jwt.has_one_of_roles([UserRoles.colin])
@@ -487,10 +559,7 @@ def get_all_identifiers_without_tax_id():
     Excludes COOPS because they do not get a tax id/business number.
     Excludes SP/GP we don't sync firms to colin, we use entity-bn to get tax id/business number from CRA.
     """
-    identifiers = []
-    bussinesses_no_taxid = Business.get_all_by_no_tax_id()
-    for business in bussinesses_no_taxid:
-        identifiers.append(business.identifier)
+    identifiers = [row.identifier for row in Business.get_all_by_no_tax_id()]
     return jsonify({"identifiers": identifiers}), HTTPStatus.OK
 
 
@@ -503,12 +572,13 @@ def set_tax_ids():
     if not json_input:
         return ({"message": "No identifiers in body of post."}, HTTPStatus.BAD_REQUEST)
 
-    for identifier in json_input:
-        # json input is a dict -> identifier: tax id
-        business = Business.find_by_identifier(identifier)
-        if business:
-            business.tax_id = json_input[identifier]
-            business.save()
-        else:
+    # json input is a dict -> identifier: tax id
+    start = time.perf_counter()
+    results = Business.update_tax_ids(json_input)
+    elapsed = time.perf_counter() - start
+    for identifier, result in results.items():
+        if result == "not_found":
             current_app.logger.error(f"Unable to update tax_id for business ({identifier}), which is missing in lear")
-    return jsonify({"message": "Successfully updated tax ids."}), HTTPStatus.CREATED
+    current_app.logger.info(f"Set tax ids for {len(results)} identifiers in {elapsed:.3f}s "
+                            f"({len(results) / elapsed if elapsed else 0:.0f}/s)")
+    return jsonify({"message": "Successfully updated tax ids.", "results": results}), HTTPStatus.CREATED
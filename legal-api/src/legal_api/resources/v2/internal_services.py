@@ -21,6 +21,7 @@ from business_common.utils.datetime import date, datetime
 from business_model.models import Business, Filing, User, UserRoles
 from legal_api.resources.v2.business.business_filings.business_filings import ListFilingResource
 from legal_api.services.event_publisher import publish_to_queue
+from legal_api.services.reference_cache import ReferenceCache
 from legal_api.utils.auth import jwt
 
 bp = Blueprint("INTERNAL_SERVICE", __name__, url_prefix="/api/v2/internal")
@@ -45,6 +46,14 @@ def get_identifiers_of_expired_restoration():
                                     "legalType": business.legal_type} for business in businesses]}), HTTPStatus.OK
 
 
+@bp.route("/reference_caches", methods=["GET"])
+@cross_origin()
+@jwt.has_one_of_roles([UserRoles.system])
+def get_reference_cache_stats():
+    """Return the lookup counts and hit rate of the NAICS and MRAS caches in this instance."""
+    return jsonify(ReferenceCache.all_stats()), HTTPStatus.OK
+
+
 @bp.route("/bnmove", methods=["POST"])
 @cross_origin()
 @jwt.has_one_of_roles([UserRoles.system])
@@ -28,6 +28,7 @@ from business_common.utils.legislation_datetime import LegislationDatetime
 from business_model.models import Business, Filing
 from flask_jwt_oidc import JwtManager
 from legal_api.services import flags
+from legal_api.services.business_context import BusinessContext
 from legal_api.services.cache import cache
 from legal_api.services.digital_credentials_auth import (
     are_digital_credentials_allowed,
@@ -842,6 +843,18 @@ def get_allowed_filings(business: Business,   # noqa: PLR0913
                         is_authorization: bool = False
                         ):
     """Get allowed type of filing types for the current user."""
+    # the blocker checks of every filing type are answered from the same loaded filings
+    with BusinessContext.scope(business):
+        return _get_allowed_filings(business, state, legal_type, jwt, is_ignore_draft_blockers, is_authorization)
+
+
+def _get_allowed_filings(business: Business,   # noqa: PLR0913
+                         state: Business.State,
+                         legal_type: str,
+                         jwt: JwtManager,
+                         is_ignore_draft_blockers: bool,
+                         is_authorization: bool
+                         ):
     # importing here to avoid circular dependencies
     # pylint: disable=import-outside-toplevel
     from legal_api.core.meta import FilingMeta
@@ -987,7 +1000,8 @@ def business_blocker_check(business: Business, is_ignore_draft_blockers: bool =
     if business.get_amalgamated_into():
         business_blocker_checks[BusinessBlocker.AMALGAMATING_BUSINESS] = True
 
-    if business.in_dissolution:
+    business_context = BusinessContext.of(business)
+    if business_context.in_dissolution:
         business_blocker_checks[BusinessBlocker.IN_DISSOLUTION] = True
 
     if business.in_liquidation:
@@ -998,7 +1012,7 @@ def business_blocker_check(business: Business, is_ignore_draft_blockers: bool =
     if has_notice_of_withdrawal_filing_blocker(business, is_ignore_draft_blockers):
         business_blocker_checks[BusinessBlocker.FILING_WITHDRAWAL] = True
 
-    if len(business.public_user_dod_filings) >= MAX_PUBLIC_USER_DOD_FILINGS:
+    if len(business_context.public_user_dod_filings) >= MAX_PUBLIC_USER_DOD_FILINGS:
         business_blocker_checks[BusinessBlocker.MAX_DISSOLUTION_DELAYS_REACHED] = True
 
     return business_blocker_checks
@@ -1019,14 +1033,13 @@ def has_blocker_filing(business: Business, is_ignore_draft_blockers: bool = Fals
                                 Filing.Status.AWAITING_REVIEW.value,
                                 Filing.Status.CHANGE_REQUESTED.value,
                                 Filing.Status.APPROVED.value])
-    blocker_filing_matches = Filing.get_filings_by_status(business.id, filing_statuses)
-    if any(blocker_filing_matches):
+    business_context = BusinessContext.of(business)
+    if business_context.exists_filings_by_status(filing_statuses):
         return True
 
     filing_types = [CoreFiling.FilingTypes.ALTERATION.value, CoreFiling.FilingTypes.CORRECTION.value]
     excluded_statuses = [Filing.Status.DRAFT.value] if is_ignore_draft_blockers else []
-    blocker_filing_matches = Filing.get_incomplete_filings_by_types(business.id, filing_types, excluded_statuses)
-    return any(blocker_filing_matches)
+    return business_context.exists_incomplete_filings_by_types(filing_types, excluded_statuses)
 
 
 def has_blocker_valid_state_filing(state_filing: Filing, blocker_checks: dict):
@@ -1057,24 +1070,22 @@ def has_blocker_completed_filing(business: Business, blocker_checks: dict):
         return False
 
     filing_type_pairs = [(parse_filing_info(x)) for x in complete_filing_types]
-    completed_filings = Filing.get_filings_by_type_pairs(business.id,
-                                                         filing_type_pairs,
-                                                         [Filing.Status.COMPLETED.value],
-                                                         True)
+    completed_filings_count = BusinessContext.of(business).count_filings_by_type_pairs(filing_type_pairs,
+                                                                                       [Filing.Status.COMPLETED.value],
+                                                                                       distinct_pairs=True)
 
-    return len(completed_filings) != len(complete_filing_types)
+    return completed_filings_count != len(complete_filing_types)
 
 
 def has_blocker_max_filing(business: Business, blocker_checks: dict):
     """Check if business has too many of the filing."""
     for filing_type_pair_info, max in blocker_checks.get("maxFilings", {}).items():
         filing_type_pair = parse_filing_info(filing_type_pair_info)
-        filings = Filing.get_filings_by_type_pairs(business.id,
-                                                             [filing_type_pair],
-                                                             [Filing.Status.COMPLETED.value,
-                                                              Filing.Status.PAID.value,
-                                                              Filing.Status.PENDING.value])
-        if len(filings) >= max:
+        filings_count = BusinessContext.of(business).count_filings_by_type_pairs([filing_type_pair],
+                                                                                 [Filing.Status.COMPLETED.value,
+                                                                                  Filing.Status.PAID.value,
+                                                                                  Filing.Status.PENDING.value])
+        if filings_count >= max:
             return True
 
     return False
@@ -1087,10 +1098,10 @@ def has_blocker_future_effective_filing(business: Business, blocker_checks: dict
 
     filing_type_pairs = [(parse_filing_info(x)) for x in fed_filing_types]
 
-    pending_filings = Filing.get_filings_by_type_pairs(business.id,
-                                                       filing_type_pairs,
-                                                       [Filing.Status.PENDING.value, Filing.Status.PAID.value],
-                                                       True)
+    pending_filings = BusinessContext.of(business).get_filings_by_type_pairs(filing_type_pairs,
+                                                                             [Filing.Status.PENDING.value,
+                                                                              Filing.Status.PAID.value],
+                                                                             True)
 
     now = datetime.now(UTC)
     is_fed = any(f.effective_date > now for f in pending_filings)
@@ -1146,12 +1157,12 @@ def has_notice_of_withdrawal_filing_blocker(business: Business, is_ignore_draft_
                        Filing.Status.ERROR.value]
     if not is_ignore_draft_blockers:
         filing_statuses.append(Filing.Status.DRAFT.value)
-    blocker_filing_matches = Filing.get_filings_by_status(business.id, filing_statuses)
-    if any(blocker_filing_matches):
+    business_context = BusinessContext.of(business)
+    if business_context.exists_filings_by_status(filing_statuses):
         return True
 
     now = datetime.now(UTC)
-    paid_filings = Filing.get_filings_by_status(business.id, [Filing.Status.PAID.value])
+    paid_filings = business_context.get_filings_by_status([Filing.Status.PAID.value])
     return not any(f.effective_date and f.effective_date > now for f in paid_filings)
 
 
@@ -0,0 +1,154 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Filing and batch processing state of a business, loaded once and shared by the checks run for it.
+
+The warnings and allowed filings of a business are built from many small questions about the same filings,
+e.g. whether a pending filing exists or how many filings of a type were completed. Inside
+BusinessContext.scope(business) the filing header columns and the batch processing rows of the business are
+loaded once, and every check answers from them instead of running its own query.
+
+A scope only lives for one block of a request, so code that changes filings is never given a snapshot taken
+before the change. Outside a scope BusinessContext.of(business) returns a context for that one caller.
+"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property
+
+from flask import g, has_app_context
+
+from business_model.models import Batch, BatchProcessing, Business, Filing, db
+
+
+class BusinessContext:
+    """The filings and batch processing state of one business.
+
+    The query methods mirror the Filing model methods of the same name, for the filings of this business.
+    """
+
+    def __init__(self, business: Business):
+        """Create the context; nothing is loaded until a check needs it."""
+        self.business = business
+
+    @staticmethod
+    @contextmanager
+    def scope(business: Business | None) -> Iterator["BusinessContext | None"]:
+        """Share one context for the business with every check run inside the block.
+
+        A scope opened for a business that already has one reuses the outer context. Without a business the
+        block runs without a context.
+        """
+        if not business:
+            yield None
+            return
+
+        contexts = g.setdefault("business_contexts", {})
+        if context := contexts.get(business.id):
+            yield context
+            return
+
+        contexts[business.id] = context = BusinessContext(business)
+        try:
+            yield context
+        finally:
+            contexts.pop(business.id, None)
+
+    @staticmethod
+    def current(business: Business) -> "BusinessContext | None":
+        """Return the context of the scope open for the business, or None if there is none."""
+        if has_app_context():
+            return g.get("business_contexts", {}).get(business.id)
+        return None
+
+    @staticmethod
+    def of(business: Business) -> "BusinessContext":
+        """Return the context of the scope open for the business, or a new one if there is none."""
+        return BusinessContext.current(business) or BusinessContext(business)
+
+    @cached_property
+    def filings(self) -> list:
+        """Return the header columns of every filing of the business; the JSONB documents are not loaded."""
+        # pylint: disable=protected-access
+        return db.session.query(
+            Filing.id,
+            Filing._filing_type.label("filing_type"),
+            Filing._filing_sub_type.label("filing_sub_type"),
+            Filing._status.label("status"),
+            Filing._filing_date.label("filing_date"),
+            Filing.effective_date,
+            Filing.transaction_id
+        ).filter(Filing.business_id == self.business.id).\
+            order_by(Filing.id).\
+            all()
+
+    @cached_property
+    def batch_processings(self) -> list:
+        """Return the batch processing rows of the business, with the status of their batch."""
+        return db.session.query(
+            BatchProcessing.id,
+            BatchProcessing.step,
+            BatchProcessing.status,
+            BatchProcessing.trigger_date,
+            BatchProcessing.last_modified,
+            Batch.status.label("batch_status")
+        ).join(Batch, Batch.id == BatchProcessing.batch_id).\
+            filter(BatchProcessing.business_id == self.business.id).\
+            order_by(BatchProcessing.id).\
+            all()
+
+    @cached_property
+    def in_dissolution(self) -> bool:
+        """Return Business.in_dissolution, computed once."""
+        return self.business.in_dissolution
+
+    @cached_property
+    def public_user_dod_filings(self) -> list:
+        """Return Business.public_user_dod_filings, computed once."""
+        return self.business.public_user_dod_filings
+
+    def get_filings_by_status(self, status: list) -> list:
+        """Return the filings with statuses in the status array input."""
+        return [filing for filing in self.filings if filing.status in status]
+
+    def exists_filings_by_status(self, status: list) -> bool:
+        """Return whether a filing with a status in the status array input exists."""
+        return any(filing.status in status for filing in self.filings)
+
+    def exists_incomplete_filings_by_types(self, filing_types: list, excluded_statuses: list | None = None) -> bool:
+        """Return whether a filing of particular types that is not completed or withdrawn exists."""
+        excluded_statuses = [Filing.Status.COMPLETED.value, Filing.Status.WITHDRAWN.value, *(excluded_statuses or [])]
+        return any(filing.filing_type in filing_types and filing.status not in excluded_statuses
+                   for filing in self.filings)
+
+    def get_filings_by_type_pairs(self, filing_type_pairs: list, status: list, return_unique_pairs=False) -> list:
+        """Return the filings of particular filing type/sub-type pairs as well as statuses.
+
+        If return_unique_pairs is True, only return the latest filing of each filing type/sub-type pair.
+        """
+        filing_type_pairs = set(filing_type_pairs)
+        filings = [filing for filing in self.filings
+                   if filing.status in status and (filing.filing_type, filing.filing_sub_type) in filing_type_pairs]
+        if return_unique_pairs:
+            # filings are in id order, so the last one of each pair is kept
+            filings = list({(filing.filing_type, filing.filing_sub_type): filing for filing in filings}.values())
+        return filings
+
+    def count_filings_by_type_pairs(self, filing_type_pairs: list, status: list, distinct_pairs=False) -> int:
+        """Return the number of filings of particular filing type/sub-type pairs as well as statuses.
+
+        If distinct_pairs is True, return the number of distinct filing type/sub-type pairs found.
+        """
+        filings = self.get_filings_by_type_pairs(filing_type_pairs, status)
+        if distinct_pairs:
+            return len({(filing.filing_type, filing.filing_sub_type) for filing in filings})
+        return len(filings)
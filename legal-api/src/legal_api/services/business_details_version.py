@@ -14,6 +14,7 @@
 
 """This provides the service for getting business details as of a filing."""
 # pylint: disable=singleton-comparison ; pylint does not recognize sqlalchemy ==
+import copy
 from datetime import datetime
 from typing import Final
 
@@ -64,6 +65,9 @@ class VersionedBusinessDetailsService:  # pylint: disable=too-many-public-method
         elif filing.filing_type == "correction":
             revision_json = filing.json
 
+            # filing.json shares its sections with the stored filing, copy the one rewritten below
+            if incorporation_application := revision_json["filing"].get("incorporationApplication"):
+                revision_json["filing"]["incorporationApplication"] = copy.deepcopy(incorporation_application)
             # This is required to find diff
             for party in revision_json.get("filing", {}).get("incorporationApplication", {}).get("parties", []):
                 party["id"] = party.get("officer", {}).get("id", None)
@@ -455,10 +455,10 @@ def _is_business_affliated(identifier, account_id):
 
 
 def _has_pending_filing(amalgamating_business: Business):
-    return bool(Filing.get_filings_by_status(amalgamating_business.id,
-                                             [Filing.Status.DRAFT.value,
-                                              Filing.Status.PENDING.value,
-                                              Filing.Status.PAID.value]))
+    return Filing.exists_filings_by_status(amalgamating_business.id,
+                                           [Filing.Status.DRAFT.value,
+                                            Filing.Status.PENDING.value,
+                                            Filing.Status.PAID.value])
 
 
 def validate_party(filing: dict, amalgamation_type, filing_type) -> list:
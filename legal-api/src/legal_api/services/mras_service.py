@@ -18,29 +18,41 @@ import requests
 from flask import current_app
 from lxml import etree
 
+from legal_api.services.reference_cache import ReferenceCache, UpstreamError
+
 
 class MrasService:
     """Provides services to use MRAS APIs."""
 
     NAMESPACE = {"mras": "http://mras.ca/schema/v1"}
 
+    _cache = ReferenceCache("mras", "MRAS_CACHE")
+
     @staticmethod
     def get_jurisdictions(identifier: str):
-        """Return foreign jurisdiction info for the given BC corps."""
+        """Return foreign jurisdiction info for the given BC corps, or None if MRAS is unavailable."""
+        return MrasService._cache.get(identifier, MrasService._fetch_jurisdictions)
+
+    @staticmethod
+    def _fetch_jurisdictions(identifier: str):
+        mras_url = f'{current_app.config.get("MRAS_SVC_URL")}/api/v1/xpr/jurisdictions/{identifier}'
+        headers = {
+            "x-api-key": current_app.config.get("MRAS_SVC_API_KEY"),
+            "Accept": "application/xml"
+        }
         try:
-            mras_url = f'{current_app.config.get("MRAS_SVC_URL")}/api/v1/xpr/jurisdictions/{identifier}'
-            headers = {
-                "x-api-key": current_app.config.get("MRAS_SVC_API_KEY"),
-                "Accept": "application/xml"
-            }
             response = requests.get(
                 mras_url,
-                headers=headers
+                headers=headers,
+                timeout=current_app.config.get("REFERENCE_API_TIMEOUT")
             )
+        except requests.exceptions.RequestException as err:
+            raise UpstreamError(err) from err
 
-            if response.status_code != HTTPStatus.OK:
-                return None
+        if response.status_code != HTTPStatus.OK:
+            raise UpstreamError(f"MRAS responded with status {response.status_code}")
 
+        try:
             xml_content = etree.fromstring(response.content)  # pylint: disable=c-extension-no-member
             registered_jurisdictions_info = xml_content.xpath(
                 ".//mras:Jurisdiction[mras:TargetProfileID]",
@@ -58,5 +70,4 @@ class MrasService:
                 results.append(info)
             return results
         except Exception as err:
-            current_app.logger.error(err)
-            return None
+            raise UpstreamError(err) from err
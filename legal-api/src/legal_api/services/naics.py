@@ -13,29 +13,39 @@
 # limitations under the License.
 
 """This provides the service for naics-api calls."""
-
+from http import HTTPStatus
 
 import requests
 from flask import current_app
 
 from business_account import AccountService
+from legal_api.services.reference_cache import ReferenceCache, UpstreamError
 
 
 class NaicsService:
     """Provides services to use the naics-api."""
 
+    _cache = ReferenceCache("naics", "NAICS_CACHE")
+
     @staticmethod
     def find_by_code(naics_code: str):
-        """Return NAICS Structure matching code."""
+        """Return NAICS Structure matching code, or None if there is none or the naics-api is unavailable."""
+        return NaicsService._cache.get(naics_code, NaicsService._fetch_by_code)
+
+    @staticmethod
+    def _fetch_by_code(naics_code: str):
+        if not (token := AccountService.get_bearer_token()):
+            raise UpstreamError("no bearer token")
         try:
-            naics_url = current_app.config.get("NAICS_API_URL")
-            token = AccountService.get_bearer_token()
-            response = requests.get(naics_url + "/" + naics_code, headers={
-                "Content-Type": "application/json",
-                "Authorization": "Bearer " + token
-            })
+            response = requests.get(current_app.config.get("NAICS_API_URL") + "/" + naics_code,
+                                    headers={
+                                        "Content-Type": "application/json",
+                                        "Authorization": "Bearer " + token
+                                    },
+                                    timeout=current_app.config.get("REFERENCE_API_TIMEOUT"))
+            if response.status_code == HTTPStatus.NOT_FOUND:
+                return None
             response.raise_for_status()
             return response.json()
-        except Exception as err:
-            current_app.logger.error(err)
-            return None
+        except (requests.exceptions.RequestException, ValueError) as err:
+            raise UpstreamError(err) from err
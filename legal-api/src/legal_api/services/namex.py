@@ -15,14 +15,13 @@
 """This provides the service for namex-api calls."""
 from datetime import datetime
 from enum import Enum
-from http import HTTPStatus
 
 import datedelta
 import pytz
 import requests
 from flask import current_app
 
-from business_account import AccountService
+from business_account import AccountService, TokenError, TokenProvider
 from business_model.models import Filing
 
 from .utils import get_str
@@ -91,14 +90,11 @@ class NameXService:
         namex_url = current_app.config.get("NAMEX_SVC_URL")
 
         # Get access token for namex-api in a different keycloak realm
-        auth = requests.post(auth_url, auth=(username, secret), headers={
-            "Content-Type": "application/x-www-form-urlencoded"}, data={"grant_type": "client_credentials"})
-
-        # Return the auth response if an error occurs
-        if auth.status_code != HTTPStatus.OK:
-            return auth.json()
-
-        token = dict(auth.json())["access_token"]
+        try:
+            token = TokenProvider.for_client(auth_url, username, secret).get_token()
+        except TokenError as err:
+            # Return the auth response if an error occurs
+            return err.response.json()
 
         # Perform update proxy call using nr number (e.g. NR 1234567)
         nr_response = requests.put(namex_url + "/requests/" + nr_json["nrNum"], headers={
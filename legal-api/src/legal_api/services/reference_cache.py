@@ -0,0 +1,170 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A bounded TTL cache for lookups against reference data APIs (e.g. NAICS, MRAS).
+
+Values are kept in a bounded in-process cache and in the configured shared cache, so the upstream API is called
+at most once per key every <PREFIX>_TTL seconds. Keys the upstream does not know are cached as None for
+<PREFIX>_NEGATIVE_TTL seconds. When a refresh fails, the expired value is still served for up to
+<PREFIX>_STALE_TTL seconds instead of failing the caller.
+"""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any, ClassVar
+
+from flask import current_app
+
+from legal_api.services.cache import cache
+
+
+class UpstreamError(Exception):
+    """The upstream API could not be reached or did not return a usable response."""
+
+
+@dataclass
+class CacheStats:
+    """Lookup counts of a reference cache."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict:
+        """Return the counts and the share of lookups answered without a successful upstream call."""
+        lookups = self.hits + self.stale_hits + self.misses + self.errors
+        return {
+            **asdict(self),
+            "lookups": lookups,
+            "hitRate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else None
+        }
+
+
+class ReferenceCache:
+    """A named cache for one reference lookup, configured by the <PREFIX>_* config values."""
+
+    _caches: ClassVar[dict[str, "ReferenceCache"]] = {}
+
+    def __init__(self, name: str, config_prefix: str, maxsize: int = 1024):
+        """Create the cache; the TTLs are read from the app config on each lookup."""
+        self.name = name
+        self._config_prefix = config_prefix
+        self._maxsize = maxsize
+        # key -> (value, fresh_until, stale_until) in epoch seconds, least recently used first
+        self._entries: OrderedDict[str, tuple[Any, float, float]] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        ReferenceCache._caches[name] = self
+
+    @classmethod
+    def all_stats(cls) -> dict:
+        """Return the stats of every reference cache, keyed by name."""
+        return {name: reference_cache.stats() for name, reference_cache in cls._caches.items()}
+
+    @classmethod
+    def clear_all(cls):
+        """Empty every reference cache and reset its stats, e.g. between tests."""
+        for reference_cache in cls._caches.values():
+            reference_cache.clear()
+
+    def stats(self) -> dict:
+        """Return the lookup counts and hit rate of this cache."""
+        with self._lock:
+            return self._stats.as_dict()
+
+    def clear(self):
+        """Empty the cache, including the entries it put in the shared cache, and reset its stats."""
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._stats = CacheStats()
+        if keys:
+            self._shared(cache.delete_many, *[self._shared_key(key) for key in keys])
+
+    def get(self, key: str, loader: Callable[[str], Any]) -> Any:
+        """Return the value for key, calling loader(key) when there is no fresh value cached.
+
+        The loader returns None for a key the upstream does not know and raises UpstreamError when the upstream
+        fails. On failure the last value is returned if it is not older than the stale TTL, otherwise None.
+        """
+        now = time.time()
+        entry = self._get_entry(key, now)
+        if entry and now < entry[1]:
+            self._count("hits")
+            return entry[0]
+
+        try:
+            value = loader(key)
+        except UpstreamError as err:
+            if entry and now < entry[2]:
+                self._count("stale_hits")
+                current_app.logger.warning(f"Serving stale {self.name} value for {key}: {err}")
+                return entry[0]
+            self._count("errors")
+            current_app.logger.error(f"Failed to get {self.name} value for {key}: {err}")
+            return None
+
+        self._count("misses")
+        self._set_entry(key, value, now)
+        return value
+
+    def _config(self, name: str) -> int:
+        return current_app.config.get(f"{self._config_prefix}_{name}")
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+    def _shared_key(self, key: str) -> str:
+        return f"reference_{self.name}_{key}"
+
+    def _shared(self, operation: Callable, *args):
+        # the shared cache only saves upstream calls, so an outage of it must not fail the lookup
+        try:
+            return operation(*args)
+        except Exception as err:  # pylint: disable=broad-exception-caught;
+            current_app.logger.warning(f"Shared cache unavailable for {self.name}: {err!r}")
+            return None
+
+    def _get_entry(self, key: str, now: float) -> tuple[Any, float, float] | None:
+        with self._lock:
+            if entry := self._entries.get(key):
+                self._entries.move_to_end(key)
+        if entry and now < entry[1]:
+            return entry
+        # another worker may have refreshed it since this one cached it
+        if (shared_entry := self._shared(cache.get, self._shared_key(key))) and now < shared_entry[2]:
+            shared_entry = tuple(shared_entry)
+            self._put_local(key, shared_entry)
+            return shared_entry
+        return entry
+
+    def _set_entry(self, key: str, value: Any, now: float):
+        if value is None:
+            fresh_until = stale_until = now + self._config("NEGATIVE_TTL")
+        else:
+            fresh_until = now + self._config("TTL")
+            stale_until = fresh_until + self._config("STALE_TTL")
+        entry = (value, fresh_until, stale_until)
+        self._put_local(key, entry)
+        self._shared(cache.set, self._shared_key(key), entry, int(stale_until - now) + 1)
+
+    def _put_local(self, key: str, entry: tuple[Any, float, float]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
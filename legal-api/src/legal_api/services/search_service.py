@@ -271,7 +271,8 @@ class BusinessSearchService:  # pylint: disable=too-many-public-methods
 
         limit = search_filters.limit
         offset = (search_filters.page - 1) * limit
-        draft_query = db.session.query(Filing).filter(*filters).limit(limit+1).offset(offset).all()
+        draft_query = db.session.query(Filing).options(Filing.with_documents()). \
+            filter(*filters).limit(limit+1).offset(offset).all()
         draft_results = []
         # base filings query (for draft incorporation/registration filings -- treated as 'draft' business in auth-web)
         for draft_dao in draft_query[:limit]:
@@ -15,9 +15,10 @@
 """Service to check compliancy for a business."""
 from business_model.models import Business
 from dissolution_service import InvoluntaryDissolutionService
+from legal_api.services.warnings.warning_cache import get_cached_warnings
 
 from . import BusinessWarningCodes, WarningType
-from .corps import check_business as corps_check
+from .corps import check_amalgamating_business, check_transition_application
 from .firms import check_business as firms_check
 from .involuntary_dissolution import check_business as involuntary_dissolution_check
 
@@ -26,12 +27,24 @@ def check_business(business: Business) -> list:
     """Check business for warnings."""
     result = []
 
+    if business.legal_type in Business.CORPS:
+        # the amalgamation is filed against the new business, so its changes are not covered by the version key
+        result.extend(check_amalgamating_business(business))
+    result.extend(get_cached_warnings(business, _check_business))
+
+    return result
+
+
+def _check_business(business: Business) -> list:
+    """Check business for the warnings derived from its own data."""
+    result = []
+
     if business.legal_type in \
             (Business.LegalTypes.SOLE_PROP.value,
              Business.LegalTypes.PARTNERSHIP.value):
         result = firms_check(business)
     elif business.legal_type in Business.CORPS:
-        result = corps_check(business)
+        result = check_transition_application(business)
 
     if business.legal_type in InvoluntaryDissolutionService.ELIGIBLE_TYPES:
         result.extend(involuntary_dissolution_check(business))
@@ -20,6 +20,7 @@ from business_common.utils.datetime import datetime
 from business_model.models import BatchProcessing, Business
 from dissolution_service import InvoluntaryDissolutionService
 from legal_api.services import flags
+from legal_api.services.business_context import BusinessContext
 
 from . import BusinessWarningCodes, WarningType
 
@@ -66,7 +67,7 @@ def check_business(business: Business) -> list:
         elif dis_details.ar_overdue:
             result.append(ar_overdue_warning)
 
-        data = _get_modified_warning_data(batch_processing, len(business.public_user_dod_filings))
+        data = _get_modified_warning_data(batch_processing, len(BusinessContext.of(business).public_user_dod_filings))
 
         result.append({
             "code": BusinessWarningCodes.DISSOLUTION_IN_PROGRESS,
@@ -0,0 +1,94 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cache of the computed warnings of a business.
+
+Warnings are stored under a version key built from everything they are derived from: the business row, its
+filings, its batch processing rows, the time based thresholds it has crossed and the involuntary dissolution
+filter flag. When any of those change the key changes, so a cached result is never served for a business that
+has changed since it was computed.
+"""
+import hashlib
+import json
+from collections.abc import Callable
+
+from flask import current_app
+from sqlalchemy import func
+
+from business_common.utils.datetime import datetime
+from business_model.models import Business, DissolutionEligibility, Filing, db
+from legal_api.services import flags
+from legal_api.services.business_context import BusinessContext
+from legal_api.services.cache import cache
+from legal_api.services.request_context import get_request_context
+
+
+def get_version_key(business: Business) -> str:
+    """Return a key that changes whenever the warnings of the business may have changed."""
+    now = datetime.utcnow()
+
+    # a filing being submitted, paid, withdrawn or completed changes at least one of these
+    in_progress_statuses = [Filing.Status.PENDING.value, Filing.Status.PAID.value]
+    if business_context := BusinessContext.current(business):
+        # the scope loads the filings once for all of its checks
+        filings = [
+            len(business_context.filings),
+            max((filing.id for filing in business_context.filings), default=None),
+            max((filing.transaction_id for filing in business_context.filings if filing.transaction_id),
+                default=None),
+            len(business_context.get_filings_by_status(in_progress_statuses))
+        ]
+    else:
+        # without a scope one aggregate row is enough, loading every filing is left to callers that need them
+        business_context = BusinessContext(business)
+        filings = list(db.session.query(
+            func.count(Filing.id),
+            func.max(Filing.id),
+            func.max(Filing.transaction_id),
+            func.count(Filing.id).filter(Filing._status.in_(in_progress_statuses))  # pylint: disable=protected-access
+        ).filter(Filing.business_id == business.id).one())
+
+    thresholds_crossed = []
+    if eligibility := DissolutionEligibility.find_by_business_id(business.id):
+        thresholds_crossed = [bool(threshold and threshold <= now)
+                              for threshold in (eligibility.ar_overdue_date, eligibility.transition_overdue_date)]
+
+    request_context = get_request_context()
+    dissolution_filter = None
+    if flags.is_on("enable-involuntary-dissolution-filter", request_context.user, request_context.account_id):
+        dissolution_filter = flags.value("involuntary-dissolution-filter") or {}
+
+    version = json.dumps([
+        business.last_modified,
+        filings,
+        [list(batch_processing) for batch_processing in business_context.batch_processings],
+        # warning data is computed from today's date, so results are not reused across days
+        now.date(),
+        thresholds_crossed,
+        dissolution_filter
+    ], default=str, sort_keys=True)
+    return hashlib.sha256(version.encode()).hexdigest()
+
+
+def get_cached_warnings(business: Business, check: Callable[[Business], list]) -> list:
+    """Return the result of check(business), reusing the cached result while the business is unchanged."""
+    if not (timeout := current_app.config.get("WARNINGS_CACHE_TTL")):
+        return check(business)
+
+    cache_key = f"business_warnings_{business.id}_{get_version_key(business)}"
+    if (warnings := cache.get(cache_key)) is not None:
+        return warnings
+
+    warnings = check(business)
+    cache.set(cache_key, warnings, timeout=timeout)
+    return warnings
@@ -35,6 +35,8 @@ from business_common.utils import datetime as common_datetime
 from business_model.models import db as _db
 from legal_api import create_app, jwt as _jwt
 from legal_api.config import TestConfig
+from legal_api.services.cache import cache
+from legal_api.services.reference_cache import ReferenceCache
 
 postgres = PostgresContainer("postgres:16-alpine")
 
@@ -169,6 +171,13 @@ def database_setup(database_service, app):
     upgrade() 
 
 
+@pytest.fixture(autouse=True)
+def clear_caches(app):
+    """Start each test without cached NAICS / MRAS lookups or business warnings."""
+    ReferenceCache.clear_all()
+    cache.clear()
+
+
 @pytest.fixture(scope='function')
 def session(database_setup):
     """Per-test DB session with SAVEPOINT-based isolation.
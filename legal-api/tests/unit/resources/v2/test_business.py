@@ -417,6 +417,35 @@ def test_get_business_with_unauthoized_role(app, session, client, jwt, monkeypat
         assert rv.status_code == (HTTPStatus.UNAUTHORIZED if auth_check_on else HTTPStatus.OK)
 
 
+@pytest.mark.parametrize('test_name,orgs,expected_account_id', [
+    ('affiliated', [{'id': 111}, {'id': 123}], '123'),
+    ('not-affiliated', [{'id': 111}], None),
+])
+def test_get_business_account_info(app, session, client, jwt, requests_mock, mock_bearer_token,
+                                   test_name, orgs, expected_account_id):
+    """Assert that the account lookup run alongside the business lookup sets the accountId when affiliated."""
+    identifier = 'CP7654321'
+    business = factory_business_model(legal_name=identifier + ' legal name',
+                                      identifier=identifier,
+                                      founding_date=datetime.fromtimestamp(0, UTC),
+                                      last_ledger_timestamp=datetime.fromtimestamp(0, UTC),
+                                      last_modified=datetime.fromtimestamp(0, UTC),
+                                      fiscal_year_end_date=None,
+                                      tax_id=None,
+                                      dissolution_date=None)
+    factory_completed_filing(business, ANNUAL_REPORT)
+    orgs_mock = requests_mock.get(f"{app.config.get('AUTH_SVC_URL')}/orgs?affiliation={identifier}",
+                                  json={'orgs': orgs})
+
+    rv = client.get(f'/api/v2/businesses/{identifier}?account=123',
+                    headers=create_header(jwt, [SYSTEM_ROLE], identifier))
+
+    assert rv.status_code == HTTPStatus.OK
+    assert orgs_mock.call_count == 1
+    assert rv.json['business'].get('accountId') == expected_account_id
+    assert rv.json['business']['submitter']
+
+
 def test_get_business_with_correction_filings(session, client, jwt):
     """Assert that the business info sets hasCorrections property."""
     identifier = 'CP7654321'
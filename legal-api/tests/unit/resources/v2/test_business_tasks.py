@@ -24,6 +24,7 @@ from unittest.mock import patch
 import datedelta
 import pytest
 from freezegun import freeze_time
+from requests import exceptions as requests_exceptions
 
 from business_model.models import Business
 from legal_api.services.authz import STAFF_ROLE
@@ -259,6 +260,74 @@ def test_get_tasks_forwards_account_linking_key(app, session, client, jwt, reque
     assert pay_mock.last_request.headers.get('Account-Linking-Key') == 'test-linking-key'
 
 
+def _factory_unpaid_filings(business, payment_tokens):
+    """Create a draft filing awaiting payment for each payment token."""
+    from business_model.models import Filing
+    from tests.unit.models import AR_FILING
+
+    for payment_token in payment_tokens:
+        filing = Filing()
+        filing.business_id = business.id
+        filing.filing_date = datetime(2019, 8, 5, 7, 7, 58, 272362)
+        filing.filing_json = AR_FILING
+        filing.payment_token = payment_token
+        filing.payment_status_code = 'CREATED'
+        filing.save()
+
+
+def test_get_tasks_pay_details_cached(app, session, client, jwt, requests_mock):
+    """Assert that the pay details of each unpaid filing are looked up once and reused by the next request."""
+    identifier = 'CP7654321'
+    b = factory_business(identifier, last_ar_date=datetime(2019, 8, 13))
+    factory_business_mailing_address(b)
+    _factory_unpaid_filings(b, ['101', '102', '103'])
+    pay_mocks = [requests_mock.get(f"{app.config.get('PAYMENT_SVC_URL')}/{payment_token}",
+                                   json={'isPaymentActionRequired': True, 'paymentMethod': 'ONLINE_BANKING'})
+                 for payment_token in ['101', '102', '103']]
+
+    for _ in range(2):
+        rv = client.get(f'/api/v2/businesses/{identifier}/tasks', headers=create_header(jwt, [STAFF_ROLE], identifier))
+        assert rv.status_code == HTTPStatus.OK
+        headers = [task['task']['filing']['header'] for task in rv.json['tasks'] if 'filing' in task['task']]
+        assert len(headers) == 3
+        assert all(header['paymentMethod'] == 'ONLINE_BANKING' for header in headers)
+
+    assert [pay_mock.call_count for pay_mock in pay_mocks] == [1, 1, 1]
+
+
+def test_get_tasks_pay_partially_unavailable(app, session, client, jwt, requests_mock):
+    """Assert that the task list is returned without the pay details that could not be looked up."""
+    identifier = 'CP7654321'
+    b = factory_business(identifier, last_ar_date=datetime(2019, 8, 13))
+    factory_business_mailing_address(b)
+    _factory_unpaid_filings(b, ['101', '102'])
+    requests_mock.get(f"{app.config.get('PAYMENT_SVC_URL')}/101",
+                      json={'isPaymentActionRequired': False, 'paymentMethod': 'DIRECT_PAY'})
+    requests_mock.get(f"{app.config.get('PAYMENT_SVC_URL')}/102", exc=requests_exceptions.ReadTimeout)
+
+    rv = client.get(f'/api/v2/businesses/{identifier}/tasks', headers=create_header(jwt, [STAFF_ROLE], identifier))
+
+    assert rv.status_code == HTTPStatus.OK
+    headers = {task['task']['filing']['header']['paymentToken']: task['task']['filing']['header']
+               for task in rv.json['tasks'] if 'filing' in task['task']}
+    assert headers['101']['paymentMethod'] == 'DIRECT_PAY'
+    assert 'paymentMethod' not in headers['102']
+
+
+def test_get_tasks_pay_unreachable(app, session, client, jwt, requests_mock):
+    """Assert that the task list is unavailable when pay-api cannot be reached."""
+    identifier = 'CP7654321'
+    b = factory_business(identifier, last_ar_date=datetime(2019, 8, 13))
+    factory_business_mailing_address(b)
+    _factory_unpaid_filings(b, ['101', '102'])
+    requests_mock.get(f"{app.config.get('PAYMENT_SVC_URL')}/101", exc=requests_exceptions.ConnectionError)
+    requests_mock.get(f"{app.config.get('PAYMENT_SVC_URL')}/102", exc=requests_exceptions.ConnectionError)
+
+    rv = client.get(f'/api/v2/businesses/{identifier}/tasks', headers=create_header(jwt, [STAFF_ROLE], identifier))
+
+    assert rv.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
 def test_get_tasks_pending_correction_filings(session, client, jwt):
     """Assert that to-do list returns the error filings."""
     from freezegun import freeze_time
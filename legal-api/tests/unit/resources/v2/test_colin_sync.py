@@ -26,13 +26,15 @@ from registry_schemas.example_data import (
     ANNUAL_REPORT,
     CORRECTION_AR,
     CORRECTION_COL,
-    CORRECTION_COR
+    CORRECTION_COR,
+    DISSOLUTION
 )
 from tests.unit.services.utils import create_header
 from tests.unit.models import (
     factory_address,
     factory_business,
     factory_business_mailing_address,
+    factory_business_office,
     factory_completed_filing,
     factory_error_filing,
     factory_party_role,
@@ -85,6 +87,61 @@ def test_get_internal_filings(session, client, jwt):
     assert filings[1]['filingId'] == filing6.id
 
 
+def test_get_internal_filings_keyset_paging(session, client, jwt):
+    """Assert that the internal filings get endpoint pages after the last transaction id."""
+    b = factory_business('CP7654321')
+    factory_business_mailing_address(b)
+    filings = [factory_completed_filing(b, ANNUAL_REPORT) for _ in range(3)]
+
+    rv = client.get('/api/v2/businesses/internal/filings?limit=2',
+                    headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.OK
+    assert [f['filingId'] for f in rv.json['filings']] == [filings[0].id, filings[1].id]
+    assert rv.json['lastTransactionId'] == filings[1].transaction_id
+
+    rv = client.get(f'/api/v2/businesses/internal/filings?limit=2&afterTransactionId={rv.json["lastTransactionId"]}',
+                    headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.OK
+    assert [f['filingId'] for f in rv.json['filings']] == [filings[2].id]
+    assert rv.json['lastTransactionId'] == filings[2].transaction_id
+
+    rv = client.get(f'/api/v2/businesses/internal/filings?afterTransactionId={filings[2].transaction_id}',
+                    headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.json['filings'] == []
+    assert rv.json['lastTransactionId'] == filings[2].transaction_id
+
+
+def test_get_internal_filings_voluntary_dissolution_mailing_address(session, client, jwt):
+    """Assert that a voluntary dissolution uses the same mailing address fallbacks as Business.mailing_address."""
+    registered = factory_business('CP7654321')
+    factory_business_mailing_address(registered)
+    business_office = factory_business('CP1234567')
+    factory_business_office(business_office, 'businessOffice')
+    filings = [factory_completed_filing(b, copy.deepcopy(DISSOLUTION), filing_type='dissolution',
+                                        filing_sub_type='voluntary')
+               for b in (registered, business_office)]
+
+    rv = client.get('/api/v2/businesses/internal/filings', headers=create_header(jwt, [COLIN_SVC_ROLE]))
+
+    assert rv.status_code == HTTPStatus.OK
+    mailing_addresses = {f['filingId']: f['filing']['dissolution']['mailingAddress'] for f in rv.json['filings']}
+    assert mailing_addresses[filings[0].id]['streetAddress'] == 'CP7654321-Test Street'
+    assert mailing_addresses[filings[1].id]['streetAddress'] == 'CP1234567-Test Street MAILING'
+
+
+def test_set_tax_ids(session, client, jwt):
+    """Assert that the internal tax_ids post endpoint reports the outcome per identifier."""
+    factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+
+    rv = client.post('/api/v2/businesses/internal/tax_ids',
+                     json={'BC1234567': '987654321BC0001', 'BC0000000': '111111111BC0001'},
+                     headers=create_header(jwt, [COLIN_SVC_ROLE]))
+
+    assert rv.status_code == HTTPStatus.CREATED
+    assert rv.json['results'] == {'BC1234567': 'updated', 'BC0000000': 'not_found'}
+    assert Business.find_by_identifier('BC1234567').tax_id == '987654321BC0001'
+
+
 def test_patch_internal_filings(session, client, jwt):
     """Assert that the internal filings patch endpoint updates the colin_event_id."""
     # setup
@@ -130,6 +187,29 @@ def test_get_colin_id(session, client, jwt):
     assert rv.status_code == HTTPStatus.NOT_FOUND
 
 
+def test_get_existing_colin_ids(session, client, jwt):
+    """Assert the bulk colin id endpoint returns only the colin ids and identifiers already in legal."""
+    identifier = 'CP7654321'
+    b = factory_business(identifier)
+    factory_business_mailing_address(b)
+    filing = factory_completed_filing(b, ANNUAL_REPORT)
+    colin_event_id = ColinEventId()
+    colin_event_id.colin_event_id = 1234
+    filing.colin_event_ids.append(colin_event_id)
+    filing.save()
+
+    rv = client.post('/api/v2/businesses/internal/filings/colin_ids/existing',
+                     json={'colinIds': [1234, 1235], 'identifiers': [identifier, 'CP0000000']},
+                     headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json == {'colinIds': [1234], 'identifiers': [identifier]}
+
+    rv = client.post('/api/v2/businesses/internal/filings/colin_ids/existing',
+                     json={},
+                     headers=create_header(jwt, [COLIN_SVC_ROLE]))
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_get_colin_last_update(session, client, jwt):
     """Assert the get endpoint for ColinLastUpdate returns last updated colin id."""
     # setup
@@ -28,6 +28,7 @@ from registry_schemas.example_data import (
 from business_model.models import Business, Filing, UserRoles
 from legal_api.resources.v2 import internal_services
 from legal_api.resources.v2.internal_services import ListFilingResource
+from legal_api.services import MrasService
 from tests.unit.models import factory_business, factory_business_mailing_address
 from tests.unit.services.utils import create_header
 
@@ -97,6 +98,24 @@ def test_get_businesses_expired_restoration(session, client, jwt, test_name, exp
         assert len(rv.json['businesses']) == 0
 
 
+def test_get_businesses_expired_restoration_put_back_off_pending(session, client, jwt):
+    """Assert that a business already waiting on a put back off filing is not returned again."""
+    from tests.unit.models import factory_pending_filing
+    identifier = 'BC1234567'
+    business = factory_business(identifier=identifier, entity_type=Business.LegalTypes.COMP.value)
+    business.restoration_expiry_date = datetime.now(timezone.utc) - datedelta.datedelta(days=1)
+    business.save()
+    put_back_off = copy.deepcopy(FILING_HEADER)
+    put_back_off['filing']['header']['name'] = 'putBackOff'
+    put_back_off['filing']['putBackOff'] = {'details': 'Put back off filing due to expired limited restoration.'}
+    filing = factory_pending_filing(business, put_back_off)
+    assert filing.status == Filing.Status.PENDING.value
+
+    rv = client.get('/api/v2/internal/expired_restoration', headers=create_header(jwt, [UserRoles.system]))
+    assert rv.status_code == HTTPStatus.OK
+    assert len(rv.json['businesses']) == 0
+
+
 def test_update_bn_move(session, client, jwt):
     """Assert that the endpoint updates tax_id."""
     identifier = 'FM0000001'
@@ -129,3 +148,17 @@ def test_update_bn_move_missing_data(session, client, jwt, data):
                      headers=create_header(jwt, [UserRoles.system]),
                      json=data)
     assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_get_reference_cache_stats(session, client, jwt):
+    """Assert that the endpoint returns the hit rate of the reference caches."""
+    with patch.object(MrasService, '_fetch_jurisdictions', return_value=[]):
+        MrasService.get_jurisdictions('BC1234567')
+        MrasService.get_jurisdictions('BC1234567')
+
+    rv = client.get('/api/v2/internal/reference_caches', headers=create_header(jwt, [UserRoles.system]))
+    assert rv.status_code == HTTPStatus.OK
+    assert rv.json['mras']['hits'] == 1
+    assert rv.json['mras']['misses'] == 1
+    assert rv.json['mras']['hitRate'] == 0.5
+    assert rv.json['naics']['lookups'] == 0
@@ -838,8 +838,8 @@ def test_has_pending_filing(mocker, app, session, jwt, test_status, expected_cod
     mocker.patch('business_model.models.business.Business.find_by_identifier',
                  return_value=Business(identifier='BC1234567',
                                        legal_type=Business.LegalTypes.BCOMP.value))
-    mocker.patch('business_model.models.filing.Filing.get_filings_by_status',
-                 return_value=[Filing()] if test_status == 'FAIL' else [])
+    mocker.patch('business_model.models.filing.Filing.exists_filings_by_status',
+                 return_value=test_status == 'FAIL')
 
     with jwt_request_context(app, jwt, [STAFF_ROLE]):
         err = validate(None, filing)
@@ -0,0 +1,112 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the business context.
+
+Test suite to ensure that the checks answered from a business context match the Filing queries they replace.
+"""
+import copy
+from contextlib import nullcontext
+
+from registry_schemas.example_data import ANNUAL_REPORT
+from sqlalchemy import event
+
+from business_model.models import Business, Filing, db
+from legal_api.services.authz import STAFF_ROLE, get_allowed_filings
+from legal_api.services.business_context import BusinessContext
+from tests.unit.models import factory_business, factory_completed_filing, factory_filing, factory_pending_filing
+from tests.unit.services.utils import jwt_request_context
+
+
+def _factory_filings(business):
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT), filing_type='dissolution',
+                             filing_sub_type='delay')
+    factory_pending_filing(business, copy.deepcopy(ANNUAL_REPORT))
+    factory_filing(business, copy.deepcopy(ANNUAL_REPORT), filing_type='alteration')
+
+
+def test_checks_match_filing_queries(app, session):
+    """Assert that the context answers each check the same as the Filing query it replaces."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    _factory_filings(business)
+    context = BusinessContext(business)
+
+    for statuses in ([Filing.Status.COMPLETED.value],
+                     [Filing.Status.PENDING.value, Filing.Status.PAID.value],
+                     [Filing.Status.ERROR.value]):
+        assert context.exists_filings_by_status(statuses) == \
+            Filing.exists_filings_by_status(business.id, statuses)
+        assert {filing.id for filing in context.get_filings_by_status(statuses)} == \
+            {filing.id for filing in Filing.get_filings_by_status(business.id, statuses, with_documents=False)}
+
+    for excluded_statuses in ([], [Filing.Status.DRAFT.value]):
+        assert context.exists_incomplete_filings_by_types(['alteration', 'correction'], excluded_statuses) == \
+            Filing.exists_incomplete_filings_by_types(business.id, ['alteration', 'correction'], excluded_statuses)
+
+    pairs = [('annualReport', None), ('dissolution', 'delay'), ('dissolution', 'voluntary')]
+    statuses = [Filing.Status.COMPLETED.value, Filing.Status.PENDING.value]
+    for distinct_pairs in (False, True):
+        assert context.count_filings_by_type_pairs(pairs, statuses, distinct_pairs) == \
+            Filing.count_filings_by_type_pairs(business.id, pairs, statuses, distinct_pairs)
+    for return_unique_pairs in (False, True):
+        filings = context.get_filings_by_type_pairs(pairs, statuses, return_unique_pairs)
+        queried_filings = Filing.get_filings_by_type_pairs(business.id, pairs, statuses, return_unique_pairs)
+        assert {filing.id for filing in filings} == {filing.id for filing in queried_filings}
+
+
+def test_context_shared_within_scope(app, session):
+    """Assert that checks inside a scope share one context and checks outside it do not."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+
+    with BusinessContext.scope(business) as context:
+        assert BusinessContext.of(business) is context
+        with BusinessContext.scope(business) as nested_context:
+            assert nested_context is context
+        assert BusinessContext.of(business) is context
+
+    assert BusinessContext.of(business) is not context
+
+
+def test_allowed_filings_load_filings_once(monkeypatch, app, session, jwt):
+    """Assert that the allowed filings run fewer statements with one shared context than with one per check."""
+    monkeypatch.setattr('legal_api.services.flags.value', lambda flag, _user, _account_id: {})
+    monkeypatch.setattr('business_model.models.User.get_or_create_user_by_jwt', lambda _: None)
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    # only completed filings, so no filing type is blocked before its own checks run
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT))
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT), filing_type='dissolution',
+                             filing_sub_type='delay')
+
+    def _count_statements():
+        statements = []
+
+        def count_statements(*args):  # pylint: disable=unused-argument
+            statements.append(args)
+
+        event.listen(db.engine, 'before_cursor_execute', count_statements)
+        try:
+            filing_types = get_allowed_filings(business, business.state, business.legal_type, jwt)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count_statements)
+        return filing_types, len(statements)
+
+    with jwt_request_context(app, jwt, roles=[STAFF_ROLE]):
+        filing_types, shared_count = _count_statements()
+        # without a scope every blocker check loads the filings again, like the queries it replaced
+        monkeypatch.setattr(BusinessContext, 'scope', staticmethod(lambda _business: nullcontext()))
+        unshared_filing_types, unshared_count = _count_statements()
+
+    assert filing_types == unshared_filing_types
+    assert shared_count < unshared_count, f'{shared_count} statements shared, {unshared_count} one per check'
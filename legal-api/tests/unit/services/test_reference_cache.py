@@ -0,0 +1,97 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the reference cache.
+
+Test suite to ensure that NAICS and MRAS lookups are cached as expected.
+"""
+from http import HTTPStatus
+
+from freezegun import freeze_time
+
+from legal_api.services import NaicsService
+from legal_api.services.reference_cache import ReferenceCache, UpstreamError
+
+
+NAICS_CODE = '112320'
+NAICS_RESPONSE = {'code': NAICS_CODE, 'classTitle': 'Broiler and other meat-type chicken production'}
+
+
+def test_naics_lookup_cached(app, mock_bearer_token, requests_mock):
+    """Assert that repeated lookups of a code only call the naics-api once."""
+    naics_mock = requests_mock.get(f'{app.config["NAICS_API_URL"]}/{NAICS_CODE}', json=NAICS_RESPONSE)
+
+    for _ in range(5):
+        assert NaicsService.find_by_code(NAICS_CODE) == NAICS_RESPONSE
+
+    assert naics_mock.call_count == 1
+    assert NaicsService._cache.stats()['hitRate'] == 0.8
+
+
+def test_naics_miss_cached(app, mock_bearer_token, requests_mock):
+    """Assert that a code the naics-api does not know is cached until the negative TTL passes."""
+    naics_mock = requests_mock.get(f'{app.config["NAICS_API_URL"]}/{NAICS_CODE}', status_code=HTTPStatus.NOT_FOUND)
+
+    with freeze_time('2026-01-01 00:00:00'):
+        assert NaicsService.find_by_code(NAICS_CODE) is None
+        assert NaicsService.find_by_code(NAICS_CODE) is None
+    assert naics_mock.call_count == 1
+
+    with freeze_time('2026-01-01 01:00:00'):
+        assert NaicsService.find_by_code(NAICS_CODE) is None
+    assert naics_mock.call_count == 2
+
+
+def test_naics_stale_served_on_upstream_failure(app, mock_bearer_token, requests_mock):
+    """Assert that an expired value is served when the naics-api fails, until the stale TTL passes."""
+    url = f'{app.config["NAICS_API_URL"]}/{NAICS_CODE}'
+    requests_mock.get(url, json=NAICS_RESPONSE)
+    with freeze_time('2026-01-01 00:00:00'):
+        assert NaicsService.find_by_code(NAICS_CODE) == NAICS_RESPONSE
+
+    requests_mock.get(url, status_code=HTTPStatus.SERVICE_UNAVAILABLE)
+    with freeze_time('2026-01-01 02:00:00'):
+        assert NaicsService.find_by_code(NAICS_CODE) == NAICS_RESPONSE
+    with freeze_time('2026-01-03 00:00:00'):
+        assert NaicsService.find_by_code(NAICS_CODE) is None
+
+    stats = NaicsService._cache.stats()
+    assert stats['misses'] == 1
+    assert stats['stale_hits'] == 1
+    assert stats['errors'] == 1
+
+
+def test_failure_not_cached(app):
+    """Assert that a failed lookup is retried on the next call."""
+    calls = []
+
+    def _loader(key):
+        calls.append(key)
+        if len(calls) == 1:
+            raise UpstreamError('unavailable')
+        return key.upper()
+
+    reference_cache = ReferenceCache('test_failure', 'NAICS_CACHE')
+    assert reference_cache.get('abc', _loader) is None
+    assert reference_cache.get('abc', _loader) == 'ABC'
+    assert reference_cache.get('abc', _loader) == 'ABC'
+    assert len(calls) == 2
+
+
+def test_local_cache_bounded(app):
+    """Assert that the in-process cache evicts the least recently used keys."""
+    reference_cache = ReferenceCache('test_bounded', 'NAICS_CACHE', maxsize=2)
+    for key in ('a', 'b', 'a', 'c'):
+        reference_cache.get(key, str.upper)
+
+    assert list(reference_cache._entries) == ['a', 'c']
@@ -0,0 +1,135 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test suite to ensure business warnings are cached until the business changes."""
+import copy
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from freezegun import freeze_time
+from registry_schemas.example_data import ANNUAL_REPORT
+from sqlalchemy import event
+
+from business_model.models import BatchProcessing, Business, db
+from legal_api.services import check_warnings
+from legal_api.services.business_context import BusinessContext
+from legal_api.services.warnings.business.business_checks import business as business_checks
+from legal_api.services.warnings.warning_cache import get_version_key
+from tests.unit.models import (
+    factory_batch,
+    factory_batch_processing,
+    factory_business,
+    factory_completed_filing,
+    factory_pending_filing,
+)
+
+
+def test_warnings_reused_while_unchanged(session):
+    """Assert that repeat checks of an unchanged business reuse the computed warnings."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+
+    with patch.object(business_checks, '_check_business', wraps=business_checks._check_business) as check:
+        first = check_warnings(business)
+        assert check_warnings(business) == first
+        assert check_warnings(business) == first
+
+    assert check.call_count == 1
+
+
+def test_warnings_recomputed_after_filing(session):
+    """Assert that completing a filing changes the version key."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    version = get_version_key(business)
+    assert get_version_key(business) == version
+
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT), filing_type='annualReport')
+
+    assert get_version_key(business) != version
+
+
+def test_warnings_recomputed_after_batch_processing_change(session):
+    """Assert that adding or updating a batch processing row changes the version key."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    version = get_version_key(business)
+
+    batch = factory_batch()
+    batch_processing = factory_batch_processing(batch.id, business.id, business.identifier)
+    added_version = get_version_key(business)
+    assert added_version != version
+
+    batch_processing.status = BatchProcessing.BatchProcessingStatus.WITHDRAWN
+    batch_processing.save()
+    assert get_version_key(business) != added_version
+
+
+def test_warnings_recomputed_next_day(session):
+    """Assert that warnings computed on one day are not reused the next."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+
+    with freeze_time('2026-01-01 12:00:00'):
+        version = get_version_key(business)
+    with freeze_time('2026-01-01 23:00:00'):
+        assert get_version_key(business) == version
+    with freeze_time('2026-01-02 01:00:00'):
+        assert get_version_key(business) != version
+
+
+def test_warnings_cache_disabled(app, session, monkeypatch):
+    """Assert that a WARNINGS_CACHE_TTL of 0 computes the warnings on every check."""
+    monkeypatch.setitem(app.config, 'WARNINGS_CACHE_TTL', 0)
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+
+    with patch.object(business_checks, '_check_business', return_value=[]) as check:
+        check_warnings(business)
+        check_warnings(business)
+
+    assert check.call_count == 2
+
+
+@contextmanager
+def _statements():
+    statements = []
+
+    def record_statement(_conn, _cursor, statement, *args):  # pylint: disable=unused-argument
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record_statement)
+
+
+def test_version_key_statements(session):
+    """Assert the version key runs the aggregate filing query without a scope and reuses the filings of a scope."""
+    business = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    factory_completed_filing(business, copy.deepcopy(ANNUAL_REPORT), filing_type='annualReport')
+    factory_pending_filing(business, copy.deepcopy(ANNUAL_REPORT))
+    # load the business row, so only the statements of the key are counted
+    get_version_key(business)
+
+    with _statements() as unscoped:
+        version = get_version_key(business)
+
+    with BusinessContext.scope(business) as context:
+        # loaded once for the warnings, blockers and allowed filings of the scope
+        assert len(context.filings) == 2
+        assert context.batch_processings == []
+        with _statements() as scoped:
+            assert get_version_key(business) == version
+
+    # the filings, batch processings and dissolution eligibility queries the key replaced
+    assert len(unscoped) == 3
+    assert not any('filings.effective_date' in statement for statement in unscoped), 'filing rows were loaded'
+    # only the dissolution eligibility is read inside the scope
+    assert len(scoped) == 1
@@ -13,3 +13,4 @@
 # limitations under the License.
 """This exports all classes, utility functions and helpers for the main package."""
 from .account_service import AccountService
+from .token_provider import TokenError, TokenProvider
@@ -21,6 +21,8 @@ from flask import current_app, has_request_context
 
 from flask_jwt_oidc import JwtManager
 
+from .token_provider import TokenError, TokenProvider
+
 
 class AccountService:
     """Wrapper to call Authentication Services.
@@ -28,7 +30,6 @@ class AccountService:
     @TODO:
       - Add init (set auth, jwt, etc. vars)
       - Add auth api call wrapper (see legal_api/services/authz.py).
-      - Cache and refresh / retry token as needed to reduce calls.
     """
 
     BEARER: ClassVar[str] = "Bearer "
@@ -43,23 +44,14 @@ class AccountService:
 
     @classmethod
     def get_bearer_token(cls):
-        """Get a valid Bearer token for the service to use."""
+        """Get a valid Bearer token for the service to use, cached until shortly before it expires."""
         token_url = current_app.config.get("ACCOUNT_SVC_AUTH_URL")
         client_id = current_app.config.get("ACCOUNT_SVC_CLIENT_ID")
         client_secret = current_app.config.get("ACCOUNT_SVC_CLIENT_SECRET")
 
-        data = "grant_type=client_credentials"
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={"content-type": "application/x-www-form-urlencoded"},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
         try:
-            return res.json().get("access_token")
-        except Exception:
+            return TokenProvider.for_client(token_url, client_id, client_secret, cls.timeout).get_token()
+        except TokenError:
             return None
 
     @classmethod
@@ -0,0 +1,104 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Service account (client credentials) tokens, cached until shortly before they expire.
+
+One provider is shared per token endpoint and client, so every caller in the process, on any thread,
+reuses the same token. When it is about to expire only one caller requests a new one; the others wait
+for it instead of each making their own grant.
+"""
+import threading
+import time
+from typing import ClassVar
+
+import requests
+
+
+class TokenError(Exception):
+    """The token endpoint did not return a token."""
+
+    def __init__(self, response: requests.Response):
+        """Keep the token endpoint response for the caller."""
+        super().__init__(f"Token request failed with status {response.status_code}")
+        self.response = response
+
+
+class TokenProvider:
+    """Client credentials tokens for one token endpoint and client."""
+
+    # refresh this many seconds before the token expires, so it is not used right as it expires
+    EXPIRY_LEEWAY: ClassVar[int] = 30
+
+    _providers: ClassVar[dict[tuple, "TokenProvider"]] = {}
+    _providers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, token_url: str, client_id: str, client_secret: str, timeout: int = 20):
+        """Create the provider; no token is requested until one is needed."""
+        self._token_url = token_url
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._timeout = timeout
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_client(cls, token_url: str, client_id: str, client_secret: str, timeout: int = 20) -> "TokenProvider":
+        """Return the provider shared by every caller of this token endpoint and client."""
+        key = (token_url, client_id, client_secret)
+        with cls._providers_lock:
+            if not (provider := cls._providers.get(key)):
+                provider = cls._providers[key] = cls(token_url, client_id, client_secret, timeout)
+            return provider
+
+    @classmethod
+    def clear(cls):
+        """Forget every cached token, e.g. between tests."""
+        with cls._providers_lock:
+            cls._providers = {}
+
+    def get_token(self) -> str:
+        """Return a token that is valid for at least EXPIRY_LEEWAY seconds.
+
+        Raises TokenError if the token endpoint does not return one.
+        """
+        if self._token and time.monotonic() < self._expires_at:
+            return self._token
+        with self._lock:
+            # another thread may have refreshed it while this one waited for the lock
+            if self._token and time.monotonic() < self._expires_at:
+                return self._token
+            self._token, self._expires_at = self._request_token()
+            return self._token
+
+    def invalidate(self):
+        """Drop the cached token, e.g. after it was rejected."""
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def _request_token(self) -> tuple[str, float]:
+        requested_at = time.monotonic()
+        res = requests.post(url=self._token_url,
+                            data="grant_type=client_credentials",
+                            headers={"content-type": "application/x-www-form-urlencoded"},
+                            auth=(self._client_id, self._client_secret),
+                            timeout=self._timeout)
+        try:
+            body = res.json()
+            token = body["access_token"]
+        except Exception as err:
+            raise TokenError(res) from err
+        # a response without expires_in is used once and not cached
+        expires_in = int(body.get("expires_in") or 0)
+        return token, requested_at + max(expires_in - self.EXPIRY_LEEWAY, 0)
@@ -17,7 +17,7 @@ from contextlib import contextmanager
 import pytest
 from flask import Flask
 
-from business_account import AccountService
+from business_account import AccountService, TokenProvider
 from business_account.config import TestConfig
 from flask_jwt_oidc import JwtManager
 
@@ -59,6 +59,14 @@ def app():
 
     return _app
 
+@pytest.fixture(autouse=True)
+def clear_tokens():
+    """Start every test without cached service account tokens."""
+    TokenProvider.clear()
+    yield
+    TokenProvider.clear()
+
+
 @pytest.fixture(scope="function")
 def account_service(app):
     with app.app_context():
@@ -0,0 +1,140 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests to assure the TokenProvider.
+
+Test-Suite to ensure that service account tokens are requested once per token lifetime.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from business_account import AccountService, TokenError, TokenProvider
+
+
+class _StubTokenEndpoint(ThreadingHTTPServer):
+    """Local client credentials endpoint that counts the grants it hands out."""
+
+    def __init__(self, expires_in=300, status=200):
+        self.grants = 0
+        self.expires_in = expires_in
+        self.status = status
+        self.grants_lock = threading.Lock()
+        super().__init__(("127.0.0.1", 0), _StubTokenHandler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/token"
+
+
+class _StubTokenHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.grants_lock:
+            self.server.grants += 1
+            grant = self.server.grants
+        # a slow grant, so concurrent callers pile up behind the first one
+        time.sleep(0.05)
+        body = {"access_token": f"token-{grant}", "expires_in": self.server.expires_in} \
+            if self.server.status == 200 else {"error": "unauthorized_client"}
+        payload = json.dumps(body).encode()
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def token_endpoint(request):
+    server = _StubTokenEndpoint(**getattr(request, "param", {}))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_one_grant_per_token_lifetime_under_load(token_endpoint):
+    """Assert that many threads asking for a token at once share a single grant."""
+    provider = TokenProvider.for_client(token_endpoint.url, "client", "secret")
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        tokens = list(executor.map(lambda _: provider.get_token(), range(500)))
+
+    assert set(tokens) == {"token-1"}
+    assert token_endpoint.grants == 1
+
+
+@pytest.mark.parametrize("token_endpoint", [{"expires_in": 1}], indirect=True)
+def test_token_refreshed_before_expiry(token_endpoint, monkeypatch):
+    """Assert that a new token is requested once the cached one is about to expire, and only once."""
+    monkeypatch.setattr(TokenProvider, "EXPIRY_LEEWAY", 0)
+    provider = TokenProvider.for_client(token_endpoint.url, "client", "secret")
+
+    assert provider.get_token() == "token-1"
+    assert provider.get_token() == "token-1"
+    time.sleep(1.1)
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        tokens = list(executor.map(lambda _: provider.get_token(), range(100)))
+
+    assert set(tokens) == {"token-2"}
+    assert token_endpoint.grants == 2
+
+
+def test_providers_shared_per_client(token_endpoint):
+    """Assert that callers of the same client share a token and other clients (e.g. realms) get their own."""
+    provider = TokenProvider.for_client(token_endpoint.url, "client", "secret")
+    assert TokenProvider.for_client(token_endpoint.url, "client", "secret") is provider
+    other = TokenProvider.for_client(token_endpoint.url, "other-client", "other-secret")
+    assert other is not provider
+
+    assert provider.get_token() == "token-1"
+    assert other.get_token() == "token-2"
+    assert provider.get_token() == "token-1"
+    provider.invalidate()
+    assert provider.get_token() == "token-3"
+
+
+@pytest.mark.parametrize("token_endpoint", [{"status": 401}], indirect=True)
+def test_failed_grant_not_cached(app, token_endpoint, monkeypatch):
+    """Assert that a failed grant raises for the provider, returns None from AccountService, and is retried."""
+    provider = TokenProvider.for_client(token_endpoint.url, "client", "secret")
+    with pytest.raises(TokenError) as err:
+        provider.get_token()
+    assert err.value.response.status_code == 401
+
+    monkeypatch.setitem(app.config, "ACCOUNT_SVC_AUTH_URL", token_endpoint.url)
+    with app.app_context():
+        assert AccountService.get_bearer_token() is None
+        assert AccountService.get_bearer_token() is None
+    assert token_endpoint.grants == 3
+
+
+def test_get_bearer_token_cached(app, token_endpoint, monkeypatch):
+    """Assert that AccountService reuses the service account token across calls."""
+    monkeypatch.setitem(app.config, "ACCOUNT_SVC_AUTH_URL", token_endpoint.url)
+    with app.app_context():
+        assert AccountService.get_bearer_token() == "token-1"
+        assert AccountService.get_bearer_token() == "token-1"
+
+    assert token_endpoint.grants == 1
@@ -16,12 +16,10 @@
 from dataclasses import dataclass
 from typing import Any, Final
 
-from sqlalchemy import and_, exists, func, not_, or_, select, text
-from sqlalchemy.orm import aliased
+from sqlalchemy import and_, case, exists, func, not_, or_
 
 from business_account import AccountService
-from business_common.core.filing import Filing as CoreFiling
-from business_model.models import Batch, BatchProcessing, Business, Filing, db
+from business_model.models import Batch, BatchProcessing, Business, DissolutionEligibility, Filing, db
 
 from .request_context import get_request_context
 
@@ -67,7 +65,9 @@ class InvoluntaryDissolutionService:
             eligibility_details (EligibilityDetails): Details regarding eligibility.
         """
         eligibility_filters = eligibility_filters or cls.EligibilityFilters()
-        query = cls._get_businesses_eligible_query(eligibility_filters, flags).filter(Business.identifier == identifier)
+        # a single business is cheap to check from its filings, which also covers changes made outside the filer
+        query = cls._get_businesses_eligible_query(eligibility_filters, flags, precomputed=False).\
+            filter(Business.identifier == identifier)
         result = query.one_or_none()
 
         if result is None:
@@ -102,11 +102,14 @@ class InvoluntaryDissolutionService:
             one_or_none()
 
     @staticmethod
-    def _get_businesses_eligible_query(eligibility_filters: EligibilityFilters | None = None, flags: Any = None):
+    def _get_businesses_eligible_query(eligibility_filters: EligibilityFilters | None = None,
+                                       flags: Any = None,
+                                       precomputed: bool = True):
         """Return SQLAlchemy clause for fetching businesses eligible for involuntary dissolution.
 
         Args:
             exclude_in_dissolution (bool): If True, exclude businesses already in dissolution.
+            precomputed (bool): If True, read the overdue cutoffs from the dissolution_eligibility table.
         """
         eligibility_filters = eligibility_filters or InvoluntaryDissolutionService.EligibilityFilters()
         in_dissolution = (
@@ -121,8 +124,13 @@ class InvoluntaryDissolutionService:
                 Batch.batch_type == Batch.BatchType.INVOLUNTARY_DISSOLUTION
             )
         )
-        specific_filing_overdue = _has_specific_filing_overdue() < func.timezone("UTC", func.now())
-        no_transition_filed_after_restoration = func.coalesce((_has_no_transition_filed_after_restoration()
+        if precomputed:
+            specific_filing_cutoff, transition_cutoff = _get_precomputed_cutoffs()
+        else:
+            specific_filing_cutoff = _has_specific_filing_overdue()
+            transition_cutoff = _has_no_transition_filed_after_restoration()
+        specific_filing_overdue = specific_filing_cutoff < func.timezone("UTC", func.now())
+        no_transition_filed_after_restoration = func.coalesce((transition_cutoff
                                                                <= func.timezone("UTC", func.now())), False)
 
         query = db.session.query(
@@ -134,6 +142,8 @@ class InvoluntaryDissolutionService:
             filter(Business.state == Business.State.ACTIVE).\
             filter(Business.legal_type.in_(InvoluntaryDissolutionService.ELIGIBLE_TYPES)).\
             filter(Business.no_dissolution.is_(False))
+        if precomputed:
+            query = query.outerjoin(DissolutionEligibility, DissolutionEligibility.business_id == Business.id)
 
         future_effective_filing = False if eligibility_filters.exclude_future_effective_filing \
             else _has_future_effective_filing()
@@ -157,9 +167,9 @@ class InvoluntaryDissolutionService:
             ).\
             order_by(
                 no_transition_filed_after_restoration.desc(),
-                _has_no_transition_filed_after_restoration().asc(),
+                transition_cutoff.asc(),
                 specific_filing_overdue.desc(),
-                _has_specific_filing_overdue().asc()
+                specific_filing_cutoff.asc()
             )
 
         query = query.filter(_check_feature_flags_filter(flags))
@@ -167,71 +177,36 @@ class InvoluntaryDissolutionService:
         return query
 
 
+def _get_precomputed_cutoffs():
+    """Return SQLAlchemy clauses for the specific filing and transition cutoffs kept in dissolution_eligibility.
+
+    A business without a row yet falls back to the subqueries below; CASE only evaluates them for that business.
+    """
+    not_refreshed = DissolutionEligibility.business_id.is_(None)
+    return (
+        case((not_refreshed, _has_specific_filing_overdue()), else_=DissolutionEligibility.ar_overdue_date),
+        case((not_refreshed, _has_no_transition_filed_after_restoration()),
+             else_=DissolutionEligibility.transition_overdue_date)
+    )
+
+
 def _has_specific_filing_overdue():
     """Return SQLAlchemy clause for specific filing overdue check.
 
     Check if the date of filed recognition(IA)/restoration/annual report
     of the business is over 26 months, whichever is latest.
+    The same clause fills dissolution_eligibility.ar_overdue_date.
     """
-
-    latest_date = func.greatest(
-            Business.founding_date,
-            db.session.query(func.max(Filing.effective_date)).filter(
-                    Filing.business_id == Business.id,
-                    Filing._filing_type.in_([  # pylint: disable=protected-access
-                        CoreFiling.FilingTypes.RESTORATION.value,
-                        CoreFiling.FilingTypes.RESTORATIONAPPLICATION.value
-                    ]),
-                    Filing._status == Filing.Status.COMPLETED.value  # pylint: disable=protected-access
-                ).scalar_subquery(),
-            Business.last_ar_date
-        )
-
-    latest_date_cutoff = latest_date + text("""INTERVAL '26 MONTHS'""")
-
-    return latest_date_cutoff
+    return DissolutionEligibility.ar_overdue_cutoff()
 
 
 def _has_no_transition_filed_after_restoration():
     """Return SQLAlchemy clause for no transition filed after restoration check.
 
     Check if the business needs to file Transition but does not file it within 12 months after restoration.
+    The same clause fills dissolution_eligibility.transition_overdue_date.
     """
-
-    new_act_date = func.date("2004-03-29 00:00:00+00:00")
-
-    restoration_filing = aliased(Filing)
-    transition_filing = aliased(Filing)
-
-    restoration_filing_effective_cutoff = restoration_filing.effective_date + text("""INTERVAL '1 YEAR'""")
-
-    return select(func.max(func.coalesce(restoration_filing_effective_cutoff, restoration_filing.effective_date))).where(
-            and_(
-                Business.legal_type != Business.LegalTypes.EXTRA_PRO_A.value,
-                Business.founding_date < new_act_date,
-                restoration_filing.business_id == Business.id,
-                restoration_filing._filing_type.in_([  # pylint: disable=protected-access
-                    CoreFiling.FilingTypes.RESTORATION.value,
-                    CoreFiling.FilingTypes.RESTORATIONAPPLICATION.value
-                ]),
-                restoration_filing._status == Filing.Status.COMPLETED.value,  # pylint: disable=protected-access
-                not_(
-                    exists().where(
-                        and_(
-                            transition_filing.business_id == Business.id,
-                            transition_filing._filing_type \
-                            == CoreFiling.FilingTypes.TRANSITION.value,  # pylint: disable=protected-access
-                            transition_filing._status == \
-                            Filing.Status.COMPLETED.value,  # pylint: disable=protected-access
-                            transition_filing.effective_date.between(
-                                restoration_filing.effective_date,
-                                restoration_filing_effective_cutoff
-                            )
-                        )
-                    )
-                )
-            )
-        ).scalar_subquery()
+    return DissolutionEligibility.transition_overdue_cutoff()
 
 
 def _has_future_effective_filing():
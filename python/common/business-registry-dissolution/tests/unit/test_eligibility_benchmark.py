@@ -0,0 +1,86 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the precomputed involuntary dissolution eligibility against the per business subqueries.
+
+Runs on a small synthetic dataset by default; set DISSOLUTION_BENCHMARK_SIZE=1000000 (and run with
+--log-cli-level=INFO) to compare the two on a production sized businesses table.
+"""
+import logging
+import os
+import time
+
+from sqlalchemy import text
+
+from business_model.models import DissolutionEligibility
+from dissolution_service import InvoluntaryDissolutionService
+
+BENCHMARK_SIZE = int(os.getenv("DISSOLUTION_BENCHMARK_SIZE", "2000"))
+
+logger = logging.getLogger(__name__)
+
+
+def _seed(session, size: int):
+    """Insert size active BC companies, a mix of AR overdue, pre 2004 and restored businesses."""
+    session.execute(text("""
+        INSERT INTO businesses (identifier, legal_name, legal_type, state, founding_date, last_ar_date,
+                                last_modified, in_liquidation, no_dissolution, admin_freeze)
+        SELECT 'BM' || LPAD(g::text, 7, '0'), 'BENCHMARK ' || g, 'BC', 'ACTIVE',
+               NOW() - MAKE_INTERVAL(years => 3 + g % 40),
+               CASE WHEN g % 3 = 0 THEN NULL ELSE NOW() - MAKE_INTERVAL(months => g % 48) END,
+               NOW(), FALSE, FALSE, FALSE
+          FROM GENERATE_SERIES(1, :size) g
+    """), {"size": size})
+    session.execute(text("""
+        INSERT INTO filings (business_id, filing_type, status, filing_date, effective_date)
+        SELECT b.id, f.filing_type, 'COMPLETED', f.effective_date, f.effective_date
+          FROM businesses b
+         CROSS JOIN LATERAL (
+               VALUES ('restoration', NOW() - MAKE_INTERVAL(months => b.id % 36)),
+                      ('transition', NOW() - MAKE_INTERVAL(months => b.id % 36 - 6))
+         ) AS f (filing_type, effective_date)
+         WHERE b.identifier LIKE 'BM%' AND b.id % 20 = 0 AND (f.filing_type = 'restoration' OR b.id % 40 = 0)
+    """))
+    session.execute(text("ANALYZE businesses"))
+    session.execute(text("ANALYZE filings"))
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def _eligible(precomputed: bool):
+    query = InvoluntaryDissolutionService._get_businesses_eligible_query(precomputed=precomputed)
+    return sorted((business.identifier, ar_overdue, transition_overdue)
+                  for business, ar_overdue, transition_overdue in query.all())
+
+
+def test_eligibility_benchmark(session):
+    """Assert the precomputed eligibility matches the subqueries, and report how long each takes."""
+    _seed(session, BENCHMARK_SIZE)
+
+    expected, subquery_time = _timed(lambda: _eligible(precomputed=False))
+    refreshed, refresh_time = _timed(DissolutionEligibility.refresh_stale)
+    result, precomputed_time = _timed(lambda: _eligible(precomputed=True))
+    unchanged, stale_time = _timed(DissolutionEligibility.refresh_stale)
+
+    assert refreshed >= BENCHMARK_SIZE
+    assert unchanged == 0
+    assert expected
+    assert result == expected
+    logger.info(f"{BENCHMARK_SIZE} businesses, {len(result)} eligible: "
+                f"subqueries {subquery_time:.2f}s, full refresh {refresh_time:.2f}s, "
+                f"precomputed {precomputed_time:.2f}s, daily catch up with no changes {stale_time:.2f}s")
@@ -23,7 +23,7 @@ from datedelta import datedelta
 from registry_schemas.example_data import FILING_HEADER, RESTORATION, TRANSITION_FILING_TEMPLATE
 
 from business_common.utils.datetime import datetime
-from business_model.models import Batch, Business
+from business_model.models import Batch, Business, DissolutionEligibility
 from dissolution_service import InvoluntaryDissolutionService
 from tests import (
     factory_batch,
@@ -369,3 +369,48 @@ def test_get_businesses_eligible_query_order(session, test_name, expected_order)
     assert result
     result_details = [(res[0].identifier, res[1], res[2]) for res in result]
     assert result_details == expected_order
+
+
+def test_get_businesses_eligible_query_precomputed(session):
+    """Assert the eligible businesses are read from the refreshed cutoffs, not recomputed from the filings."""
+    overdue = factory_business(identifier="BC1234567", entity_type=Business.LegalTypes.COMP.value,
+                               last_ar_date=datetime.utcnow() - datedelta(years=3))
+    overdue.last_modified = datetime.utcnow() - datedelta(days=2)
+    overdue.save()
+    current = factory_business(identifier="BC7654321", entity_type=Business.LegalTypes.COMP.value,
+                               last_ar_date=datetime.utcnow())
+    assert DissolutionEligibility.refresh([overdue.id, current.id]) == 2
+    eligibility = DissolutionEligibility.find_by_business_id(overdue.id)
+    assert eligibility.transition_overdue_date is None
+    assert eligibility.business_last_modified == overdue.last_modified
+
+    result = InvoluntaryDissolutionService._get_businesses_eligible_query().all()
+    assert [res[0] for res in result] == [overdue]
+
+    # an AR filed outside the filer, by a transaction that started before the refresh and committed after it,
+    # is not seen until the row is refreshed
+    overdue.last_ar_date = datetime.utcnow()
+    overdue.last_modified = datetime.utcnow() - datedelta(days=1)
+    overdue.save()
+    assert InvoluntaryDissolutionService._get_businesses_eligible_query().all()
+    assert not InvoluntaryDissolutionService._get_businesses_eligible_query(precomputed=False).all()
+
+    assert DissolutionEligibility.refresh_stale() == 1
+    assert not InvoluntaryDissolutionService._get_businesses_eligible_query().all()
+    assert DissolutionEligibility.refresh_stale() == 0
+
+
+def test_get_businesses_eligible_query_precomputed_transition(session):
+    """Assert the refreshed transition cutoff matches the one computed from the filings."""
+    business = factory_business(identifier="BC1234567", entity_type=Business.LegalTypes.COMP.value,
+                                last_ar_date=datetime.utcnow())
+    restoration_filing = factory_completed_filing(business, RESTORATION_FILING, filing_type="restoration")
+    restoration_filing.effective_date = datetime.utcnow() - datedelta(years=2)
+    restoration_filing.save()
+
+    expected = InvoluntaryDissolutionService._get_businesses_eligible_query(precomputed=False).all()
+    DissolutionEligibility.refresh([business.id])
+    result = InvoluntaryDissolutionService._get_businesses_eligible_query().all()
+    assert expected
+    assert [(res[0], res[1], res[2]) for res in result] == [(res[0], res[1], res[2]) for res in expected]
+    assert result[0][2] is True
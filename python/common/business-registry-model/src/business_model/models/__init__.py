@@ -37,6 +37,7 @@ from .dc_connection import DCConnection
 from .dc_credential import DCCredential
 from .dc_definition import DCDefinition
 from .dc_revocation_reason import DCRevocationReason
+from .dissolution_eligibility import DissolutionEligibility
 from .document import Document, DocumentType
 from .filing import Filing
 from .furnishing import Furnishing
@@ -83,6 +84,7 @@ __all__ = (
     'DCCredential',
     'DCDefinition',
     'DCRevocationReason',
+    'DissolutionEligibility',
     'Document',
     'DocumentType',
     'Filing',
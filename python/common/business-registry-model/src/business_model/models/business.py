@@ -626,7 +626,8 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
             relevant_filings: list[Filing] = Filing.get_filings_by_status(
                 self.id,
                 [Filing.Status.COMPLETED, Filing.Status.PENDING, Filing.Status.PAID],
-                dissolution_start_date
+                dissolution_start_date,
+                with_documents=False
             )
             return [
                 filing for filing in relevant_filings
@@ -640,8 +641,7 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
     @property
     def is_tombstone(self):
         """Return True if it's a tombstone business, otherwise False."""
-        tombstone_filing = Filing.get_filings_by_status(self.id, [Filing.Status.TOMBSTONE])
-        return bool(tombstone_filing)
+        return Filing.exists_filings_by_status(self.id, [Filing.Status.TOMBSTONE])
 
     def save(self):
         """Render a Business to the local cache."""
@@ -854,11 +854,52 @@ class Business(db.Model, Versioned):  # pylint: disable=too-many-instance-attrib
                       .all())
         return businesses
 
+    @classmethod
+    def get_existing_identifiers(cls, identifiers: list, chunk_size: int = 1000) -> list:
+        """Return the subset of the given identifiers that exist in lear."""
+        existing = []
+        for start in range(0, len(identifiers), chunk_size):
+            chunk = identifiers[start:start + chunk_size]
+            existing.extend(row.identifier for row in db.session.query(Business.identifier).
+                            filter(Business.identifier.in_(chunk)).all())
+        return existing
+
+    @classmethod
+    def update_tax_ids(cls, tax_ids: dict, chunk_size: int = 1000) -> dict:
+        """Set the tax_id of each business in tax_ids (identifier: tax_id) and commit once.
+
+        The businesses are fetched with one IN query per chunk and every change is flushed in the same
+        (versioned) transaction. Return the outcome for each identifier: updated, unchanged or not_found.
+        """
+        results = dict.fromkeys(tax_ids, 'not_found')
+        identifiers = list(tax_ids)
+        for start in range(0, len(identifiers), chunk_size):
+            chunk = identifiers[start:start + chunk_size]
+            for business in db.session.query(Business).filter(Business.identifier.in_(chunk)).all():
+                if business.tax_id == tax_ids[business.identifier]:
+                    results[business.identifier] = 'unchanged'
+                    continue
+                business.tax_id = tax_ids[business.identifier]
+                results[business.identifier] = 'updated'
+
+        db.session.commit()
+        return results
+
     @classmethod
     def get_expired_restoration(cls):
-        """Return business identifiers and legal types with an expired restoration_expiry_date."""
+        """Return business identifiers and legal types with an expired restoration_expiry_date.
+
+        Businesses with a put back off filing waiting on the filer are left out, so a rerun does not file another.
+        """
+        put_back_off_pending = exists().where(
+            Filing.business_id == Business.id,
+            Filing._filing_type == FilingTypes.PUTBACKOFF.value,  # pylint: disable=protected-access
+            Filing._status.in_([Filing.Status.PENDING.value,  # pylint: disable=protected-access
+                                Filing.Status.PAID.value])
+        )
         businesses = (db.session.query(Business.identifier, Business.legal_type)
                       .filter(Business.restoration_expiry_date <= datetime.utcnow())
+                      .filter(not_(put_back_off_pending))
                       .all())
         return businesses
 
@@ -41,6 +41,28 @@ class ColinEventId(db.Model):  # pylint: disable=too-few-public-methods
             id_list.append(obj.colin_event_id)
         return id_list
 
+    @staticmethod
+    def get_by_filing_ids(filing_ids: list) -> dict:
+        """Get the colin_event_ids linked to each of the given filing_ids, keyed by filing_id."""
+        id_lists = {}
+        if not filing_ids:
+            return id_lists
+        rows = db.session.query(ColinEventId.filing_id, ColinEventId.colin_event_id). \
+            filter(ColinEventId.filing_id.in_(filing_ids)).all()
+        for filing_id, colin_event_id in rows:
+            id_lists.setdefault(filing_id, []).append(colin_event_id)
+        return id_lists
+
+    @staticmethod
+    def get_existing_colin_ids(colin_ids: list, chunk_size: int = 1000) -> list:
+        """Return the subset of the given colin_ids that are already linked to a filing."""
+        existing = []
+        for start in range(0, len(colin_ids), chunk_size):
+            chunk = colin_ids[start:start + chunk_size]
+            existing.extend(row.colin_event_id for row in db.session.query(ColinEventId.colin_event_id).
+                            filter(ColinEventId.colin_event_id.in_(chunk)).all())
+        return existing
+
     @staticmethod
     def get_by_colin_id(colin_id):
         """Get the ColinEventId obj with the given colin id."""
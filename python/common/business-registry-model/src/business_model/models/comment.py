@@ -24,7 +24,6 @@ from business_model.exceptions import BusinessException
 from business_model.utils.base import BaseEnum, auto
 
 from .db import db
-from .user import User
 
 
 class Comment(db.Model):
@@ -62,7 +61,7 @@ class Comment(db.Model):
         from .types.constants import (
             REDACTED_STAFF_SUBMITTER,  # pylint: disable=import-outside-toplevel
         )
-        user = User.find_by_id(self.staff_id)
+        user = self.staff
         return {
             'comment': {
                 'id': self.id,
@@ -0,0 +1,172 @@
+# Copyright (c) 2026, Province of British Columbia
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""This module holds the precomputed involuntary dissolution cutoff dates of a business.
+
+The cutoffs only change when a filing completes for the business (or the business itself is updated),
+so they are kept in this table instead of being recomputed for every business on every eligibility query.
+"""
+from __future__ import annotations
+
+from sqlalchemy import and_, exists, func, not_, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+
+from .business import Business
+from .db import db
+from .filing import Filing
+from .types.filings import FilingTypes
+
+RESTORATION_TYPES = [FilingTypes.RESTORATION.value, FilingTypes.RESTORATIONAPPLICATION.value]
+
+
+class DissolutionEligibility(db.Model):
+    """This class manages the dissolution eligibility cutoffs of a business.
+
+    ar_overdue_date: when the business is overdue on its annual report (or recognition/restoration).
+    transition_overdue_date: when the business is overdue on the transition required after a restoration,
+        null if it does not need to file one.
+    business_last_modified: the last_modified of the business the cutoffs were computed from.
+    """
+
+    __tablename__ = 'dissolution_eligibility'
+    __table_args__ = (
+        # only businesses restored before the new act ever need a transition, so keep that index small
+        db.Index('ix_dissolution_eligibility_transition_overdue_date', 'transition_overdue_date',
+                 postgresql_where=text('transition_overdue_date IS NOT NULL')),
+    )
+
+    business_id = db.Column('business_id', db.Integer, db.ForeignKey('businesses.id'), primary_key=True)
+    ar_overdue_date = db.Column('ar_overdue_date', db.DateTime(timezone=True), index=True)
+    transition_overdue_date = db.Column('transition_overdue_date', db.DateTime(timezone=True))
+    business_last_modified = db.Column('business_last_modified', db.DateTime(timezone=True))
+
+    @classmethod
+    def find_by_business_id(cls, business_id: int) -> DissolutionEligibility | None:
+        """Return the dissolution eligibility of the business."""
+        return db.session.get(cls, business_id)
+
+    @staticmethod
+    def ar_overdue_cutoff():
+        """Return SQLAlchemy clause for the specific filing overdue cutoff of the business.
+
+        26 months after the date of filed recognition(IA)/restoration/annual report, whichever is latest.
+        """
+        latest_restoration_date = select(func.max(Filing.effective_date)).where(
+            Filing.business_id == Business.id,
+            Filing._filing_type.in_(RESTORATION_TYPES),  # pylint: disable=protected-access
+            Filing._status == Filing.Status.COMPLETED.value  # pylint: disable=protected-access
+        ).scalar_subquery()
+        latest_date = func.greatest(Business.founding_date, latest_restoration_date, Business.last_ar_date)
+        return latest_date + text("""INTERVAL '26 MONTHS'""")
+
+    @staticmethod
+    def transition_overdue_cutoff():
+        """Return SQLAlchemy clause for the transition overdue cutoff of the business.
+
+        12 months after a restoration of a business that needs to file a transition and has not filed one
+        within that time, null if there is none.
+        """
+        new_act_date = func.date('2004-03-29 00:00:00+00:00')
+
+        restoration_filing = aliased(Filing)
+        transition_filing = aliased(Filing)
+
+        restoration_filing_effective_cutoff = restoration_filing.effective_date + text("""INTERVAL '1 YEAR'""")
+
+        # pylint: disable=protected-access
+        return select(func.max(func.coalesce(restoration_filing_effective_cutoff,
+                                             restoration_filing.effective_date))).where(
+            Business.legal_type != Business.LegalTypes.EXTRA_PRO_A.value,
+            Business.founding_date < new_act_date,
+            restoration_filing.business_id == Business.id,
+            restoration_filing._filing_type.in_(RESTORATION_TYPES),
+            restoration_filing._status == Filing.Status.COMPLETED.value,
+            not_(
+                exists().where(
+                    and_(
+                        transition_filing.business_id == Business.id,
+                        transition_filing._filing_type == FilingTypes.TRANSITION.value,
+                        transition_filing._status == Filing.Status.COMPLETED.value,
+                        transition_filing.effective_date.between(
+                            restoration_filing.effective_date,
+                            restoration_filing_effective_cutoff
+                        )
+                    )
+                )
+            )
+        ).scalar_subquery()
+
+    @classmethod
+    def _business_cutoffs(cls):
+        """Return a select of the business ids with their cutoffs, in the column order of the table."""
+        return select(Business.id, cls.ar_overdue_cutoff(), cls.transition_overdue_cutoff(), Business.last_modified)
+
+    @classmethod
+    def _refresh(cls, business_cutoffs) -> int:
+        """Upsert the rows of the businesses selected by business_cutoffs."""
+        table = cls.__table__
+        statement = insert(table).from_select(
+            [table.c.business_id, table.c.ar_overdue_date, table.c.transition_overdue_date,
+             table.c.business_last_modified],
+            business_cutoffs
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.business_id],
+            set_={
+                'ar_overdue_date': statement.excluded.ar_overdue_date,
+                'transition_overdue_date': statement.excluded.transition_overdue_date,
+                'business_last_modified': statement.excluded.business_last_modified
+            }
+        )
+        # make pending filing and business changes visible to the insert ... select
+        db.session.flush()
+        return db.session.execute(statement).rowcount
+
+    @classmethod
+    def refresh(cls, business_ids: list[int]) -> int:
+        """Recompute the cutoffs of the given businesses in the current transaction.
+
+        Called when a filing completes so the row is committed together with the filing.
+        """
+        if not (business_ids := [business_id for business_id in business_ids if business_id]):
+            return 0
+        return cls._refresh(cls._business_cutoffs().where(Business.id.in_(business_ids)))
+
+    @classmethod
+    def refresh_stale(cls) -> int:
+        """Recompute the cutoffs of every business updated since its row was last refreshed (or without a row).
+
+        A set based catch up for changes that did not go through the filer, run before reading the eligible
+        businesses in bulk. A row is stale when the business last_modified differs from the one it was computed
+        from, which also catches changes committed after the refresh by transactions that started before it.
+        """
+        return cls._refresh(
+            cls._business_cutoffs().
+            outerjoin(cls, cls.business_id == Business.id).
+            where(or_(cls.business_id.is_(None),
+                      Business.last_modified.is_distinct_from(cls.business_last_modified)))
+        )
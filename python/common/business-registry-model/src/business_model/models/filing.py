@@ -20,7 +20,7 @@ from typing import Final
 from sqlalchemy import and_, desc, event, func, inspect, not_, or_, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import backref
+from sqlalchemy.orm import backref, deferred, joinedload, undefer_group
 
 from business_model.exceptions import BusinessException
 from business_model.models.colin_event_id import ColinEventId
@@ -30,6 +30,7 @@ from .comment import (
     Comment,
 )
 from .db import db
+from .user import User
 
 
 class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many-public-methods
@@ -742,6 +743,10 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
         'transparencyRegister': 'type'
     }
 
+    # the JSONB documents can be large for businesses with long histories, so they are deferred and
+    # only loaded (together, in a single statement) when a caller actually needs them
+    DOCUMENTS_GROUP: Final = 'documents'
+
     __tablename__ = 'filings'
     # this mapper is used so that new and old versions of the service can be run simultaneously,
     # making rolling upgrades easier
@@ -795,8 +800,8 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     _filing_date = db.Column('filing_date', db.DateTime(timezone=True), default=func.now())
     _filing_type = db.Column('filing_type', db.String(30))
     _filing_sub_type = db.Column('filing_sub_type', db.String(30))
-    _filing_json = db.Column('filing_json', JSONB)
-    _meta_data = db.Column('meta_data', JSONB)
+    _filing_json = deferred(db.Column('filing_json', JSONB), group=DOCUMENTS_GROUP)
+    _meta_data = deferred(db.Column('meta_data', JSONB), group=DOCUMENTS_GROUP)
     _payment_status_code = db.Column('payment_status_code', db.String(50))
     _payment_token = db.Column('payment_id', db.String(4096))
     _payment_completion_date = db.Column('payment_completion_date', db.DateTime(timezone=True))
@@ -808,7 +813,7 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     payment_account = db.Column('payment_account', db.String(30))
     effective_date = db.Column('effective_date', db.DateTime(timezone=True), default=func.now())
     submitter_roles = db.Column('submitter_roles', db.String(200))
-    tech_correction_json = db.Column('tech_correction_json', JSONB)
+    tech_correction_json = deferred(db.Column('tech_correction_json', JSONB), group=DOCUMENTS_GROUP)
     details = db.Column(db.String(2000))
     deletion_locked = db.Column('deletion_locked', db.Boolean, unique=False, default=False)
     approval_type = db.Column('approval_type', db.String(15))
@@ -1084,65 +1089,116 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @property
     def json(self):
         """Return a json representation of this object."""
+        return Filing.json_for_filings([self])[0]
+
+    @staticmethod
+    def json_for_filings(filings: list) -> list:
+        """Return the json representations of the filings.
+
+        The header extras (colin ids, comments, affected filings, parent and submitter) are batch loaded
+        for all of the filings, so serializing a list costs a constant number of statements.
+
+        The stored filing_json is never copied, only the wrapper dicts down to the header are,
+        so callers must copy any section they mutate outside of ['filing']['header'].
+        """
+        filing_ids = [filing.id for filing in filings]
+        if unloaded_ids := [filing.id for filing in filings
+                            if '_filing_json' in inspect(filing).unloaded and filing.id]:
+            # populates the deferred documents of the filings already in the session
+            db.session.query(Filing).options(Filing.with_documents()).filter(Filing.id.in_(unloaded_ids)).all()
+
+        colin_event_ids = ColinEventId.get_by_filing_ids(filing_ids)
+
+        comments = {}
+        if filing_ids:
+            for comment in db.session.query(Comment). \
+                    options(joinedload(Comment.staff)). \
+                    filter(Comment.filing_id.in_(filing_ids)). \
+                    order_by(Comment.id):
+                comments.setdefault(comment.filing_id, []).append(comment.json)
+
+        affected_filings = {}
+        if filing_ids:
+            for child_id, parent_id in db.session.query(Filing.id, Filing.parent_filing_id). \
+                    filter(Filing.parent_filing_id.in_(filing_ids)). \
+                    order_by(Filing.id):
+                affected_filings.setdefault(parent_id, []).append(child_id)
+
+        # load the many-to-one targets into the identity map, the relationships then resolve without a statement
+        related = []
+        if parent_ids := {filing.parent_filing_id for filing in filings if filing.parent_filing_id}:
+            related += db.session.query(Filing).filter(Filing.id.in_(parent_ids)).all()
+        if submitter_ids := {filing.submitter_id for filing in filings if filing.submitter_id}:
+            related += db.session.query(User).filter(User.id.in_(submitter_ids)).all()
+
+        return [filing._json(colin_event_ids.get(filing.id, []),  # pylint: disable=protected-access
+                             comments.get(filing.id, []),
+                             affected_filings.get(filing.id, []))
+                for filing in filings]
+
+    def _json(self, colin_event_ids: list, comments: list, affected_filings: list) -> dict:
+        """Return the filing_json with the header fields overlaid on a shallow copy of it."""
         if self.tech_correction_json:
             return self.tech_correction_json
 
         try:
-            json_submission = copy.deepcopy(self.filing_json)
-            json_submission['filing']['header']['date'] = self._filing_date.isoformat()
-            json_submission['filing']['header']['filingId'] = self.id
-            json_submission['filing']['header']['name'] = self.filing_type
-            json_submission['filing']['header']['status'] = self.status
-            json_submission['filing']['header']['availableOnPaperOnly'] = self.paper_only
-            json_submission['filing']['header']['inColinOnly'] = self.colin_only
-            json_submission['filing']['header']['deletionLocked'] = self.deletion_locked
+            header = {
+                'date': self._filing_date.isoformat(),
+                'filingId': self.id,
+                'name': self.filing_type,
+                'status': self.status,
+                'availableOnPaperOnly': self.paper_only,
+                'inColinOnly': self.colin_only,
+                'deletionLocked': self.deletion_locked
+            }
 
             if self.effective_date:  # pylint: disable=using-constant-test
-                json_submission['filing']['header']['effectiveDate'] = self.effective_date.isoformat()
+                header['effectiveDate'] = self.effective_date.isoformat()
             if self._payment_status_code:
-                json_submission['filing']['header']['paymentStatusCode'] = self.payment_status_code
+                header['paymentStatusCode'] = self.payment_status_code
             if self._payment_token:
-                json_submission['filing']['header']['paymentToken'] = self.payment_token
+                header['paymentToken'] = self.payment_token
             if self.submitter_id:
-                json_submission['filing']['header']['submitter'] = self.filing_submitter.username
+                header['submitter'] = self.filing_submitter.username
             if self.payment_account:
-                json_submission['filing']['header']['paymentAccount'] = self.payment_account
+                header['paymentAccount'] = self.payment_account
             if self._payment_completion_date:
-                json_submission['filing']['header']['paymentDate'] = self._payment_completion_date.isoformat()
-
-            # add colin_event_ids
-            json_submission['filing']['header']['colinIds'] = ColinEventId.get_by_filing_id(self.id)
+                header['paymentDate'] = self._payment_completion_date.isoformat()
 
-            # add comments
-            json_submission['filing']['header']['comments'] = [comment.json for comment in self.comments]
+            header['colinIds'] = colin_event_ids
+            header['comments'] = comments
+            header['affectedFilings'] = affected_filings
+            header['isCorrected'] = self.is_corrected
+            header['isCorrectionPending'] = self.is_correction_pending
 
-            # add affected filings list
-            json_submission['filing']['header']['affectedFilings'] = [filing.id for filing in self.children]
-
-            # add corrected flags
-            json_submission['filing']['header']['isCorrected'] = self.is_corrected
-            json_submission['filing']['header']['isCorrectionPending'] = self.is_correction_pending
-
-            return json_submission
+            filing = dict(self.filing_json['filing'])
+            filing['header'] = {**filing['header'], **header}
+            return {**self.filing_json, 'filing': filing}
         except Exception as err:
             raise KeyError from err
 
+    @staticmethod
+    def with_documents():
+        """Return the loader option that undefers the JSONB document columns."""
+        return undefer_group(Filing.DOCUMENTS_GROUP)
+
     @classmethod
     def find_by_id(cls, filing_id: str = None):
         """Return a Filing by the id."""
         filing = None
         if filing_id:
-            filing = cls.query.filter_by(id=filing_id).one_or_none()
+            filing = cls.query.options(Filing.with_documents()).filter_by(id=filing_id).one_or_none()
         return filing
 
     @staticmethod
     def get_temp_reg_filing(temp_reg_id: str, filing_id: str = None):
         """Return a filing by the temp id and filing id (if applicable)."""
         if not filing_id:
-            return db.session.query(Filing).filter(Filing.temp_reg == temp_reg_id).one_or_none()
+            return db.session.query(Filing).options(Filing.with_documents()). \
+                filter(Filing.temp_reg == temp_reg_id).one_or_none()
 
         return (
-            db.session.query(Filing).filter(
+            db.session.query(Filing).options(Filing.with_documents()).filter(
                 db.or_(
                     db.and_(
                         Filing.id == filing_id,
@@ -1161,7 +1217,7 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @staticmethod
     def get_temp_reg_filing_by_withdrawn_filing(filing_id: str, withdrawn_filing_id: str, filing_type: str = None):
         """Return an temp reg Filing by withdrawn filing."""
-        q = db.session.query(Filing). \
+        q = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.withdrawn_filing_id == withdrawn_filing_id). \
             filter(Filing.id == filing_id)
 
@@ -1174,29 +1230,54 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @staticmethod
     def get_filing_by_payment_token(token: str):
         """Return a Filing by it's payment token."""
-        filing = db.session.query(Filing). \
+        filing = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.payment_token == token). \
             one_or_none()
         return filing
 
     @staticmethod
-    def get_filings_by_status(business_id: int, status: list, after_date: date = None):
-        """Return the filings with statuses in the status array input."""
+    def _filings_by_status_query(business_id: int, status: list, after_date: date = None):
+        """Return the query for the filings with statuses in the status array input."""
         query = db.session.query(Filing). \
             filter(Filing.business_id == business_id). \
-            filter(Filing._status.in_(status)). \
-            order_by(Filing._filing_date.desc(), Filing.effective_date.desc())  # pylint: disable=no-member;
-        # member provided via SQLAlchemy
+            filter(Filing._status.in_(status))
 
         if after_date:
             query = query.filter(Filing._filing_date >= after_date)
 
+        return query
+
+    @staticmethod
+    def get_filings_by_status(business_id: int, status: list, after_date: date = None, with_documents: bool = True):
+        """Return the filings with statuses in the status array input.
+
+        with_documents=False leaves the JSONB documents deferred, for callers that only need the filing header columns.
+        """
+        query = Filing._filings_by_status_query(business_id, status, after_date). \
+            order_by(Filing._filing_date.desc(), Filing.effective_date.desc())  # pylint: disable=no-member;
+        # member provided via SQLAlchemy
+
+        if with_documents:
+            query = query.options(Filing.with_documents())
+
         return query.all()
 
+    @staticmethod
+    def exists_filings_by_status(business_id: int, status: list, after_date: date = None) -> bool:
+        """Return whether a filing with a status in the status array input exists."""
+        exists_stmt = Filing._filings_by_status_query(business_id, status, after_date).exists()
+        return db.session.query(exists_stmt).scalar()
+
+    @staticmethod
+    def count_filings_by_status(business_id: int, status: list, after_date: date = None) -> int:
+        """Return the number of filings with statuses in the status array input."""
+        return Filing._filings_by_status_query(business_id, status, after_date). \
+            with_entities(func.count(Filing.id)).scalar()
+
     @staticmethod
     def get_incomplete_filings_by_type(business_id: int, filing_type: str):
         """Return the incomplete filings of a particular type."""
-        filings = db.session.query(Filing). \
+        filings = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.business_id == business_id). \
             filter(Filing._filing_type == filing_type). \
             filter(not_(Filing._status.in_([Filing.Status.COMPLETED.value, Filing.Status.WITHDRAWN.value]))). \
@@ -1207,7 +1288,7 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @staticmethod
     def get_filings_by_types(business_id: int, filing_types):
         """Return the completed filings of a particular type."""
-        filings = db.session.query(Filing). \
+        filings = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.business_id == business_id). \
             filter(Filing._filing_type.in_(filing_types)). \
             filter(Filing._status == Filing.Status.COMPLETED.value). \
@@ -1221,7 +1302,7 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
 
         Records only exist in some legacy corps imported from COLIN.
         """
-        filings = db.session.query(Filing). \
+        filings = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.business_id == business_id). \
             filter(Filing._filing_type == 'conversion'). \
             filter(
@@ -1233,37 +1314,56 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
         return filings
 
     @staticmethod
-    def get_incomplete_filings_by_types(business_id: int, filing_types: list, excluded_statuses: list = None):
-        """Return the filings of particular types and statuses.
-
-        excluded_statuses is a list of filing statuses that will be excluded from the query for incomplete filings
-        """
+    def _incomplete_filings_by_types_query(business_id: int, filing_types: list, excluded_statuses: list = None):
+        """Return the query for the filings of particular types that are not completed or withdrawn."""
         excluded_statuses = [] if excluded_statuses is None else excluded_statuses
 
-        filings = db.session.query(Filing). \
+        return db.session.query(Filing). \
             filter(Filing.business_id == business_id). \
             filter(Filing._filing_type.in_(filing_types)). \
             filter(not_(Filing._status.in_([Filing.Status.COMPLETED.value, Filing.Status.WITHDRAWN.value]))). \
-            filter(not_(Filing._status.in_(excluded_statuses))). \
+            filter(not_(Filing._status.in_(excluded_statuses)))
+
+    @staticmethod
+    def get_incomplete_filings_by_types(business_id: int, filing_types: list, excluded_statuses: list = None):
+        """Return the filings of particular types and statuses.
+
+        excluded_statuses is a list of filing statuses that will be excluded from the query for incomplete filings.
+        The JSONB documents are deferred, they are loaded on first access.
+        """
+        filings = Filing._incomplete_filings_by_types_query(business_id, filing_types, excluded_statuses). \
             order_by(desc(Filing.effective_date)). \
             all()
         return filings
 
     @staticmethod
-    def get_filings_by_type_pairs(business_id: int, filing_type_pairs: list, status: list, return_unique_pairs=False):
-        """Return the filings of particular filing type/sub-type pairs as well as statuses.
+    def exists_incomplete_filings_by_types(business_id: int, filing_types: list,
+                                           excluded_statuses: list = None) -> bool:
+        """Return whether an incomplete filing of particular types exists."""
+        exists_stmt = Filing._incomplete_filings_by_types_query(business_id, filing_types, excluded_statuses).exists()
+        return db.session.query(exists_stmt).scalar()
 
-        If return_unique_pairs is True, only return one instance of each filing type/sub-type pair.
-        """
+    @staticmethod
+    def _filings_by_type_pairs_query(business_id: int, filing_type_pairs: list, status: list):
+        """Return the query for the filings of particular filing type/sub-type pairs as well as statuses."""
         filing_type_conditions = [and_(Filing._filing_type == filing_type,
                                        Filing._filing_sub_type == filing_sub_type).self_group()
                                   for filing_type, filing_sub_type in filing_type_pairs]
 
-        base_query = db.session.query(Filing). \
+        return db.session.query(Filing). \
             filter(Filing.business_id == business_id). \
             filter(Filing._status.in_(status)). \
             filter(or_(*filing_type_conditions))
 
+    @staticmethod
+    def get_filings_by_type_pairs(business_id: int, filing_type_pairs: list, status: list, return_unique_pairs=False):
+        """Return the filings of particular filing type/sub-type pairs as well as statuses.
+
+        If return_unique_pairs is True, only return one instance of each filing type/sub-type pair.
+        The JSONB documents are deferred, they are loaded on first access.
+        """
+        base_query = Filing._filings_by_type_pairs_query(business_id, filing_type_pairs, status)
+
         # pylint: disable=W0212; prevent infinite loop
         if return_unique_pairs:
             subquery = (
@@ -1288,14 +1388,33 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
         return filings
 
     @staticmethod
-    def get_most_recent_filing(business_id: str, filing_type: str = None, filing_sub_type: str = None):
+    def count_filings_by_type_pairs(business_id: int, filing_type_pairs: list, status: list,
+                                    distinct_pairs=False) -> int:
+        """Return the number of filings of particular filing type/sub-type pairs as well as statuses.
+
+        If distinct_pairs is True, return the number of distinct filing type/sub-type pairs found.
+        """
+        # pylint: disable=W0212; prevent infinite loop
+        query = Filing._filings_by_type_pairs_query(business_id, filing_type_pairs, status)
+        if distinct_pairs:
+            pairs = query.with_entities(Filing._filing_type, Filing._filing_sub_type).distinct().subquery()
+            return db.session.query(func.count()).select_from(pairs).scalar()
+
+        return query.with_entities(func.count(Filing.id)).scalar()
+
+    @staticmethod
+    def get_most_recent_filing(business_id: str, filing_type: str = None, filing_sub_type: str = None,
+                               with_documents: bool = True):
         """Return the most recent filing.
 
         filing_type is required, if filing_sub_type is provided, it will be used to filter the query.
+        with_documents=False leaves the JSONB documents deferred, for callers that only need the filing header columns.
         """
         query = db.session.query(Filing). \
             filter(Filing.business_id == business_id). \
             filter(Filing._status == Filing.Status.COMPLETED.value)
+        if with_documents:
+            query = query.options(Filing.with_documents())
         if filing_type:
             query = query.filter(Filing._filing_type == filing_type)
             if filing_sub_type:
@@ -1316,7 +1435,8 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
                                      expr.label('legal_filing_type').isnot(None)))
         max_filing = query.subquery()
 
-        filing = Filing.query.join(max_filing, Filing._filing_date == max_filing.c.last_filing_date). \
+        filing = Filing.query.options(Filing.with_documents()). \
+            join(max_filing, Filing._filing_date == max_filing.c.last_filing_date). \
             filter(Filing.business_id == business_id). \
             filter(Filing._status == Filing.Status.COMPLETED.value). \
             order_by(Filing.id.desc())
@@ -1324,8 +1444,12 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
         return filing.first()
 
     @staticmethod
-    def get_completed_filings_for_colin(limit=20, offset=0):
-        """Return the filings based on limit and offset."""
+    def get_completed_filings_for_colin(limit=20, offset=0, after_transaction_id: int = None):
+        """Return the filings based on limit and offset.
+
+        When after_transaction_id is provided the page starts after that transaction (keyset paging),
+        which stays stable while synced filings drop out of the result set.
+        """
         from .business import (
             Business,
         )
@@ -1342,7 +1466,7 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
             'transparencyRegister'
         ]
         excluded_businesses = [Business.LegalTypes.SOLE_PROP.value, Business.LegalTypes.PARTNERSHIP.value]
-        filings = db.session.query(Filing).join(Business). \
+        query = db.session.query(Filing).options(Filing.with_documents()).join(Business). \
             filter(
                 ~Business.legal_type.in_(excluded_businesses),
                 ~Filing._filing_type.in_(excluded_filings),
@@ -1352,7 +1476,12 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
                 Filing._status == Filing.Status.COMPLETED.value,
                 Filing._source == Filing.Source.LEAR.value,
                 Filing.effective_date != None
-            ).order_by(Filing.transaction_id).limit(limit).offset(offset).all()
+            ). \
+            options(joinedload(Filing.filing_submitter))
+        if after_transaction_id is not None:
+            query = query.filter(Filing.transaction_id > after_transaction_id)
+
+        filings = query.order_by(Filing.transaction_id).limit(limit).offset(offset).all()
 
         return filings
 
@@ -1368,14 +1497,14 @@ class Filing(db.Model):  # pylint: disable=too-many-instance-attributes,too-many
     @staticmethod
     def get_all_filings_by_status(status):
         """Return all filings based on status."""
-        filings = db.session.query(Filing). \
+        filings = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing._status == status).all()  # pylint: disable=singleton-comparison
         return filings
 
     @staticmethod
     def get_previous_completed_filing(filing):
         """Return the previous completed filing."""
-        query = db.session.query(Filing). \
+        query = db.session.query(Filing).options(Filing.with_documents()). \
             filter(Filing.business_id == filing.business_id). \
             filter(Filing._status.in_([Filing.Status.COMPLETED.value, Filing.Status.TOMBSTONE.value]))
 
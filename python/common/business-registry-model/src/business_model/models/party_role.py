@@ -19,6 +19,7 @@ from enum import Enum
 
 from sql_versioning import Versioned
 from sqlalchemy import Date, cast, or_
+from sqlalchemy.orm import joinedload
 
 from .db import db
 from .party import (
@@ -76,6 +77,12 @@ class PartyRole(db.Model, Versioned):
         db.session.add(self)
         db.session.commit()
 
+    @staticmethod
+    def with_party():
+        """Return the loader options that fetch the party and its addresses in the same statement."""
+        party = joinedload(PartyRole.party)
+        return party.joinedload(Party.delivery_address), party.joinedload(Party.mailing_address)
+
     @property
     def json(self) -> dict:
         """Return the party member as a json object."""
@@ -91,19 +98,42 @@ class PartyRole(db.Model, Versioned):
 
         return party
 
+    @staticmethod
+    def parties_json(party_roles: list) -> list:
+        """Return the parties of the party roles, each party once with the list of its roles.
+
+        Parties are returned in the order they are first seen in party_roles.
+        """
+        parties = {}
+        for party_role in party_roles:
+            role = {
+                'roleType': party_role.role.replace('_', ' ').title(),
+                'appointmentDate': datetime.date(party_role.appointment_date).isoformat(),
+                'cessationDate': datetime.date(party_role.cessation_date).isoformat()
+                if party_role.cessation_date else None
+            }
+            if party_role.party_class_type:
+                role['roleClass'] = party_role.party_class_type.name
+
+            if party_role.party_id not in parties:
+                parties[party_role.party_id] = {**party_role.party.json, 'roles': []}
+            parties[party_role.party_id]['roles'].append(role)
+
+        return list(parties.values())
+
     @classmethod
     def find_by_internal_id(cls, internal_id: int) -> PartyRole:
         """Return a party role by the internal id."""
         party_role = None
         if internal_id:
-            party_role = cls.query.filter_by(id=internal_id).one_or_none()
+            party_role = cls.query.options(*PartyRole.with_party()).filter_by(id=internal_id).one_or_none()
         return party_role
 
     @classmethod
     def find_party_by_name(cls, business_id: int, first_name: str,  # pylint: disable=too-many-arguments; one too many
                            last_name: str, middle_initial: str, org_name: str) -> Party:
         """Return a Party connected to the given business_id by the given name."""
-        party_roles = (db.session.query(PartyRole).
+        party_roles = (db.session.query(PartyRole).options(*PartyRole.with_party()).
                        filter(PartyRole.business_id == business_id).
                        filter(PartyRole.cessation_date.is_(None)).
                        all())
@@ -127,7 +157,7 @@ class PartyRole(db.Model, Versioned):
     @staticmethod
     def get_parties_by_role(business_id: int, role: str) -> list:
         """Return all people/oraganizations with the given role for this business (ceased + current)."""
-        members = db.session.query(PartyRole). \
+        members = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.role == role). \
             all()
@@ -136,7 +166,7 @@ class PartyRole(db.Model, Versioned):
     @classmethod
     def get_party_roles_by_class_type(cls, business_id: int, class_type: PartyClassType, end_date: datetime) -> list[PartyRole]:
         """Return a list of party roles by the class type."""
-        party_roles = db.session.query(PartyRole). \
+        party_roles = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.party_class_type == class_type). \
             filter(cast(PartyRole.appointment_date, Date) <= end_date). \
@@ -147,7 +177,7 @@ class PartyRole(db.Model, Versioned):
     @staticmethod
     def get_active_directors(business_id: int, end_date: datetime) -> list:
         """Return the active directors as of given date."""
-        directors = db.session.query(PartyRole). \
+        directors = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.role == PartyRole.RoleTypes.DIRECTOR.value). \
             filter(cast(PartyRole.appointment_date, Date) <= end_date). \
@@ -162,7 +192,7 @@ class PartyRole(db.Model, Versioned):
             PartyRole.RoleTypes.OFFICER.value
         ]
 
-        party_roles = db.session.query(PartyRole). \
+        party_roles = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.business_id == business_id)
 
         if end_date is not None:
@@ -181,7 +211,7 @@ class PartyRole(db.Model, Versioned):
     @staticmethod
     def get_party_roles_by_party_id(business_id: int, party_id: int) -> list:
         """Return the parties that match the filter conditions."""
-        party_roles = db.session.query(PartyRole). \
+        party_roles = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.business_id == business_id). \
             filter(PartyRole.party_id == party_id). \
             all()
@@ -190,7 +220,7 @@ class PartyRole(db.Model, Versioned):
     @staticmethod
     def get_party_roles_by_filing(filing_id: int, end_date: datetime, role: str = None) -> list:
         """Return the parties that match the filter conditions."""
-        party_roles = db.session.query(PartyRole). \
+        party_roles = db.session.query(PartyRole).options(*PartyRole.with_party()). \
             filter(PartyRole.filing_id == filing_id). \
             filter(cast(PartyRole.appointment_date, Date) <= end_date). \
             filter(or_(PartyRole.cessation_date.is_(None), cast(PartyRole.cessation_date, Date) > end_date))
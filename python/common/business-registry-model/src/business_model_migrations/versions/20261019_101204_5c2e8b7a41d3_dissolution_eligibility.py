@@ -0,0 +1,53 @@
+"""dissolution eligibility
+
+Revision ID: 5c2e8b7a41d3
+Revises: d7fc1a767d69
+Create Date: 2026-10-19 10:12:04.218734
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8b7a41d3'
+down_revision = 'd7fc1a767d69'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('dissolution_eligibility',
+    sa.Column('business_id', sa.Integer(), nullable=False),
+    sa.Column('ar_overdue_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('transition_overdue_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('business_last_modified', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ),
+    sa.PrimaryKeyConstraint('business_id')
+    )
+    op.create_index(op.f('ix_dissolution_eligibility_ar_overdue_date'), 'dissolution_eligibility',
+                    ['ar_overdue_date'], unique=False)
+    op.create_index('ix_dissolution_eligibility_transition_overdue_date', 'dissolution_eligibility',
+                    ['transition_overdue_date'], unique=False,
+                    postgresql_where=sa.text('transition_overdue_date IS NOT NULL'))
+
+    # partial indexes for the per business filing lookups of the eligibility query and its refresh
+    op.create_index('ix_filings_business_id_restoration_transition', 'filings', ['business_id', 'effective_date'],
+                    unique=False,
+                    postgresql_where=sa.text("status = 'COMPLETED' AND "
+                                             "filing_type IN ('restoration', 'restorationApplication', 'transition')"))
+    op.create_index('ix_filings_business_id_pending', 'filings', ['business_id'], unique=False,
+                    postgresql_where=sa.text("status IN ('PENDING', 'PAID')"))
+    op.create_index('ix_batch_processing_business_id_open', 'batch_processing', ['business_id'], unique=False,
+                    postgresql_where=sa.text("status NOT IN ('COMPLETED', 'WITHDRAWN')"))
+
+    # not backfilled here: the involuntary dissolution job fills the table on its next run (refresh_stale),
+    # until then businesses without a row are checked from their filings
+
+
+def downgrade():
+    op.drop_index('ix_batch_processing_business_id_open', table_name='batch_processing')
+    op.drop_index('ix_filings_business_id_pending', table_name='filings')
+    op.drop_index('ix_filings_business_id_restoration_transition', table_name='filings')
+    op.drop_index('ix_dissolution_eligibility_transition_overdue_date', table_name='dissolution_eligibility')
+    op.drop_index(op.f('ix_dissolution_eligibility_ar_overdue_date'), table_name='dissolution_eligibility')
+    op.drop_table('dissolution_eligibility')
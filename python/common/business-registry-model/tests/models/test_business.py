@@ -18,6 +18,7 @@ Test-Suite to ensure that the Business Model is working as expected.
 """
 import base64
 import copy
+import re
 import uuid
 from datetime import UTC, date, datetime
 
@@ -1054,3 +1055,73 @@ def test_next_lr_min_date(session, test_name, founding_date, in_liquidation_date
 
     assert business.next_lr_min_date == expected_lr_min_date
 
+
+def _business_statements(statements: list, statement_start: str) -> int:
+    """Return the business rows the statements starting with statement_start were executed for."""
+    rows = 0
+    for _conn, _cursor, statement, parameters, _context, executemany in statements:
+        # businesses, not businesses_version
+        if statement.lstrip().startswith(statement_start) and re.search(r'\bbusinesses\b', statement.split('WHERE')[0]):
+            rows += len(parameters) if executemany else 1
+    return rows
+
+
+def _update_tax_ids(tax_ids: dict, **kwargs) -> tuple[dict, list]:
+    """Return the results of Business.update_tax_ids and the statements it executed."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def record_statement(*args):
+        statements.append(args)
+
+    event.listen(db.engine, 'before_cursor_execute', record_statement)
+    try:
+        results = Business.update_tax_ids(tax_ids, **kwargs)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record_statement)
+    return results, statements
+
+
+def test_update_tax_ids(session):
+    """Assert that tax ids are set in one transaction with an outcome per identifier."""
+    factory_business_from_tests('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    unchanged = factory_business_from_tests('BC7654321', entity_type=Business.LegalTypes.COMP.value)
+    unchanged.tax_id = '123456789BC0001'
+    unchanged.save()
+    unchanged_last_modified = unchanged.last_modified
+
+    results, statements = _update_tax_ids({'BC1234567': '987654321BC0001',
+                                           'BC7654321': '123456789BC0001',
+                                           'BC0000000': '111111111BC0001'},
+                                          chunk_size=2)
+
+    assert results == {'BC1234567': 'updated', 'BC7654321': 'unchanged', 'BC0000000': 'not_found'}
+    # one lookup per chunk of two identifiers, and only the changed business is written
+    assert _business_statements(statements, 'SELECT') == 2
+    assert _business_statements(statements, 'UPDATE') == 1
+    assert Business.find_by_identifier('BC1234567').tax_id == '987654321BC0001'
+    assert Business.find_by_identifier('BC7654321').tax_id == '123456789BC0001'
+    assert Business.find_by_identifier('BC7654321').last_modified == unchanged_last_modified
+
+
+def test_update_tax_ids_throughput(session):
+    """Assert that the tax ids of 10k businesses are set with one lookup per 1000 identifiers."""
+    business_count = 10000
+    VersioningProxy.get_transaction_id(db.session())
+    db.session.add_all([Business(legal_name=f'legal_name-BC{index:07d}',
+                                 identifier=f'BC{index:07d}',
+                                 legal_type=Business.LegalTypes.COMP.value,
+                                 state=Business.State.ACTIVE,
+                                 founding_date=EPOCH_DATETIME)
+                        for index in range(business_count)])
+    db.session.commit()
+    db.session.expunge_all()
+
+    tax_ids = {f'BC{index:07d}': f'{index:09d}BC0001' for index in range(business_count)}
+    results, statements = _update_tax_ids(tax_ids)
+
+    assert set(results.values()) == {'updated'}
+    assert _business_statements(statements, 'SELECT') == business_count // 1000
+    assert _business_statements(statements, 'UPDATE') == business_count
+    assert Business.find_by_identifier('BC0009999').tax_id == '000009999BC0001'
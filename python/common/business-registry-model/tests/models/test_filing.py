@@ -45,6 +45,7 @@ from tests.conftest import not_raises
 from tests.models import (
     factory_business,
     factory_business_mailing_address,
+    factory_comment,
     factory_completed_filing,
     factory_filing,
     factory_user,
@@ -725,3 +726,180 @@ def test_submitter_info(session):
     filing.save()
 
     assert filing.id
+
+
+def test_filing_documents_are_deferred(session):
+    """Assert that the JSONB documents are only loaded when they are needed."""
+    from sqlalchemy import inspect
+
+    from business_model.models import db
+
+    b = factory_business('CP1234567')
+    filing = factory_completed_filing(b, ANNUAL_REPORT)
+    db.session.expunge_all()
+
+    rv = Filing.get_filings_by_status(b.id, [Filing.Status.COMPLETED.value], with_documents=False)
+    assert rv
+    assert {'_filing_json', '_meta_data', 'tech_correction_json'} <= inspect(rv[0]).unloaded
+    db.session.expunge_all()
+
+    rv = Filing.get_filings_by_status(b.id, [Filing.Status.COMPLETED.value])
+    assert not {'_filing_json', '_meta_data', 'tech_correction_json'} & inspect(rv[0]).unloaded
+    db.session.expunge_all()
+
+    # deferred documents are still available on access
+    rv = Filing.get_filings_by_type_pairs(b.id, [('annualReport', None)], [Filing.Status.COMPLETED.value])
+    assert rv[0].filing_json['filing']['annualReport'] == ANNUAL_REPORT['filing']['annualReport']
+    assert rv[0].id == filing.id
+
+
+def test_exists_and_count_filings_by_status(session):
+    """Assert that the existence and count variants match the hydrated query."""
+    b = factory_business('CP1234567')
+    assert not Filing.exists_filings_by_status(b.id, [Filing.Status.COMPLETED.value])
+    assert Filing.count_filings_by_status(b.id, [Filing.Status.COMPLETED.value]) == 0
+
+    for _ in range(3):
+        factory_completed_filing(b, ANNUAL_REPORT)
+    factory_filing(b, ANNUAL_REPORT)
+
+    assert Filing.exists_filings_by_status(b.id, [Filing.Status.COMPLETED.value])
+    assert Filing.count_filings_by_status(b.id, [Filing.Status.COMPLETED.value]) == 3
+    assert Filing.count_filings_by_status(b.id, [Filing.Status.COMPLETED.value, Filing.Status.DRAFT.value]) == 4
+    assert not Filing.exists_filings_by_status(b.id, [Filing.Status.TOMBSTONE.value])
+    assert not b.is_tombstone
+
+
+def test_exists_incomplete_filings_by_types(session):
+    """Assert that incomplete filings of particular types can be tested for existence."""
+    b = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    factory_completed_filing(b, ALTERATION_FILING_TEMPLATE)
+    assert not Filing.exists_incomplete_filings_by_types(b.id, ['alteration', 'correction'])
+
+    factory_filing(b, ALTERATION_FILING_TEMPLATE)
+    assert Filing.exists_incomplete_filings_by_types(b.id, ['alteration', 'correction'])
+    assert not Filing.exists_incomplete_filings_by_types(b.id, ['alteration', 'correction'],
+                                                         [Filing.Status.DRAFT.value])
+
+
+def test_count_filings_by_type_pairs(session):
+    """Assert that the filings of particular type/sub-type pairs can be counted."""
+    b = factory_business('BC1234567', entity_type=Business.LegalTypes.COMP.value)
+    for _ in range(2):
+        factory_completed_filing(b, ANNUAL_REPORT)
+    factory_completed_filing(b, ALTERATION_FILING_TEMPLATE)
+    pairs = [('annualReport', None), ('alteration', None), ('correction', None)]
+
+    assert Filing.count_filings_by_type_pairs(b.id, pairs, [Filing.Status.COMPLETED.value]) == 3
+    assert Filing.count_filings_by_type_pairs(b.id, pairs, [Filing.Status.COMPLETED.value], distinct_pairs=True) == 2
+    assert Filing.count_filings_by_type_pairs(b.id, pairs, [Filing.Status.COMPLETED.value], distinct_pairs=True) == \
+        len(Filing.get_filings_by_type_pairs(b.id, pairs, [Filing.Status.COMPLETED.value], True))
+
+
+def test_deferred_documents_reduce_memory(session):
+    """Benchmark the memory used to list the filings of a business with a long history."""
+    import tracemalloc
+
+    from business_model.models import db
+
+    b = factory_business('CP1234567')
+    for _ in range(50):
+        factory_completed_filing(b, ANNUAL_REPORT)
+
+    def measure(with_documents: bool) -> int:
+        db.session.expunge_all()
+        tracemalloc.start()
+        rv = Filing.get_filings_by_status(b.id, [Filing.Status.COMPLETED.value], with_documents=with_documents)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(rv) == 50
+        return peak
+
+    assert measure(with_documents=False) < measure(with_documents=True)
+
+
+def _legacy_filing_json(filing: Filing) -> dict:
+    """Return the filing json the way Filing.json built it before the header extras were batch loaded."""
+    from business_model.models.colin_event_id import ColinEventId
+
+    json_submission = copy.deepcopy(filing.filing_json)
+    header = json_submission['filing']['header']
+    header['date'] = filing.filing_date.isoformat()
+    header['filingId'] = filing.id
+    header['name'] = filing.filing_type
+    header['status'] = filing.status
+    header['availableOnPaperOnly'] = filing.paper_only
+    header['inColinOnly'] = filing.colin_only
+    header['deletionLocked'] = filing.deletion_locked
+    if filing.effective_date:
+        header['effectiveDate'] = filing.effective_date.isoformat()
+    if filing.payment_status_code:
+        header['paymentStatusCode'] = filing.payment_status_code
+    if filing.payment_token:
+        header['paymentToken'] = filing.payment_token
+    if filing.submitter_id:
+        header['submitter'] = filing.filing_submitter.username
+    if filing.payment_account:
+        header['paymentAccount'] = filing.payment_account
+    if filing.payment_completion_date:
+        header['paymentDate'] = filing.payment_completion_date.isoformat()
+    header['colinIds'] = ColinEventId.get_by_filing_id(filing.id)
+    header['comments'] = [comment.json for comment in filing.comments]
+    header['affectedFilings'] = [child.id for child in filing.children]
+    header['isCorrected'] = filing.is_corrected
+    header['isCorrectionPending'] = filing.is_correction_pending
+    return json_submission
+
+
+def _large_filing_json(party_count: int) -> dict:
+    """Return an annual report with a large directors list, standing in for a large amalgamation/correction."""
+    filing_json = copy.deepcopy(ANNUAL_REPORT)
+    director = filing_json['filing']['annualReport']['directors'][0]
+    filing_json['filing']['annualReport']['directors'] = [copy.deepcopy(director) for _ in range(party_count)]
+    return filing_json
+
+
+def test_filing_json_header_overlay(session):
+    """Assert that the header overlay output is identical to the deep copy output and shares the sections."""
+    user = factory_user('idir/staff-person')
+    b = factory_business('CP1234567')
+    filing = factory_completed_filing(b, _large_filing_json(100), colin_id=1234)
+    filing.submitter_id = user.id
+    filing.save()
+    factory_comment(b, filing, 'first', user)
+    factory_comment(b, filing, 'second', user)
+    correction = factory_completed_filing(b, CORRECTION_AR)
+    filing.parent_filing = correction
+    filing.save()
+
+    rv = filing.json
+
+    assert json.dumps(rv) == json.dumps(_legacy_filing_json(filing))
+    # the sections are shared with the stored document, only the header is copied
+    assert rv['filing']['annualReport'] is filing.filing_json['filing']['annualReport']
+    assert rv['filing']['header'] is not filing.filing_json['filing']['header']
+    assert 'colinIds' not in filing.filing_json['filing']['header']
+
+
+def test_filing_json_for_filings(session):
+    """Assert that a list of filings serializes the same as each filing on its own."""
+    b = factory_business('CP1234567')
+    filings = [factory_completed_filing(b, ANNUAL_REPORT, colin_id=1000 + i) for i in range(3)]
+
+    rv = Filing.json_for_filings(filings)
+
+    assert [json.dumps(f) for f in rv] == [json.dumps(_legacy_filing_json(f)) for f in filings]
+
+
+def test_filing_json_benchmark(session):
+    """Benchmark the header overlay serializer against deep copying a large filing."""
+    import timeit
+
+    b = factory_business('CP1234567')
+    filing = factory_completed_filing(b, _large_filing_json(2000))
+    extras = ([], [], [])
+
+    overlay = timeit.timeit(lambda: filing._json(*extras), number=20)
+    deep_copy = timeit.timeit(lambda: copy.deepcopy(filing.filing_json), number=20)
+
+    assert overlay < deep_copy
@@ -468,3 +468,47 @@ def test_get_party_roles_by_class_type(session, class_type, expected_roles):
 
     assert len(result) == len(expected_roles)
     assert found_roles == expected_roles
+
+
+def test_parties_json(session):
+    """Assert that parties_json builds each party once with all of its roles in a bounded number of statements."""
+    from sqlalchemy import event
+
+    from business_model.models import Address, db
+
+    business = factory_business('FM1234567')
+    party_count = 50
+    for i in range(party_count):
+        member = Party(first_name=f'First{i}', last_name='Last', party_type=Party.PartyTypes.PERSON.value)
+        member.delivery_address = Address(street='123 Main', city='Victoria', country='CA',
+                                          address_type=Address.DELIVERY)
+        member.mailing_address = Address(street='PO Box 1', city='Victoria', country='CA',
+                                         address_type=Address.MAILING)
+        member.save()
+        for role in [PartyRole.RoleTypes.PARTNER.value, PartyRole.RoleTypes.COMPLETING_PARTY.value]:
+            PartyRole(role=role,
+                      appointment_date=datetime.datetime(2017, 5, 17),
+                      party_id=member.id,
+                      business_id=business.id).save()
+    db.session.expunge_all()
+
+    statements = []
+
+    def count_statements(*args):  # pylint: disable=unused-argument
+        statements.append(args)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statements)
+    try:
+        party_roles = PartyRole.get_party_roles(business.id, datetime.date.today())
+        parties = PartyRole.parties_json(party_roles)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statements)
+
+    assert len(statements) == 1
+    assert len(parties) == party_count
+    for party in parties:
+        assert sorted(role['roleType'] for role in party['roles']) == ['Completing Party', 'Partner']
+        assert party['deliveryAddress']['streetAddress'] == '123 Main'
+        assert party['mailingAddress']['streetAddress'] == 'PO Box 1'
+        assert 'role' not in party
+        assert 'appointmentDate' not in party
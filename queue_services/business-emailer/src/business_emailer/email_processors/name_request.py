@@ -22,6 +22,7 @@ import requests
 from flask import current_app
 from jinja2 import Template
 
+from business_account import TokenError, TokenProvider
 from business_emailer.email_processors import substitute_template_parts
 from business_emailer.services.namex import NameXService
 
@@ -125,19 +126,14 @@ def _get_pdfs(nr_id: str, payment_token: str) -> list:
 
 
 def get_nr_bearer_token():
-    """Get a valid Bearer token for the Name Request Service."""
+    """Get a valid Bearer token for the Name Request Service, reusing it until shortly before it expires."""
     token_url = current_app.config.get("NAMEX_AUTH_SVC_URL")
     client_id = current_app.config.get("NAMEX_SERVICE_CLIENT_USERNAME")
     client_secret = current_app.config.get("NAMEX_SERVICE_CLIENT_SECRET")
 
-    data = "grant_type=client_credentials"
     # get service account token
-    res = requests.post(url=token_url,
-                        data=data,
-                        headers={"content-type": "application/x-www-form-urlencoded"},
-                        auth=(client_id, client_secret))
     try:
-        return res.json().get("access_token")
-    except Exception:
+        return TokenProvider.for_client(token_url, client_id, client_secret).get_token()
+    except TokenError:
         current_app.logger.error("Failed to get nr token")
         return None
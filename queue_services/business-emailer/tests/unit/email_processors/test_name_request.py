@@ -18,6 +18,7 @@ from unittest.mock import patch
 import pytest
 import requests_mock
 
+from business_account import TokenProvider
 from business_emailer.email_processors import name_request
 from business_emailer.services.namex import NameXService
 from tests import MockResponse
@@ -158,13 +159,25 @@ def test_get_pdfs_happy_path_encodes_receipt(app, namex_config):
 
 def test_get_nr_bearer_token_returns_access_token(app, namex_config):
     """Assert the access_token field is extracted from the auth response."""
+    TokenProvider.clear()
     with app.app_context(), requests_mock.Mocker() as m:
         m.post(namex_config["NAMEX_AUTH_SVC_URL"], json={"access_token": "abc"}, status_code=200)
         assert name_request.get_nr_bearer_token() == "abc"
 
 
+def test_get_nr_bearer_token_reused_until_expiry(app, namex_config):
+    """Assert one token grant serves every email until the token is about to expire."""
+    TokenProvider.clear()
+    with app.app_context(), requests_mock.Mocker() as m:
+        grant = m.post(namex_config["NAMEX_AUTH_SVC_URL"],
+                       json={"access_token": "abc", "expires_in": 300}, status_code=200)
+        assert [name_request.get_nr_bearer_token() for _ in range(3)] == ["abc"] * 3
+        assert grant.call_count == 1
+
+
 def test_get_nr_bearer_token_returns_none_on_bad_json(app, namex_config):
     """Assert None is returned when the auth response body is not valid JSON."""
+    TokenProvider.clear()
     with app.app_context(), requests_mock.Mocker() as m:
         m.post(namex_config["NAMEX_AUTH_SVC_URL"], text="not json", status_code=200)
         assert name_request.get_nr_bearer_token() is None
@@ -5,14 +5,12 @@ from typing import ClassVar
 import requests
 from flask import current_app
 
+from business_account import TokenError, TokenProvider
 from business_filer.common.services.flag_manager import Flags
 
 
 class AccountService:
-    """Wrapper to call Authentication Services.
-
-    @TODO Cache and refresh / retry token as needed to reduce calls.
-    """
+    """Wrapper to call Authentication Services."""
 
     BEARER: str = "Bearer "
     CONTENT_TYPE_JSON: ClassVar[dict[str, str]] = {"Content-Type": "application/json"}
@@ -24,23 +22,14 @@ class AccountService:
 
     @classmethod
     def get_bearer_token(cls):
-        """Get a valid Bearer token for the service to use."""
+        """Get a valid Bearer token for the service to use, cached until shortly before it expires."""
         token_url = current_app.config.get("ACCOUNT_SVC_AUTH_URL")
         client_id = current_app.config.get("ACCOUNT_SVC_CLIENT_ID")
         client_secret = current_app.config.get("ACCOUNT_SVC_CLIENT_SECRET")
 
-        data = "grant_type=client_credentials"
-
-        # get service account token
-        res = requests.post(url=token_url,
-                            data=data,
-                            headers={"content-type": "application/x-www-form-urlencoded"},
-                            auth=(client_id, client_secret),
-                            timeout=cls.timeout)
-
         try:
-            return res.json().get("access_token")
-        except Exception:
+            return TokenProvider.for_client(token_url, client_id, client_secret, cls.timeout).get_token()
+        except TokenError:
             return None
 
     @classmethod
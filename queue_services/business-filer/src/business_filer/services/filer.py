@@ -35,7 +35,7 @@
 """
 import json
 
-from business_model.models import Business, Filing, db
+from business_model.models import Business, DissolutionEligibility, Filing, db
 from business_model.models.db import VersioningProxy
 from flask import current_app
 
@@ -272,6 +272,10 @@ def process_filing(filing_message: FilingMessage): # noqa: PLR0915, PLR0912
         )
 
         db.session.add(filing_submission)
+        if business:
+            # keep the involuntary dissolution cutoffs in step with the filing, committed together
+            db.session.flush()
+            DissolutionEligibility.refresh([business.id])
         db.session.commit()
 
         if filing_submission.filing_type in [
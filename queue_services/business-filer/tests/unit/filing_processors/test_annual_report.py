@@ -40,7 +40,7 @@ from unittest.mock import patch
 
 from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
-from business_model.models import BatchProcessing, Business, Filing
+from business_model.models import BatchProcessing, Business, DissolutionEligibility, Filing
 from registry_schemas.example_data import ANNUAL_REPORT
 
 # from business_filer.filing_processors.filing_components import create_party, create_role
@@ -156,3 +156,28 @@ def test_process_ar_filing_no_agm(app, session):
     assert filing.status == Filing.Status.COMPLETED.value
     assert business.last_agm_date == agm_date
     assert datetime.datetime.date(business.last_ar_date) == ar_date
+
+
+def test_process_ar_filing_refreshes_dissolution_eligibility(app, session):
+    """Assert that completing an AR moves the involuntary dissolution cutoff of the business forward."""
+    payment_id = str(random.SystemRandom().getrandbits(0x58))
+    identifier = 'BC1234567'
+    business = create_business(identifier, 'BC')
+    business.founding_date = EPOCH_DATETIME
+    business.save()
+    business_id = business.id
+    ar_date = datetime.date(2020, 8, 5)
+    ar = copy.deepcopy(ANNUAL_REPORT)
+    ar['filing']['business']['identifier'] = identifier
+    ar['filing']['annualReport']['annualReportDate'] = ar_date.isoformat()
+
+    with freeze_time(datetime.date(2020, 9, 17)):
+        filing = create_filing(payment_id, ar, business.id)
+        process_filing(FilingMessage(id=filing.id, filing_identifier=filing.id))
+
+    business = Business.find_by_internal_id(business_id)
+    eligibility = DissolutionEligibility.find_by_business_id(business_id)
+    assert eligibility
+    assert eligibility.ar_overdue_date == business.last_ar_date + relativedelta(months=26)
+    assert eligibility.transition_overdue_date is None
+    assert eligibility.business_last_modified == business.last_modified